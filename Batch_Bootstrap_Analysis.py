@@ -1,21 +1,61 @@
-import xlwings as xw
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from scipy.optimize import fsolve
 import os
+import time
+import argparse
+import threading
+
+from krw_curve.bootstrap import instrument_accruals
+from krw_curve.dates import extend_jump_dates
+from krw_curve.daycount import scalar_year_fraction
+from krw_curve.schedule import schedule_cache_info
+from krw_curve.telemetry import RunTelemetry, optional_profile, write_jsonl
+from krw_curve.cache import CurveCache, market_curve_key, DEFAULT_CACHE_DIR
+from krw_curve.chart_cache import chart_fingerprint, write_html_if_changed
+from krw_curve.chart_layers import daily_step_arrays
+from krw_curve.fast_figure import FigureTemplate
+from krw_curve.pipeline import RenderStage, DEFAULT_RENDER_WORKERS
+from krw_curve.quotes import QuoteHistory
+
+try:
+    import xlwings as xw
+except ImportError:
+    print("xlwings 라이브러리가 설치되어 있지 않습니다. 'pip install xlwings'를 실행해 주세요.")
+    xw = None
 
 class BatchBootstrapper:
-    def __init__(self, file_path):
+    # 계산 로직이 바뀌면 올려서 이전 캐시 결과를 무효화
+    ENGINE_VERSION = "batch-fsolve-5"
+    # 차트 구성이 바뀌면 올려서 이전 HTML을 무효화
+    CHART_VERSION = "batch-chart-2"
+
+    def __init__(self, file_path, telemetry_path=None, profile_path=None, cache_dir=DEFAULT_CACHE_DIR,
+                 quotes_path=None, render_workers=DEFAULT_RENDER_WORKERS, render_charts=True):
         self.file_path = file_path
         self.wb = None
         self.app = None
         self.basis = "ACT/365"
         self.freq = 4
+        # 계측: 기준일별 JSON 한 줄 + 배치 요약 한 줄 (telemetry_path가 있을 때만 기록)
+        self.telemetry_path = telemetry_path
+        self.profile_path = profile_path
+        # cache_dir=None 이면 캐시 사용 안 함
+        self.cache = CurveCache(cache_dir) if cache_dir else None
+        # 배치 차트용 dict 템플릿 (첫 날짜에 생성, 렌더 worker 스레드가 공유)
+        self._chart_template = None
+        self._template_lock = threading.Lock()
+        # 차트 생성/쓰기는 별도 worker 스레드에서 (0 이면 계산과 같은 스레드에서 순차 실행)
+        self.render_workers = render_workers
+        self.render_charts = render_charts
+        # 기준일별 과거 호가 (long format CSV/Parquet 한 번만 로드, 없으면 엑셀 MarketTable 금리 그대로 사용)
+        self.quotes = QuoteHistory.load(quotes_path) if quotes_path else None
         
     def year_frac(self, start, end):
-        return (end - start).days / 365.0
+        # 워크북 DayCount Basis 사용 (VBA CalcYF 와 동일)
+        return scalar_year_fraction(start.toordinal(), end.toordinal(), self.basis)
 
     def get_df_internal(self, target_date, today, jump_dates, forward_rates):
         target_yf = self.year_frac(today, target_date)
@@ -28,7 +68,8 @@ class BatchBootstrapper:
                 return np.exp(log_df)
             log_df -= forward_rates[i] * (curr_yf - prev_yf)
             prev_yf = curr_yf
-        log_df -= forward_rates[-1] * (target_yf - prev_yf)
+        # 마지막 Jump Date 이후는 마지막 구간 forward 로 외삽 (VBA LogLinearDF_Date 와 동일)
+        log_df -= forward_rates[len(jump_dates) - 1] * (target_yf - prev_yf)
         return np.exp(log_df)
 
     def parse_tenor(self, tenor_str):
@@ -66,140 +107,289 @@ class BatchBootstrapper:
             # 기본: 일 단위
             return today + timedelta(days=num)
 
-    def npv_error(self, fwd_guess, step_idx, solved_fwds, market_data, today):
+    def cashflow_schedules(self, market_data, today):
+        """인스트루먼트별 (지급일 목록, 구간 year fraction 배열) - 기준일마다 한 번만 생성"""
+        schedules = []
+        for _, row in market_data.iterrows():
+            days, accruals = instrument_accruals(today, row['Inst. Tenor'], row['Type'], row['Mty Date'], self.freq,
+                                                 self.basis)
+            schedules.append(([today + timedelta(days=int(d)) for d in days], accruals))
+        return schedules
+
+    def npv_error(self, fwd_guess, step_idx, solved_fwds, market_data, today, schedules):
         row = market_data.iloc[step_idx]
         current_fwds = solved_fwds.copy()
-        current_fwds[step_idx] = float(fwd_guess) if hasattr(fwd_guess, '__iter__') else fwd_guess
+        current_fwds[step_idx] = float(fwd_guess[0]) if hasattr(fwd_guess, '__iter__') else fwd_guess
         jump_dates = market_data['Jump Date'].iloc[:step_idx+1].tolist()
         
-        mkt_rate, mty_date = row['Market Rate'], row['Mty Date']
+        mkt_rate = row['Market Rate']
+        cf_dates, yfs = schedules[step_idx]
         if str(row['Type']).lower() == "deposit":
-            df = self.get_df_internal(mty_date, today, jump_dates, current_fwds)
-            return (1 + mkt_rate * self.year_frac(today, mty_date)) * df - 1.0
+            df = self.get_df_internal(cf_dates[-1], today, jump_dates, current_fwds)
+            return (1 + mkt_rate * yfs[-1]) * df - 1.0
         else:
-            tenor_yf = self.parse_tenor(row['Inst. Tenor'])
-            num_coupons = int(round(tenor_yf * self.freq))
             fixed_pv = 0.0
-            p_date = today
-            for j in range(1, num_coupons + 1):
-                c_date = mty_date if j == num_coupons else today + timedelta(days=int(j * (365/self.freq)))
-                yf = self.year_frac(p_date, c_date)
+            for c_date, yf in zip(cf_dates, yfs):
                 fixed_pv += mkt_rate * yf * self.get_df_internal(c_date, today, jump_dates, current_fwds)
-                p_date = c_date
-            return fixed_pv - (1.0 - self.get_df_internal(mty_date, today, jump_dates, current_fwds))
+            return fixed_pv - (1.0 - self.get_df_internal(cf_dates[-1], today, jump_dates, current_fwds))
+
+    def prepare_market_data(self, market_data, jump_dates_list, today):
+        """Today + Tenor로 Mty Date, JumpDates 중 Mty Date 이상 최소값으로 Jump Date 계산"""
+        # Python에서 Today + Tenor로 Mty Date 재계산
+        market_data['Mty Date'] = market_data['Inst. Tenor'].apply(
+            lambda t: self.calc_mty_date(today, t))
+        
+        # 영업일 조정된 마지막 지급일이 Jump Date 를 넘으면 그 Jump Date 를 지급일로 옮김 (커브와 구간 일치)
+        pay_dates = [cf_dates[-1] for cf_dates, _ in self.cashflow_schedules(market_data, today)]
+        jump_dates = extend_jump_dates(jump_dates_list, market_data['Mty Date'], pay_dates)
+
+        # Jump Date = JumpDates 중 Mty Date 이상인 날짜 중 최소값
+        def find_jump_date(mty_date):
+            for jd in jump_dates:
+                if jd >= mty_date:
+                    return jd
+            return jump_dates[-1]  # 없으면 마지막 날짜
+        
+        market_data['Jump Date'] = market_data['Mty Date'].apply(find_jump_date)
+        return market_data
+
+    def bootstrap_date(self, market_data, today, telemetry=None):
+        """한 기준일의 구간별 Forward를 순차적으로 구함 (엑셀 불필요)"""
+        n = len(market_data)
+        solved_fwds = np.zeros(n)
+        schedules = self.cashflow_schedules(market_data, today)
+        for i in range(n):
+            x0 = float(market_data.iloc[i]['Market Rate'])
+            result = fsolve(self.npv_error, x0, 
+                           args=(i, solved_fwds, market_data, today, schedules), 
+                           full_output=True)
+            solved_fwds[i] = result[0][0]
+            if telemetry is not None:
+                # fsolve는 반복 횟수를 제공하지 않으므로 함수 평가 횟수(nfev)만 기록
+                infodict, ier = result[1], result[2]
+                telemetry.record_solve(i, market_data.iloc[i]['Inst. Tenor'], None, infodict['nfev'],
+                                       np.ravel(infodict['fvec'])[0], ier == 1, solved_fwds[i])
+        return solved_fwds
+
+    def cached_bootstrap(self, market_data, jump_dates_list, today, telemetry=None):
+        """입력 해시로 캐시를 조회하고, 없으면 bootstrap_date 실행 후 저장"""
+        if self.cache is None:
+            return self.bootstrap_date(market_data, today, telemetry)
+        # Today 셀 외의 Common 설정은 배치 중 바뀌지 않으므로 self.basis / self.freq 사용
+        key = market_curve_key(today, self.basis, self.freq, market_data, jump_dates_list, self.ENGINE_VERSION)
+        cached = self.cache.get(key)
+        if telemetry is not None:
+            telemetry.context['cache_hit'] = cached is not None
+        if cached is not None:
+            return np.array(cached['solved_fwds'])
+        solved_fwds = self.bootstrap_date(market_data, today, telemetry)
+        self.cache.put(key, {'solved_fwds': solved_fwds.tolist()})
+        return solved_fwds
+
+    def chart_traces(self, market_data, solved_fwds, today):
+        """날짜별로 바뀌는 차트 데이터 (트레이스 index -> 속성)"""
+        step_x, step_y, step_text = daily_step_arrays(today, market_data['Jump Date'], solved_fwds)
+        return {
+            0: dict(x=market_data['Mty Date'].to_numpy(dtype='datetime64[D]'),
+                    y=market_data['Market Rate'].to_numpy(dtype=float),
+                    text=[f"{r:.2%}" for r in market_data['Market Rate']]),
+            1: dict(x=step_x, y=step_y, customdata=step_text),
+        }
+
+    def chart_title(self, today):
+        return f"IRS Forward Curve - {today.strftime('%Y-%m-%d')}"
+
+    def build_chart(self, market_data, solved_fwds, today):
+        """Market Rate 및 Forward Curve 차트(Figure) 생성"""
+        traces = self.chart_traces(market_data, solved_fwds, today)
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            **traces[0],
+            mode='markers+text', name='Market Rate',
+            textposition="top center",
+            marker=dict(size=8, color='gray')
+        ))
+        
+        fig.add_trace(go.Scatter(
+            **traces[1],
+            mode='lines', name='Forward Curve',
+            line=dict(color='red', width=3),
+            hovertemplate="Rate: %{y:.4%}<br>Period: %{customdata}<extra></extra>"
+        ))
+        
+        fig.update_layout(
+            title=self.chart_title(today),
+            xaxis=dict(title="Date", type='date', tickformat='%Y-%m-%d'),
+            yaxis=dict(title="Rate (%)", tickformat=".2%"),
+            template="plotly_white", width=1200, height=700
+        )
+        return fig
+
+    def build_chart_fast(self, market_data, solved_fwds, today):
+        """첫 날짜만 build_chart 로 검증된 Figure 를 만들어 템플릿으로 두고, 이후에는 데이터 배열만 교체"""
+        with self._template_lock:
+            if self._chart_template is None:
+                self._chart_template = FigureTemplate.from_figure(self.build_chart(market_data, solved_fwds, today))
+        title = {**self._chart_template.layout['title'], 'text': self.chart_title(today)}
+        return self._chart_template.render(self.chart_traces(market_data, solved_fwds, today), {'title': title})
+
+    def render_chart(self, output_file, chart_fp, market_data, solved_fwds, today):
+        """출력 단계 작업 (커브가 바뀌지 않았으면 기존 HTML 재사용). (새로 썼는지, 소요 초) 반환"""
+        start = time.perf_counter()
+        written = write_html_if_changed(output_file, chart_fp,
+                                        lambda: self.build_chart_fast(market_data, solved_fwds, today),
+                                        include_plotlyjs=True)
+        print(f"  -> OK: {output_file}" + ("" if written else " (차트 변경 없음)"))
+        return written, time.perf_counter() - start
 
     def run_batch(self, start_date, end_date):
+        with optional_profile(self.profile_path):
+            self._run_batch(start_date, end_date)
+
+    def _run_batch(self, start_date, end_date):
         output_dir = "Batch_Results"
         os.makedirs(output_dir, exist_ok=True)
+        batch_start = time.perf_counter()
+        phase_totals = {}
+        n_dates, errors = 0, []
         
         print(f"배치 작업 시작: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
         
         self.app = xw.apps.active if xw.apps.count > 0 else xw.App(visible=True, add_book=False)
         self.wb = self.app.books.open(self.file_path)
         ws_main = self.wb.sheets["Main"]
-        
+
+        # Common 설정 (DayCount Basis / IRS Coupon Freq) 은 배치 중 바뀌지 않으므로 한 번만 로드
+        tbl_common = ws_main.api.ListObjects("Common")
+        df_common = ws_main.range(tbl_common.Range.Address).options(pd.DataFrame, index=False, header=True).value
+        df_common.columns = [str(c).strip() for c in df_common.columns]
+        self.basis = str(df_common['DayCount Basis'].iloc[0]).upper()
+        self.freq = int(df_common['IRS Coupon Freq'].iloc[0])
+
+        # 계산 + 엑셀 쓰기(xlwings, 이 스레드)와 차트 렌더링(worker)을 bounded queue 로 분리
+        stage = None
+        if self.render_workers > 0 or not self.render_charts:
+            stage = RenderStage(self.render_workers, enabled=self.render_charts)
+
         current_date = start_date
         while current_date <= end_date:
+            # 주말은 시장 데이터가 없으므로 건너뜀 (휴일 / 중단 후 재개는 python -m krw_curve backfill 사용)
+            if current_date.weekday() >= 5:
+                current_date += timedelta(days=1)
+                continue
             date_str = current_date.strftime('%Y-%m-%d')
+            if self.quotes is not None and current_date not in self.quotes:
+                print(f"\n[{date_str}] 과거 호가 없음, 건너뜀")
+                current_date += timedelta(days=1)
+                continue
             print(f"\n[{date_str}] 처리 중...")
+            telemetry = RunTelemetry("batch_date", self.telemetry_path,
+                                     track_memory=self.telemetry_path is not None, date=date_str)
             
             try:
                 # 1. Today 날짜 업데이트
-                tbl_common = ws_main.api.ListObjects("Common")
-                ws_main.range(tbl_common.DataBodyRange.Cells(1, 1).Address).value = current_date
-                self.app.calculate()
+                with telemetry.phase("excel_recalc"):
+                    tbl_common = ws_main.api.ListObjects("Common")
+                    ws_main.range(tbl_common.DataBodyRange.Cells(1, 1).Address).value = current_date
+                    self.app.calculate()
                 
                 # 2. 시장 데이터 및 JumpDates 테이블 로드
-                tbl_market = ws_main.api.ListObjects("MarketTable")
-                market_data = ws_main.range(tbl_market.Range.Address).options(pd.DataFrame, index=False, header=True).value
-                market_data.columns = [str(c).strip() for c in market_data.columns]
+                with telemetry.phase("excel_read"):
+                    tbl_market = ws_main.api.ListObjects("MarketTable")
+                    market_data = ws_main.range(tbl_market.Range.Address).options(pd.DataFrame, index=False, header=True).value
+                    market_data.columns = [str(c).strip() for c in market_data.columns]
+                    if self.quotes is not None:
+                        # 그날의 호가를 테너 순서대로 slice 해서 MarketTable 금리를 교체
+                        rates = self.quotes.rates_for(current_date, market_data['Inst. Tenor'])
+                        market_data['Market Rate'] = rates
+                        ws_main.range(tbl_market.ListColumns("Market Rate").DataBodyRange.Address).value = rates.reshape(-1, 1)
+                    
+                    tbl_jumpdates = ws_main.api.ListObjects("JumpDates")
+                    jump_dates_df = ws_main.range(tbl_jumpdates.Range.Address).options(pd.DataFrame, index=False, header=True).value
+                    jump_dates_df.columns = [str(c).strip() for c in jump_dates_df.columns]
+                    jump_dates_list = sorted(pd.to_datetime(jump_dates_df['Jump Date']).tolist())
                 
-                tbl_jumpdates = ws_main.api.ListObjects("JumpDates")
-                jump_dates_df = ws_main.range(tbl_jumpdates.Range.Address).options(pd.DataFrame, index=False, header=True).value
-                jump_dates_df.columns = [str(c).strip() for c in jump_dates_df.columns]
-                jump_dates_list = sorted(pd.to_datetime(jump_dates_df['Jump Date']).tolist())
+                with telemetry.phase("prepare"):
+                    market_data = self.prepare_market_data(market_data, jump_dates_list, current_date)
                 
-                # Python에서 Today + Tenor로 Mty Date 재계산
-                market_data['Mty Date'] = market_data['Inst. Tenor'].apply(
-                    lambda t: self.calc_mty_date(current_date, t))
-                
-                # Jump Date = JumpDates 중 Mty Date 이상인 날짜 중 최소값
-                def find_jump_date(mty_date):
-                    for jd in jump_dates_list:
-                        if jd >= mty_date:
-                            return jd
-                    return jump_dates_list[-1]  # 없으면 마지막 날짜
-                
-                market_data['Jump Date'] = market_data['Mty Date'].apply(find_jump_date)
-                
-                # 3. Python 부트스트랩 실행
-                n = len(market_data)
-                solved_fwds = np.zeros(n)
-                for i in range(n):
-                    x0 = float(market_data.iloc[i]['Market Rate'])
-                    result = fsolve(self.npv_error, x0, 
-                                   args=(i, solved_fwds, market_data, current_date), 
-                                   full_output=True)
-                    solved_fwds[i] = result[0][0]
+                # 3. Python 부트스트랩 실행 (동일 입력이면 캐시에서 읽기)
+                with telemetry.phase("solve"):
+                    solved_fwds = self.cached_bootstrap(market_data, jump_dates_list, current_date, telemetry)
                 
                 # 4. 엑셀에 결과 저장 (Mty Date, Jump Date, Solved Forward)
-                ws_main.range(tbl_market.ListColumns("Mty Date").DataBodyRange.Address).value = [[d] for d in market_data['Mty Date']]
-                ws_main.range(tbl_market.ListColumns("Jump Date").DataBodyRange.Address).value = [[d] for d in market_data['Jump Date']]
-                ws_main.range(tbl_market.ListColumns("Solved Forward").DataBodyRange.Address).value = solved_fwds.reshape(-1, 1)
-                self.app.calculate()
-                
-                # 5. 차트 생성
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=market_data['Mty Date'], y=market_data['Market Rate'],
-                    mode='markers+text', name='Market Rate',
-                    text=[f"{r:.2%}" for r in market_data['Market Rate']],
-                    textposition="top center",
-                    marker=dict(size=8, color='gray')
-                ))
-                
-                step_x, step_y, step_text = [], [], []
-                p_date = current_date
-                for idx, row in market_data.iterrows():
-                    c_date = row['Jump Date']
-                    f_rate = solved_fwds[idx]
-                    num_days = (c_date - p_date).days
-                    period_str = f"{p_date.strftime('%Y-%m-%d')} ~ {c_date.strftime('%Y-%m-%d')}"
-                    for d in range(num_days + 1):
-                        step_x.append(p_date + timedelta(days=d))
-                        step_y.append(f_rate)
-                        step_text.append(period_str)
-                    step_x.append(None); step_y.append(None); step_text.append(None)
-                    p_date = c_date
-                
-                fig.add_trace(go.Scatter(
-                    x=step_x, y=step_y,
-                    mode='lines', name='Forward Curve',
-                    line=dict(color='red', width=3),
-                    customdata=step_text,
-                    hovertemplate="Rate: %{y:.4%}<br>Period: %{customdata}<extra></extra>"
-                ))
-                
-                fig.update_layout(
-                    title=f"IRS Forward Curve - {date_str}",
-                    xaxis=dict(title="Date", type='date', tickformat='%Y-%m-%d'),
-                    yaxis=dict(title="Rate (%)", tickformat=".2%"),
-                    template="plotly_white", width=1200, height=700
-                )
+                with telemetry.phase("excel_write"):
+                    ws_main.range(tbl_market.ListColumns("Mty Date").DataBodyRange.Address).value = [[d] for d in market_data['Mty Date']]
+                    ws_main.range(tbl_market.ListColumns("Jump Date").DataBodyRange.Address).value = [[d] for d in market_data['Jump Date']]
+                    ws_main.range(tbl_market.ListColumns("Solved Forward").DataBodyRange.Address).value = solved_fwds.reshape(-1, 1)
+                    self.app.calculate()
                 
+                # 5. 차트 생성 (worker 에서 실행, queue 가 차 있으면 대기한 시간만 chart_queue 로 기록)
                 output_file = os.path.join(output_dir, f"Bootstrap_{date_str}.html")
-                fig.write_html(output_file)
-                print(f"  -> OK: {output_file}")
+                chart_fp = chart_fingerprint(self.CHART_VERSION, date_str,
+                                             market_data[['Mty Date', 'Market Rate', 'Jump Date']], solved_fwds)
+                if stage is None:
+                    with telemetry.phase("chart_write"):
+                        written, _ = self.render_chart(output_file, chart_fp, market_data, solved_fwds, current_date)
+                    telemetry.context['chart_reused'] = not written
+                else:
+                    with telemetry.phase("chart_queue"):
+                        stage.submit(self.render_chart, output_file, chart_fp, market_data, solved_fwds,
+                                     current_date, label=date_str)
                 
             except Exception as e:
                 print(f"  -> ERROR: {e}")
+                telemetry.fail(e)
+                errors.append(date_str)
             
+            record = telemetry.finish()
+            for name, sec in record['phases_s'].items():
+                phase_totals[name] = phase_totals.get(name, 0.0) + sec
+            n_dates += 1
             current_date += timedelta(days=1)
-        
+
+        render = {}
+        if stage is not None:
+            stage.close()
+            for date_str, error in sorted(stage.errors.items()):
+                print(f"[{date_str}] 차트 ERROR: {error}")
+                errors.append(date_str)
+            # worker 에서 쓴 차트 시간은 배치 요약에만 합산 (날짜별 레코드는 이미 기록됨)
+            phase_totals['chart_write'] = sum(sec for _, sec in stage.results.values())
+            render = {**stage.stats, 'charts_reused': sum(not w for w, _ in stage.results.values())}
+
         self.wb.save()
+        if self.telemetry_path:
+            write_jsonl(self.telemetry_path, {
+                'run_type': 'batch_summary',
+                'file': self.file_path,
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': end_date.strftime('%Y-%m-%d'),
+                'n_dates': n_dates,
+                'failed_dates': errors,
+                'wall_s': time.perf_counter() - batch_start,
+                'phases_s': phase_totals,
+                'render': render,
+                'schedule_cache': schedule_cache_info(),
+            })
         print(f"\n모든 작업 완료! 결과: '{output_dir}' 폴더")
 
 if __name__ == "__main__":
-    runner = BatchBootstrapper("IRS_Bootstrap_DateBased.xlsm")
-    runner.run_batch(datetime(2026, 1, 14), datetime(2026, 1, 25))
+    parser = argparse.ArgumentParser(description="Batch IRS bootstrap")
+    parser.add_argument("--file", default="IRS_Bootstrap_DateBased.xlsm")
+    parser.add_argument("--start", default="2026-01-14", help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", default="2026-01-25", help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--telemetry", default=None, help="계측 JSON Lines 출력 경로 (예: batch_telemetry.jsonl)")
+    parser.add_argument("--profile", default=None, help="cProfile 덤프 경로 (예: batch.prof)")
+    parser.add_argument("--no-cache", action="store_true", help="부트스트랩 결과 캐시 사용 안 함")
+    parser.add_argument("--render-workers", type=int, default=DEFAULT_RENDER_WORKERS,
+                        help="차트 생성/쓰기 worker 스레드 수 (0: 계산과 순차 실행)")
+    parser.add_argument("--no-chart", action="store_true", help="HTML 차트 생성 생략")
+    parser.add_argument("--quotes", default=None,
+                        help="기준일별 과거 호가 CSV/Parquet (Date, Inst. Tenor, Type, Market Rate)")
+    args = parser.parse_args()
+
+    runner = BatchBootstrapper(args.file, telemetry_path=args.telemetry, profile_path=args.profile,
+                               cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR, quotes_path=args.quotes,
+                               render_workers=args.render_workers, render_charts=not args.no_chart)
+    runner.run_batch(datetime.strptime(args.start, '%Y-%m-%d'), datetime.strptime(args.end, '%Y-%m-%d'))
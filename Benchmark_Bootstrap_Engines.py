@@ -0,0 +1,414 @@
+"""
+Bootstrap Engine Benchmark
+
+레포 안의 부트스트래퍼들을 동일한 합성(synthetic) 커브로 돌려서
+Solve / DF 평가 / 리포트(차트) 생성 시간과 메모리 피크를 측정합니다.
+
+대상 엔진:
+    hybrid_reporter   - Python_Pure_Bootstrapper.HybridReporter (scipy newton, 날짜 기반)
+    batch_bootstrapper - Batch_Bootstrap_Analysis.BatchBootstrapper (scipy fsolve, 날짜 기반)
+    interactive_newton - KRW_IRS_Bootstrapping_Interactive.bootstrap (Interactive/Streamlit 공통 로직)
+    gemini_pro_brentq  - KRW_IRS_Bootstrapping_by_gemini_pro.bootstrap_irs
+    custom_knots       - KRW_IRS_Bootstrapping_Custom_Knots.bootstrap_forwards (N-knot 공용 엔진)
+    grok_closed_form   - KRW_IRS_Bootstrapping_by_Grok.bootstrap_krw_irs_rates
+
+사용법:
+    python Benchmark_Bootstrap_Engines.py
+    python Benchmark_Bootstrap_Engines.py --sizes 5,10,25 --repeat 5 --engines hybrid_reporter,batch_bootstrapper
+
+결과는 Benchmark_Results 폴더에 JSON(메타데이터 포함)과 CSV로 저장됩니다.
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+BASE_DATE = datetime(2026, 1, 15)
+DEFAULT_SIZES = [5, 10, 25, 50, 100, 200]
+DF_POINTS = 1000
+
+
+# ---------------------------------------------------------
+# 1. 합성 시장 데이터
+# ---------------------------------------------------------
+def synthetic_rates(year_fracs, seed):
+    """완만한 우상향 커브(3.0% -> 4.0%) + 1bp 수준 노이즈"""
+    rng = np.random.default_rng(seed)
+    t = np.asarray(year_fracs, dtype=float)
+    base = 0.030 + 0.010 * (1.0 - np.exp(-t / 5.0))
+    return base + rng.normal(0.0, 0.0001, size=len(t))
+
+
+def quarterly_grid(n):
+    """0.25년 간격 만기 그리드 (n개)"""
+    return 0.25 * np.arange(1, n + 1)
+
+
+def dated_market(n, seed, calc_mty_date):
+    """HybridReporter / BatchBootstrapper 입력 형태의 MarketTable 및 JumpDates 생성"""
+    months = 3 * np.arange(1, n + 1)
+    tenors = [f"{m}M" for m in months]
+    types = ["Deposit"] + ["IRS"] * (n - 1)
+    rates = synthetic_rates(months / 12.0, seed)
+    market_data = pd.DataFrame({
+        'No': np.arange(1, n + 1),
+        'Inst. Tenor': tenors,
+        'Type': types,
+        'Market Rate': rates,
+    })
+    # 인스트루먼트마다 하나의 Jump 구간을 갖도록 만기일을 Jump Date로 사용
+    jump_dates_list = sorted(calc_mty_date(BASE_DATE, t) for t in tenors)
+    return market_data, jump_dates_list
+
+
+def df_date_grid(last_date):
+    """Today ~ 마지막 Jump Date 사이 DF 평가용 날짜 그리드"""
+    total_days = (last_date - BASE_DATE).days
+    offsets = np.linspace(0, total_days, DF_POINTS).astype(int)
+    return [BASE_DATE + timedelta(days=int(d)) for d in offsets]
+
+
+# ---------------------------------------------------------
+# 2. 엔진별 어댑터
+# ---------------------------------------------------------
+# 각 어댑터는 prepare(n, seed) -> state 를 만들고
+# solve / evaluate_df / report 단계를 state 위에서 실행합니다.
+# 해당 단계가 없는 엔진은 None 으로 두고 결과 테이블에 비워 기록합니다.
+
+class HybridReporterCase:
+    name = "hybrid_reporter"
+    native_sizes = None
+
+    def __init__(self):
+        module = importlib.import_module("Python_Pure_Bootstrapper")
+        self.cls = module.HybridReporter
+
+    def prepare(self, n, seed):
+        runner = self.cls("synthetic", cache_dir=None)
+        runner.today = BASE_DATE
+        runner.market_data, runner.jump_dates_list = dated_market(n, seed, runner.calc_mty_date)
+        runner.prepare_market_data()
+        return runner
+
+    def solve(self, runner):
+        return runner.solve()
+
+    def evaluate_df(self, runner):
+        jump_dates = runner.market_data['Jump Date'].tolist()
+        grid = df_date_grid(jump_dates[-1])
+        return [runner.get_df_internal(d, jump_dates, runner.solved_fwds) for d in grid]
+
+    def report(self, runner):
+        return runner.build_figure()
+
+
+class BatchBootstrapperCase:
+    name = "batch_bootstrapper"
+    native_sizes = None
+
+    def __init__(self):
+        module = importlib.import_module("Batch_Bootstrap_Analysis")
+        self.cls = module.BatchBootstrapper
+
+    def prepare(self, n, seed):
+        runner = self.cls("synthetic", cache_dir=None)
+        market_data, jump_dates_list = dated_market(n, seed, runner.calc_mty_date)
+        market_data = runner.prepare_market_data(market_data, jump_dates_list, BASE_DATE)
+        return {'runner': runner, 'market_data': market_data}
+
+    def solve(self, state):
+        state['solved_fwds'] = state['runner'].bootstrap_date(state['market_data'], BASE_DATE)
+        return state['solved_fwds']
+
+    def evaluate_df(self, state):
+        jump_dates = state['market_data']['Jump Date'].tolist()
+        grid = df_date_grid(jump_dates[-1])
+        return [state['runner'].get_df_internal(d, BASE_DATE, jump_dates, state['solved_fwds']) for d in grid]
+
+    def report(self, state):
+        return state['runner'].build_chart(state['market_data'], state['solved_fwds'], BASE_DATE)
+
+
+class InteractiveNewtonCase:
+    name = "interactive_newton"
+    native_sizes = None
+
+    def __init__(self):
+        self.module = importlib.import_module("KRW_IRS_Bootstrapping_Interactive")
+
+    def prepare(self, n, seed):
+        tenors = quarterly_grid(n)
+        return {'tenors': tenors, 'rates': synthetic_rates(tenors, seed), 'dt': 0.25}
+
+    def solve(self, state):
+        state['history'] = self.module.bootstrap(state['tenors'], state['rates'], state['dt'])
+        return state['history'].iloc[-1]['All_Fwds']
+
+    def evaluate_df(self, state):
+        final_row = state['history'].iloc[-1]
+        t_grid = np.linspace(0, max(state['tenors']), DF_POINTS)
+        return [self.module.get_df(t, final_row['All_Nodes'], final_row['All_Dfs']) for t in t_grid]
+
+    def report(self, state):
+        return self.module.build_figure(state['history'], state['tenors'], state['rates'], state['dt'])
+
+
+class GeminiProBrentqCase:
+    name = "gemini_pro_brentq"
+    native_sizes = None
+    evaluate_df = None
+    report = None
+
+    def __init__(self):
+        self.module = importlib.import_module("KRW_IRS_Bootstrapping_by_gemini_pro")
+
+    def prepare(self, n, seed):
+        # 연 1회 지급, 정수 연도 만기만 지원
+        tenors = np.arange(1, n + 1)
+        rates = synthetic_rates(tenors, seed)
+        return {int(t): float(r) for t, r in zip(tenors, rates)}
+
+    def solve(self, market_data):
+        dfs, forwards = self.module.bootstrap_irs(market_data)
+        return [forwards[t] for t in sorted(forwards)]
+
+
+class CustomKnotsCase:
+    name = "custom_knots"
+    native_sizes = None
+    report = None
+
+    def __init__(self):
+        self.module = importlib.import_module("KRW_IRS_Bootstrapping_Custom_Knots")
+
+    def prepare(self, n, seed):
+        # 분기 만기 n개, knot 은 만기 1개월 뒤 (만기와 분리된 knot 벡터)
+        years = quarterly_grid(n)
+        labels = ["3M Depo"] + [f"{3 * (k + 1)}M IRS" for k in range(1, n)]
+        rates = synthetic_rates(years, seed)
+        return {'maturities': dict(zip(labels, years)), 'market_rates': dict(zip(labels, rates)),
+                'nodes': np.asarray(years) + 1 / 12}
+
+    def solve(self, state):
+        state['forwards'] = self.module.bootstrap_forwards(
+            state['maturities'], state['market_rates'], state['nodes'])
+        return state['forwards']
+
+    def evaluate_df(self, state):
+        t_grid = np.linspace(0, state['nodes'][-1], DF_POINTS)
+        return self.module.get_df(t_grid, state['nodes'], state['forwards'])
+
+
+class GrokClosedFormCase:
+    name = "grok_closed_form"
+    native_sizes = None
+    evaluate_df = None
+    report = None
+
+    def __init__(self):
+        self.module = importlib.import_module("KRW_IRS_Bootstrapping_by_Grok")
+
+    def prepare(self, n, seed):
+        tenors = quarterly_grid(n)
+        return {'maturities': tenors, 'irs_rates': synthetic_rates(tenors, seed)}
+
+    def solve(self, state):
+        result = self.module.bootstrap_krw_irs_rates(state['maturities'], state['irs_rates'])
+        return result[-1]
+
+
+class KrwCurveCase:
+    name = "krw_curve"
+    native_sizes = None
+
+    def __init__(self):
+        module = importlib.import_module("krw_curve")
+        self.bootstrap_curve = module.bootstrap_curve
+        self.inputs_cls = module.CurveInputs
+        self.calc_mty_date = importlib.import_module("krw_curve.dates").calc_mty_date
+
+    def prepare(self, n, seed):
+        market_data, jump_dates_list = dated_market(n, seed, self.calc_mty_date)
+        inputs = self.inputs_cls(BASE_DATE, market_data['Inst. Tenor'].tolist(), market_data['Type'].tolist(),
+                                 market_data['Market Rate'].tolist(), jump_dates_list)
+        return {'inputs': inputs, 'result': None}
+
+    def solve(self, state):
+        state['result'] = self.bootstrap_curve(state['inputs'])
+        return state['result'].forwards
+
+    def evaluate_df(self, state):
+        curve = state['result'].curve
+        return curve.df(df_date_grid(curve.pillar_dates[-1]))
+
+    def report(self, state):
+        from krw_curve.charts import build_figure
+        return build_figure(state['result'])
+
+
+ENGINE_CASES = [
+    HybridReporterCase,
+    BatchBootstrapperCase,
+    InteractiveNewtonCase,
+    GeminiProBrentqCase,
+    CustomKnotsCase,
+    GrokClosedFormCase,
+    KrwCurveCase,
+]
+
+
+# ---------------------------------------------------------
+# 3. 측정
+# ---------------------------------------------------------
+def time_stage(func, state, repeat):
+    """repeat 회 실행하여 (최소, 중앙값) 초 반환"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(state)
+        samples.append(time.perf_counter() - start)
+    return min(samples), statistics.median(samples), result
+
+
+def peak_memory(func, state):
+    """tracemalloc 기준 단계 실행 중 최대 할당량 (bytes)"""
+    tracemalloc.start()
+    try:
+        func(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(case, n, seed, repeat):
+    row = {'engine': case.name, 'n_instruments': n, 'status': 'ok'}
+    state = case.prepare(n, seed)
+
+    solve_min, solve_median, fwds = time_stage(case.solve, state, repeat)
+    row['solve_s_min'] = solve_min
+    row['solve_s_median'] = solve_median
+    row['solve_peak_bytes'] = peak_memory(case.solve, state)
+    row['fwd_checksum'] = float(np.sum(np.asarray(fwds, dtype=float)))
+
+    for stage in ['evaluate_df', 'report']:
+        func = getattr(case, stage)
+        if func is None:
+            row[f'{stage}_s_min'] = row[f'{stage}_s_median'] = row[f'{stage}_peak_bytes'] = None
+            continue
+        stage_min, stage_median, _ = time_stage(func, state, repeat)
+        row[f'{stage}_s_min'] = stage_min
+        row[f'{stage}_s_median'] = stage_median
+        row[f'{stage}_peak_bytes'] = peak_memory(func, state)
+    return row
+
+
+def run_benchmark(sizes, engines=None, repeat=3, seed=42):
+    rows = []
+    for case_cls in ENGINE_CASES:
+        if engines and case_cls.name not in engines:
+            continue
+        try:
+            case = case_cls()
+        except ImportError as e:
+            print(f"[{case_cls.name}] 건너뜀 (import 실패: {e})")
+            rows.append({'engine': case_cls.name, 'n_instruments': None, 'status': f'unavailable: {e}'})
+            continue
+
+        for n in sizes:
+            if case.native_sizes is not None and n not in case.native_sizes:
+                continue
+            print(f"[{case.name}] n={n} 측정 중...")
+            try:
+                row = run_case(case, n, seed, repeat)
+            except Exception as e:
+                print(f"  -> ERROR: {e}")
+                row = {'engine': case.name, 'n_instruments': n, 'status': f'error: {e}'}
+            rows.append(row)
+
+        # 고정 크기 엔진은 요청된 사이즈와 무관하게 기본 크기로 한 번 측정
+        if case.native_sizes is not None and not any(n in case.native_sizes for n in sizes):
+            for n in case.native_sizes:
+                print(f"[{case.name}] n={n} (고정 크기) 측정 중...")
+                rows.append(run_case(case, n, seed, repeat))
+    return rows
+
+
+COLUMNS = [
+    'engine', 'n_instruments', 'status',
+    'solve_s_min', 'solve_s_median', 'solve_peak_bytes',
+    'evaluate_df_s_min', 'evaluate_df_s_median', 'evaluate_df_peak_bytes',
+    'report_s_min', 'report_s_median', 'report_peak_bytes',
+    'fwd_checksum',
+]
+
+
+def write_results(rows, output_dir, meta):
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    json_path = os.path.join(output_dir, f"benchmark_{stamp}.json")
+    csv_path = os.path.join(output_dir, f"benchmark_{stamp}.csv")
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': rows}, f, indent=2, ensure_ascii=False)
+
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({c: row.get(c) for c in COLUMNS})
+    return json_path, csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bootstrap engine benchmark")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="쉼표로 구분한 인스트루먼트 개수 (기본: 5,10,25,50,100,200)")
+    parser.add_argument("--engines", default="",
+                        help="쉼표로 구분한 엔진 이름 (기본: 전체)")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 측정 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 금리 노이즈 시드")
+    parser.add_argument("--output", default="Benchmark_Results", help="결과 저장 폴더")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+
+    meta = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'sizes': sizes,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'df_points': DF_POINTS,
+        'base_date': BASE_DATE.strftime('%Y-%m-%d'),
+    }
+
+    rows = run_benchmark(sizes, engines, args.repeat, args.seed)
+    json_path, csv_path = write_results(rows, args.output, meta)
+
+    print("\n=== Benchmark Summary (solve median, ms) ===")
+    for row in rows:
+        if row['status'] != 'ok':
+            print(f"{row['engine']:<20} n={row['n_instruments']}: {row['status']}")
+            continue
+        print(f"{row['engine']:<20} n={row['n_instruments']:>4}: {row['solve_s_median'] * 1000:10.2f} ms")
+    print(f"\n결과 저장: {json_path}, {csv_path}")
+
+
+if __name__ == "__main__":
+    main()
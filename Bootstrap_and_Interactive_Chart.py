@@ -4,6 +4,32 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 
+from krw_curve.cache import CurveCache, market_curve_key
+
+# RunBootstrap 매크로 결과 캐시 키에 사용 (VBA 로직이 바뀌면 올릴 것)
+VBA_ENGINE_VERSION = "vba-runbootstrap-1"
+
+def bootstrap_input_key(ws_main):
+    """Common / MarketTable / JumpDates 입력값으로 캐시 키 생성"""
+    tbl_common = ws_main.api.ListObjects("Common")
+    df_common = ws_main.range(tbl_common.Range.Address).options(pd.DataFrame, index=False, header=True).value
+    df_common.columns = [str(c).strip() for c in df_common.columns]
+    
+    tbl_market = ws_main.api.ListObjects("MarketTable")
+    df_market = ws_main.range(tbl_market.Range.Address).options(pd.DataFrame, index=False, header=True).value
+    df_market.columns = [str(c).strip() for c in df_market.columns]
+    
+    tbl_jump = ws_main.api.ListObjects("JumpDates")
+    df_jump = ws_main.range(tbl_jump.Range.Address).options(pd.DataFrame, index=False, header=True).value
+    df_jump.columns = [str(c).strip() for c in df_jump.columns]
+    
+    return market_curve_key(pd.to_datetime(df_common['Today'].iloc[0]),
+                            df_common['DayCount Basis'].iloc[0],
+                            df_common['IRS Coupon Freq'].iloc[0],
+                            df_market,
+                            pd.to_datetime(df_jump['Jump Date']).tolist(),
+                            VBA_ENGINE_VERSION)
+
 def run_bootstrap_and_chart():
     file_path = "IRS_Bootstrap_DateBased.xlsm"
     
@@ -26,19 +52,34 @@ def run_bootstrap_and_chart():
         return
     
     try:
-        # 1. 엑셀 매크로 실행 (RunBootstrap)
-        print("엑셀 매크로(RunBootstrap) 실행 중... (계산량이 많으면 수 초 걸릴 수 있습니다)")
-        # 참고: 매크로 마지막에 MsgBox가 있다면 엑셀에서 확인 버튼을 눌러야 다음 단계로 진행됩니다.
-        macro = wb.macro("RunBootstrap")
-        macro()
-        
-        # MarketTable 수식 결과값 강제 업데이트 (부트스트랩 결과 반영을 위함)
-        print("수식 결과값 최종 업데이트 중 (Calculate)...")
-        app.calculate()
+        # 0. 입력값 해시로 캐시 조회 (동일 입력이면 매크로 실행 생략)
+        ws_main = wb.sheets["Main"]
+        cache = CurveCache()
+        cache_key = bootstrap_input_key(ws_main)
+        cached = cache.get(cache_key)
+        tbl_market = ws_main.api.ListObjects("MarketTable")
         
-        # 계산이 완료될 때까지 잠시 대기 (안정성 확보)
-        import time
-        time.sleep(1) 
+        if cached is not None:
+            print("동일 입력의 캐시 결과 사용 (RunBootstrap 매크로 생략)")
+            ws_main.range(tbl_market.ListColumns("Solved Forward").DataBodyRange.Address).value = [[f] for f in cached['solved_fwds']]
+            app.calculate()
+        else:
+            # 1. 엑셀 매크로 실행 (RunBootstrap)
+            print("엑셀 매크로(RunBootstrap) 실행 중... (계산량이 많으면 수 초 걸릴 수 있습니다)")
+            # 참고: 매크로 마지막에 MsgBox가 있다면 엑셀에서 확인 버튼을 눌러야 다음 단계로 진행됩니다.
+            macro = wb.macro("RunBootstrap")
+            macro()
+            
+            # MarketTable 수식 결과값 강제 업데이트 (부트스트랩 결과 반영을 위함)
+            print("수식 결과값 최종 업데이트 중 (Calculate)...")
+            app.calculate()
+            
+            # 계산이 완료될 때까지 잠시 대기 (안정성 확보)
+            import time
+            time.sleep(1) 
+            
+            solved = ws_main.range(tbl_market.ListColumns("Solved Forward").DataBodyRange.Address).options(ndim=1).value
+            cache.put(cache_key, {'solved_fwds': [float(f) for f in solved]})
         
         print("계산 및 업데이트 완료!")
 
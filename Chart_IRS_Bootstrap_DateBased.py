@@ -6,6 +6,12 @@ from datetime import datetime, timedelta
 import os
 import numpy as np
 
+from krw_curve.chart_layers import forward_segments_trace, add_guide_lines
+from krw_curve.chart_cache import chart_fingerprint, write_html_if_changed
+
+# 차트 구성(트레이스/스타일)을 바꾸면 올려서 기존 HTML을 무효화
+CHART_VERSION = "irs-datebased-2"
+
 def generate_irs_chart():
     target_excel = "IRS_Bootstrap_DateBased.xlsm"
     print(f"'{target_excel}' 연결 시도 중...")
@@ -103,25 +109,14 @@ def generate_irs_chart():
         )
     ), row=1, col=1)
 
-    # Forward Step Lines
-    prev_date = today
-    all_ticks = [today]
-    for i, row in df_plot.iterrows():
-        curr_date = row['Jump Date']
-        fwd_rate = row['Solved Forward']
-        mid_date = prev_date + (curr_date - prev_date) / 2
-        
-        fig.add_trace(go.Scatter(
-            x=[prev_date, mid_date, curr_date], y=[fwd_rate, fwd_rate, fwd_rate],
-            mode='lines+text', line=dict(color='#2ca02c', width=3),
-            text=["", f"<b>{fwd_rate:.2%}</b>", ""],
-            textposition="top center", textfont=dict(size=11, color="green"),
-            showlegend=False,
-            hovertemplate=f"<b>Forward Rate: {fwd_rate:.4%}</b><br>Period: {prev_date.strftime('%Y-%m-%d')} ~ {curr_date.strftime('%Y-%m-%d')}<extra></extra>"
-        ), row=1, col=1)
-        fig.add_vline(x=curr_date, line_width=1, line_dash="dot", line_color="#ddd", row=1, col=1)
-        all_ticks.append(curr_date)
-        prev_date = curr_date
+    # Forward Step Lines: 모든 구간을 트레이스 하나로 (구간별 trace/vline 대신)
+    jump_dates = df_plot['Jump Date'].tolist()
+    start_dates = [today] + jump_dates[:-1]
+    fig.add_trace(forward_segments_trace(start_dates, jump_dates, df_plot['Solved Forward']), row=1, col=1)
+
+    # Jump Date 수직선 (NaN 으로 끊은 트레이스 하나)
+    add_guide_lines(fig, jump_dates, color="#ddd", dash="dot")
+    all_ticks = [today] + jump_dates
 
     fig.add_trace(go.Scatter(x=[None], y=[None], mode='lines', line=dict(color='#2ca02c', width=3), name='Solved Forward (Step)'), row=1, col=1)
 
@@ -172,9 +167,13 @@ def generate_irs_chart():
         hovermode="closest"
     )
 
+    # 그려지는 데이터(차트 + 테이블 3개)가 같으면 기존 HTML 재사용
+    fingerprint = chart_fingerprint(CHART_VERSION, target_excel, df_common, df_market, df_jump)
     output_html = "IRS_Bootstrap_Analysis.html"
-    fig.write_html(output_html, full_html=True, include_plotlyjs='cdn')
-    print(f"챠트 생성 및 HTML 저장 완료: {output_html}")
+    if write_html_if_changed(output_html, fingerprint, lambda: fig):
+        print(f"챠트 생성 및 HTML 저장 완료: {output_html}")
+    else:
+        print(f"데이터 변경 없음, 기존 HTML 재사용: {output_html}")
     fig.show()
 
 if __name__ == "__main__": generate_irs_chart()
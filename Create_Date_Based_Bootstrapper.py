@@ -33,10 +33,17 @@ Public Function CalcYF(startDate As Date, endDate As Date, basis As String) As D
         Case "act/360"
             CalcYF = days / 360#
         Case "act/act"
-            ' Simplified: use actual days / actual days in year
-            Dim avgYearDays As Double
-            avgYearDays = 365.25
-            CalcYF = days / avgYearDays
+            ' ISDA: actual days in each calendar year / days in that year (365 or 366)
+            Dim y As Integer
+            Dim yStart As Date, yEnd As Date
+            CalcYF = 0#
+            For y = Year(startDate) To Year(endDate)
+                yStart = DateSerial(y, 1, 1)
+                If yStart < startDate Then yStart = startDate
+                yEnd = DateSerial(y + 1, 1, 1)
+                If yEnd > endDate Then yEnd = endDate
+                CalcYF = CalcYF + (yEnd - yStart) / (DateSerial(y + 1, 1, 1) - DateSerial(y, 1, 1))
+            Next y
         Case "30/360"
             startYear = Year(startDate)
             startMonth = Month(startDate)
@@ -509,7 +516,7 @@ End Sub
             ws_info.range("A3").value = "Date-Based IRS Bootstrapper"
             ws_info.range("A5").value = "Features:"
             ws_info.range("A6").value = "- All calculations are date-based"
-            ws_info.range("A7").value = "- Day count: ACT/365, ACT/360, ACT/ACT, 30/360"
+            ws_info.range("A7").value = "- Day count: ACT/365, ACT/360, ACT/ACT (ISDA), 30/360"
             ws_info.range("A8").value = "- IRS freq: Annual, Semi, Quarterly, Monthly, Daily"
             ws_info.range("A10").value = "VBA Functions:"
             ws_info.range("A11").value = "CalcYF, AddTenor, LogLinearDF_Date, RunBootstrap"
@@ -1,9 +1,15 @@
 import pandas as pd
 import plotly.graph_objects as go
 import xlwings as xw
-from datetime import datetime, timedelta
+from datetime import timedelta
 import os
 
+from krw_curve.chart_layers import add_guide_lines
+from krw_curve.chart_cache import chart_fingerprint, fingerprinted_path, write_html_if_changed
+
+# 차트 구성(트레이스/스타일)을 바꾸면 올려서 기존 HTML을 무효화
+CHART_VERSION = "combined-forward-2"
+
 def generate_combined_forward_chart():
     # 1. 엑셀 연결
     target_wb = None
@@ -54,6 +60,7 @@ def generate_combined_forward_chart():
             
             df_plot = df_market.dropna(subset=['Mty Date', 'Solved Forward']).copy()
             df_plot = df_plot.sort_values('Jump Date')
+            scenarios.append((scenario_name, today, df_plot[['Mty Date', 'Market Rate', 'Jump Date', 'Solved Forward']]))
 
             # --- Trace 구성 ---
             
@@ -116,8 +123,6 @@ def generate_combined_forward_chart():
 
     # Layout 설정
     unique_ticks = sorted(list(set(all_ticks)))
-    timestamp = datetime.now().strftime("%H%M%S")
-    output_filename = f"Forward_Chart_Combined_Analysis_{timestamp}.html"
 
     fig.update_layout(
         title=dict(
@@ -145,12 +150,16 @@ def generate_combined_forward_chart():
         )
     )
 
-    # 금통위 날짜 가이드라인 (옵션)
-    for tick in unique_ticks:
-        fig.add_vline(x=tick, line_width=1, line_dash="dot", line_color="rgba(200,200,200,0.3)")
+    # 금통위 날짜 가이드라인 (옵션) - 날짜 수와 무관하게 트레이스 하나
+    add_guide_lines(fig, unique_ticks, color="rgba(200,200,200,0.3)", dash="dot")
 
-    fig.write_html(output_filename, full_html=True, include_plotlyjs='cdn')
-    print(f"\n성공! 통합 차트가 생성되었습니다: {output_filename}")
+    # 두 시나리오의 데이터 + 레이아웃 옵션이 같으면 기존 HTML 재사용 (타임스탬프 파일명 대신 내용 해시)
+    fingerprint = chart_fingerprint(CHART_VERSION, target_wb.name, scenarios)
+    output_filename = fingerprinted_path("Forward_Chart_Combined_Analysis", fingerprint)
+    if write_html_if_changed(output_filename, fingerprint, lambda: fig):
+        print(f"\n성공! 통합 차트가 생성되었습니다: {output_filename}")
+    else:
+        print(f"\n데이터 변경 없음, 기존 통합 차트 재사용: {output_filename}")
 
 if __name__ == "__main__":
     generate_combined_forward_chart()
@@ -2,9 +2,14 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import xlwings as xw
-from datetime import datetime
 import os
 
+from krw_curve.chart_layers import forward_segments_trace, add_guide_lines
+from krw_curve.chart_cache import chart_fingerprint, fingerprinted_path, write_html_if_changed
+
+# 차트 구성(트레이스/스타일)을 바꾸면 올려서 기존 HTML을 무효화
+CHART_VERSION = "multi-sheet-forward-2"
+
 def generate_multi_sheet_forward_charts():
     # 1. 엑셀 연결 (이름이 '숙제 6.4' 또는 '숙제 6.5'로 시작하는 파일 찾기)
     target_wb = None
@@ -79,32 +84,19 @@ def generate_multi_sheet_forward_charts():
                 hovertemplate="<b>Mty Date: %{x|%Y-%m-%d}</b><br>Rate: %{y:.4%}<extra></extra>"
             ))
 
-            # Forward Step Lines
-            prev_date = today
-            all_ticks = [today]
-            for _, row in df_plot.iterrows():
-                curr_date = row['Jump Date']
-                fwd_rate = row['Solved Forward']
-                mid_date = prev_date + (curr_date - prev_date) / 2
-                
-                fig.add_trace(go.Scatter(
-                    x=[prev_date, mid_date, curr_date], y=[fwd_rate, fwd_rate, fwd_rate],
-                    mode='lines+text', line=dict(color='#2ca02c', width=3),
-                    text=["", f"<b>{fwd_rate:.2%}</b>", ""],
-                    textposition="top center", textfont=dict(size=11, color="green"),
-                    showlegend=False,
-                    hovertemplate=f"<b>Forward: {fwd_rate:.4%}</b><br>{prev_date.strftime('%Y-%m-%d')} ~ {curr_date.strftime('%Y-%m-%d')}<extra></extra>"
-                ))
-                fig.add_vline(x=curr_date, line_width=1, line_dash="dash", line_color="rgba(150,150,150,0.5)")
-                all_ticks.append(curr_date)
-                prev_date = curr_date
+            # Forward Step Lines: 모든 구간을 트레이스 하나로 (구간별 trace/vline 대신)
+            jump_dates = df_plot['Jump Date'].tolist()
+            start_dates = [today] + jump_dates[:-1]
+            fig.add_trace(forward_segments_trace(start_dates, jump_dates, df_plot['Solved Forward'], hovertemplate="<b>Forward: %{y:.4%}</b><br>%{customdata}<extra></extra>"))
+
+            # Jump Date 수직선 (NaN 으로 끊은 트레이스 하나)
+            add_guide_lines(fig, jump_dates, color="rgba(150,150,150,0.5)", dash="dash")
+            all_ticks = [today] + jump_dates
 
             fig.add_trace(go.Scatter(x=[None], y=[None], mode='lines', line=dict(color='#2ca02c', width=3), name='Solved Forward'))
 
             # 레이아웃
             all_ticks = sorted(list(set(all_ticks + df_plot['Mty Date'].tolist())))
-            timestamp = datetime.now().strftime("%H%M%S")
-            output_filename = f"Forward_Chart_{ws.name}_{timestamp}.html"
 
             fig.update_layout(
                 title=dict(text=f"Forward Chart Analysis - {ws.name}<br><span style='font-size:14px; color:gray;'>File: {target_wb.name}</span>", x=0.5),
@@ -115,8 +107,14 @@ def generate_multi_sheet_forward_charts():
                 hovermode="closest"
             )
 
-            fig.write_html(output_filename, full_html=True, include_plotlyjs='cdn')
-            print(f"  - 성공: {output_filename}")
+            # 시트 데이터 + 레이아웃 옵션이 같으면 기존 HTML 재사용 (타임스탬프 파일명 대신 내용 해시)
+            plot_cols = ['Mty Date', 'Market Rate', 'Jump Date', 'Solved Forward', 'Tenor_Str']
+            fingerprint = chart_fingerprint(CHART_VERSION, target_wb.name, ws.name, today, df_plot[plot_cols])
+            output_filename = fingerprinted_path(f"Forward_Chart_{ws.name}", fingerprint)
+            if write_html_if_changed(output_filename, fingerprint, lambda: fig):
+                print(f"  - 성공: {output_filename}")
+            else:
+                print(f"  - 데이터 변경 없음, 기존 차트 재사용: {output_filename}")
 
         except Exception as e:
             print(f"  - 에러 발생 ({sheet_idx}번째 시트): {e}")
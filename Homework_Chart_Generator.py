@@ -2,10 +2,15 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import xlwings as xw
-from datetime import datetime
 import os
 import numpy as np
 
+from krw_curve.chart_layers import forward_segments_trace, add_guide_lines
+from krw_curve.chart_cache import chart_fingerprint, fingerprinted_path, write_html_if_changed
+
+# 차트 구성(트레이스/스타일)을 바꾸면 올려서 기존 HTML을 무효화
+CHART_VERSION = "homework-chart-2"
+
 def generate_homework_chart():
     # 1. 엑셀 연결 (이름이 '숙제.6.4'로 시작하는 파일 찾기)
     target_wb = None
@@ -82,28 +87,14 @@ def generate_homework_chart():
         )
     ), row=1, col=1)
 
-    # Forward Step Lines
-    prev_date = today
-    all_ticks = [today]
-    for i, row in df_plot.iterrows():
-        curr_date = row['Jump Date']
-        fwd_rate = row['Solved Forward']
-        # 선 중앙에 텍스트를 배치하기 위한 mid_date 계산
-        mid_date = prev_date + (curr_date - prev_date) / 2
-        
-        fig.add_trace(go.Scatter(
-            x=[prev_date, mid_date, curr_date], y=[fwd_rate, fwd_rate, fwd_rate],
-            mode='lines+text', line=dict(color='#2ca02c', width=3),
-            text=["", f"<b>{fwd_rate:.2%}</b>", ""],
-            textposition="top center", textfont=dict(size=11, color="green"),
-            showlegend=False,
-            hovertemplate=f"<b>Forward Rate: {fwd_rate:.4%}</b><br>Period: <b>{prev_date.strftime('%Y-%m-%d')}</b> ~ <b>{curr_date.strftime('%Y-%m-%d')}</b><extra></extra>"
-        ), row=1, col=1)
-        
-        # Jump Date 수직선
-        fig.add_vline(x=curr_date, line_width=1, line_dash="dash", line_color="rgba(200,200,200,0.5)", row=1, col=1)
-        all_ticks.append(curr_date)
-        prev_date = curr_date
+    # Forward Step Lines: 모든 구간을 트레이스 하나로 (구간별 trace/vline 대신)
+    jump_dates = df_plot['Jump Date'].tolist()
+    start_dates = [today] + jump_dates[:-1]
+    fig.add_trace(forward_segments_trace(start_dates, jump_dates, df_plot['Solved Forward']), row=1, col=1)
+
+    # Jump Date 수직선 (NaN 으로 끊은 트레이스 하나)
+    add_guide_lines(fig, jump_dates, color="rgba(200,200,200,0.5)", dash="dash")
+    all_ticks = [today] + jump_dates
 
     # 범례용 가짜 트레이스 (Forward)
     fig.add_trace(go.Scatter(x=[None], y=[None], mode='lines', line=dict(color='#2ca02c', width=3), name='Solved Forward'), row=1, col=1)
@@ -135,8 +126,6 @@ def generate_homework_chart():
 
     # Layout 조정
     all_ticks = sorted(list(set(all_ticks + df_plot['Mty Date'].tolist())))
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_filename = f"숙제.6.4 모범답안 CHART_{timestamp}.html"
 
     fig.update_layout(
         title=dict(
@@ -157,8 +146,13 @@ def generate_homework_chart():
         hovermode="closest"
     )
 
-    fig.write_html(output_filename, full_html=True, include_plotlyjs='cdn')
-    print(f"HTML 차트 생성 완료: {output_filename}")
+    # 그려지는 데이터 + 레이아웃 옵션이 같으면 기존 HTML 재사용 (타임스탬프 파일명 대신 내용 해시)
+    fingerprint = chart_fingerprint(CHART_VERSION, target_wb.name, today, df_market, df_plot['Tenor_Str'])
+    output_filename = fingerprinted_path("숙제.6.4 모범답안 CHART", fingerprint)
+    if write_html_if_changed(output_filename, fingerprint, lambda: fig):
+        print(f"HTML 차트 생성 완료: {output_filename}")
+    else:
+        print(f"데이터 변경 없음, 기존 차트 재사용: {output_filename}")
     # fig.show() # 로컬 실행 시 확인용
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import numpy as np
 import pandas as pd
-from scipy.optimize import fsolve
 import os
 
+from krw_curve.curve import PiecewiseFlatForward
+from krw_curve.knots import bootstrap_knots
+
 try:
     import xlwings as xw
 except ImportError:
@@ -30,56 +32,13 @@ market_rates = {
 nodes = np.array([2, 5, 7, 10, 13]) / 12.0
 
 def get_df(t, nodes, forwards):
-    """Python 내부 계산용 DF 함수"""
-    if t <= 0: return 1.0
-    integral = 0
-    prev_node = 0
-    for i in range(len(nodes)):
-        node = nodes[i]
-        f = forwards[i]
-        if t <= node:
-            integral += f * (t - prev_node)
-            return np.exp(-integral)
-        else:
-            integral += f * (node - prev_node)
-            prev_node = node
-    integral += forwards[-1] * (t - prev_node)
-    return np.exp(-integral)
-
-# 2. 부트스트래핑 수행
-solved_forwards = []
-
-# 1) 1D Call
-f1 = fsolve(lambda f: get_df(maturities['1D Call'], nodes[:1], [f]) - 1/(1 + market_rates['1D Call'] * maturities['1D Call']), market_rates['1D Call'])[0]
-solved_forwards.append(f1)
-
-# 2) 3M Depo
-f2 = fsolve(lambda f: get_df(maturities['3M Depo'], nodes[:2], solved_forwards + [f]) - 1/(1 + market_rates['3M Depo'] * maturities['3M Depo']), market_rates['3M Depo'])[0]
-solved_forwards.append(f2)
-
-# 3) 6M IRS
-def obj_6m(f):
-    fwds = solved_forwards + [f]
-    dfs = [get_df(t, nodes[:3], fwds) for t in [3/12, 6/12]]
-    return market_rates['6M IRS'] * 0.25 * sum(dfs) - (1 - dfs[-1])
-f3 = fsolve(obj_6m, market_rates['6M IRS'])[0]
-solved_forwards.append(f3)
-
-# 4) 9M IRS
-def obj_9m(f):
-    fwds = solved_forwards + [f]
-    dfs = [get_df(t, nodes[:4], fwds) for t in [3/12, 6/12, 9/12]]
-    return market_rates['9M IRS'] * 0.25 * sum(dfs) - (1 - dfs[-1])
-f4 = fsolve(obj_9m, market_rates['9M IRS'])[0]
-solved_forwards.append(f4)
+    """Python 내부 계산용 DF 함수 (t는 스칼라 또는 배열)"""
+    return PiecewiseFlatForward(nodes[:len(forwards)], forwards).df_t(t)
 
-# 5) 1Y IRS
-def obj_1y(f):
-    fwds = solved_forwards + [f]
-    dfs = [get_df(t, nodes[:5], fwds) for t in [3/12, 6/12, 9/12, 12/12]]
-    return market_rates['1Y IRS'] * 0.25 * sum(dfs) - (1 - dfs[-1])
-f5 = fsolve(obj_1y, market_rates['1Y IRS'])[0]
-solved_forwards.append(f5)
+# 2. 부트스트래핑 수행 (knot 개수와 무관한 공용 엔진, Call/Depo 는 단리 예금, 그 외 분기 지급 IRS)
+instruments = [("deposit" if name in ['1D Call', '3M Depo'] else "irs", maturities[name], market_rates[name])
+               for name in maturities]
+solved_forwards = bootstrap_knots(instruments, nodes, freq=4)[0].forwards.tolist()
 
 # 3. 엑셀 출력 (xlwings)
 def generate_excel_report():
@@ -143,7 +102,7 @@ End Function
         f_val = solved_forwards[i]
         df_val = get_df(t_knot, nodes, solved_forwards)
         log_df = np.log(df_val)
-        summary_data.append([name, maturities[name], market_rates[name], [2, 5, 7, 10, 13][i], t_knot, df_val, log_df])
+        summary_data.append([name, maturities[name], market_rates[name], int(round(t_knot * 12)), t_knot, df_val, log_df])
     
     cols = ["인스트루먼트", "만기(년)", "시장금리", "Knot(개월)", "Knot(년)", "DiscountFactor", "LogDF"]
     df_summary = pd.DataFrame(summary_data, columns=cols)
@@ -6,6 +6,8 @@ from plotly.subplots import make_subplots
 from scipy.optimize import newton
 import streamlit.components.v1 as components
 
+from krw_curve.curve import PiecewiseFlatForward
+
 # 페이지 설정
 st.set_page_config(page_title="IRS Bootstrapping Tool", layout="wide")
 
@@ -33,11 +35,8 @@ edited_df = st.data_editor(df_input, num_rows="fixed", use_container_width=True)
 dt = 0.25
 
 def get_df(t, nodes, dfs):
-    """t시점의 Discount Factor 계산 (Linear on Log DF)"""
-    if t <= 0: return 1.0
-    log_dfs = np.log(dfs)
-    interp_log_df = np.interp(t, nodes, log_dfs)
-    return np.exp(interp_log_df)
+    """t시점(스칼라 또는 배열)의 Discount Factor 계산 (Linear on Log DF)"""
+    return PiecewiseFlatForward.from_node_dfs(nodes, dfs).df_t(t)
 
 if st.button("🚀 Run Bootstrapping", use_container_width=True):
     # 입력 데이터 정리
@@ -54,18 +53,23 @@ if st.button("🚀 Run Bootstrapping", use_container_width=True):
         target_tenor = market_tenors[step_idx]
         swap_rate = market_rates[step_idx]
         iter_context = {'count': 0}
+
+        # 확정된 노드까지의 지급일 DF 는 단계마다 한 번만 계산 (Newton 반복마다 커브를 다시 만들지 않음)
+        df_prev = temp_dfs[-1]
+        t_prev = temp_nodes[-1]
+        payment_times = np.arange(dt, target_tenor + 1e-9, dt)
+        known = payment_times <= t_prev
+        known_df_sum = get_df(payment_times[known], temp_nodes, temp_dfs).sum()
+        new_widths = payment_times[~known] - t_prev
         
         def objective(f_current):
             f_val = float(f_current)
-            df_prev = temp_dfs[-1]
-            t_prev = temp_nodes[-1]
             df_target = df_prev * np.exp(-f_val * (target_tenor - t_prev))
             
             current_dfs = temp_dfs + [df_target]
             current_nodes = temp_nodes + [target_tenor]
             
-            payment_times = np.arange(dt, target_tenor + 1e-9, dt)
-            fixed_leg = sum([swap_rate * dt * get_df(t, current_nodes, current_dfs) for t in payment_times])
+            fixed_leg = swap_rate * dt * (known_df_sum + (df_prev * np.exp(-f_val * new_widths)).sum())
             fixed_bond = fixed_leg + (1.0 * current_dfs[-1])
             
             iter_context['count'] += 1
@@ -83,7 +87,7 @@ if st.button("🚀 Run Bootstrapping", use_container_width=True):
 
         f_sol = newton(objective, market_rates[step_idx], tol=1e-7)
         temp_forwards.append(f_sol)
-        df_target_final = temp_dfs[-1] * np.exp(-f_sol * (target_tenor - temp_nodes[-1]))
+        df_target_final = df_prev * np.exp(-f_sol * (target_tenor - t_prev))
         temp_dfs.append(df_target_final)
         temp_nodes.append(target_tenor)
 
@@ -116,7 +120,7 @@ if st.button("🚀 Run Bootstrapping", use_container_width=True):
         
         # 2. DF Data
         t_disp = fixed_t_grid[fixed_t_grid <= row['Target_Tenor'] + 1e-9]
-        df_y = [get_df(t, nodes, dfs) for t in t_disp]
+        df_y = get_df(t_disp, nodes, dfs)
         
         # 3. Cash Flow
         pay_times = np.arange(dt, row['Target_Tenor'] + 1e-9, dt)
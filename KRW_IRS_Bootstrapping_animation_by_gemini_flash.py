@@ -5,6 +5,8 @@ import xlwings as xw
 from matplotlib.animation import FuncAnimation
 from scipy.optimize import newton # fsolve 대신 newton 사용
 
+from krw_curve.curve import PiecewiseFlatForward
+
 # ffmpeg 경로 수동 설정
 plt.rcParams['animation.ffmpeg_path'] = r'C:\ffmpeg\bin\ffmpeg.exe'
 
@@ -14,22 +16,11 @@ market_rates = np.array([0.02, 0.03, 0.04, 0.05])
 dt = 0.25  # 분기별 지급 가정
 
 def get_df(t, nodes, forwards):
-    """t시점의 Discount Factor 계산"""
-    if t <= 0: return 1.0
-    total_integral = 0
-    prev_node = 0
-    for i in range(len(forwards)):
-        node = nodes[i]
-        f = forwards[i]
-        if t <= node:
-            total_integral += f * (t - prev_node)
-            return np.exp(-total_integral)
-        else:
-            total_integral += f * (node - prev_node)
-            prev_node = node
-    # 마지막 노드 이후는 마지막 선도금리 유지 가정
-    total_integral += forwards[-1] * (t - prev_node)
-    return np.exp(-total_integral)
+    """t시점(스칼라 또는 배열)의 Discount Factor 계산
+
+    노드 구간별 forward 가 일정한 커브, 마지막 노드 이후는 마지막 선도금리 유지 가정
+    """
+    return PiecewiseFlatForward(nodes[:len(forwards)], forwards).df_t(t)
 
 # 애니메이션을 위한 초기 설정
 fig = plt.figure(figsize=(8, 9)) # 높이를 조금 더 키워서 공간 확보
@@ -97,16 +88,24 @@ for step_idx in range(len(market_tenors)):
     target_tenor = market_tenors[step_idx]
     swap_rate = market_rates[step_idx]
     iter_context = {'count': 0}
+
+    # 확정된 구간 커브와 그 안의 지급일 DF 는 단계마다 한 번만 계산 (Newton 반복마다 커브를 다시 만들지 않음)
+    t_prev = market_tenors[step_idx - 1] if step_idx > 0 else 0.0
+    solved_nodes = market_tenors[:step_idx].tolist()
+    df_prev = get_df(t_prev, solved_nodes, temp_forwards)
+    payment_times = np.arange(dt, target_tenor + 1e-9, dt)
+    known = payment_times <= t_prev
+    known_df_sum = get_df(payment_times[known], solved_nodes, temp_forwards).sum()
+    new_widths = payment_times[~known] - t_prev
     
     def objective(f_current):
         # newton은 f_current를 항상 스칼라로 전달함
         f_val = float(f_current)
         current_fwd_set = temp_forwards + [f_val]
-        current_nodes = market_tenors[:len(current_fwd_set)].tolist()
         
-        payment_times = np.arange(dt, target_tenor + 1e-9, dt)
-        fixed_leg = sum([swap_rate * dt * get_df(t, current_nodes, current_fwd_set) for t in payment_times])
-        df_end = get_df(target_tenor, current_nodes, current_fwd_set)
+        # 시도하는 f_val 은 마지막 구간(t_prev ~ target_tenor)에만 적용
+        fixed_leg = swap_rate * dt * (known_df_sum + (df_prev * np.exp(-f_val * new_widths)).sum())
+        df_end = df_prev * np.exp(-f_val * (target_tenor - t_prev))
         fixed_bond = fixed_leg + (1.0 * df_end)
         
         iter_context['count'] += 1
@@ -176,9 +175,9 @@ def update_display():
 
     # 2. Discount Factor Curve (Middle)
     plot_times = np.linspace(0, row['Target_Tenor'], 100)
-    df_values = [get_df(t, current_nodes, current_fwds) for t in plot_times]
+    df_values = get_df(plot_times, current_nodes, current_fwds)
     ax2.plot(plot_times, df_values, color='blue', lw=2)
-    ax2.scatter(current_nodes, [get_df(t, current_nodes, current_fwds) for t in current_nodes], color='red')
+    ax2.scatter(current_nodes, get_df(current_nodes, current_nodes, current_fwds), color='red')
     
     # 3. IRS Cash Flow (Bottom)
     current_swap_rate = market_rates[int(row['Step'])-1]
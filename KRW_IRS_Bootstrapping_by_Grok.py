@@ -29,7 +29,7 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-def bootstrap_krw_irs_rates():
+def bootstrap_krw_irs_rates(maturities=None, irs_rates=None):
     """
     Bootstrap discount factors and instantaneous forward rates from KRW IRS rates
     assuming piecewise constant instantaneous forward rates.
@@ -38,8 +38,12 @@ def bootstrap_krw_irs_rates():
     """
 
     # Input data: maturity (years) and IRS rates (%)
-    maturities = np.array([1, 2, 3, 5])
-    irs_rates = np.array([0.02, 0.03, 0.04, 0.05])  # 2%, 3%, 4%, 5%
+    if maturities is None:
+        maturities = np.array([1, 2, 3, 5])
+    if irs_rates is None:
+        irs_rates = np.array([0.02, 0.03, 0.04, 0.05])  # 2%, 3%, 4%, 5%
+    maturities = np.asarray(maturities, dtype=float)
+    irs_rates = np.asarray(irs_rates, dtype=float)
 
     # Calculate discount factors from IRS rates (continuous compounding)
     discount_factors = np.exp(-irs_rates * maturities)
@@ -78,63 +78,64 @@ def bootstrap_irs(market_data):
 
     return dfs, forwards
 
-# ---------------------------------------------------------
-# 3. 실행 및 데이터 프레임 생성
-# ---------------------------------------------------------
-dfs, forwards = bootstrap_irs(market_data)
+if __name__ == "__main__":
+    # ---------------------------------------------------------
+    # 3. 실행 및 데이터 프레임 생성
+    # ---------------------------------------------------------
+    dfs, forwards = bootstrap_irs(market_data)
 
-# 결과 정리
-results = []
-for t in sorted(dfs.keys()):
-    if t == 0: continue
-    results.append({
-        "Tenor (Year)": t,
-        "Discount Factor": dfs[t],
-        "Inst. Forward Rate": forwards.get(t, np.nan)
-    })
+    # 결과 정리
+    results = []
+    for t in sorted(dfs.keys()):
+        if t == 0: continue
+        results.append({
+            "Tenor (Year)": t,
+            "Discount Factor": dfs[t],
+            "Inst. Forward Rate": forwards.get(t, np.nan)
+        })
 
-df_result = pd.DataFrame(results)
-print("=== Bootstrapping Result ===")
-print(df_result.to_string(index=False, formatters={
-    'Discount Factor': '{:.6f}'.format,
-    'Inst. Forward Rate': '{:.4%}'.format
-}))
+    df_result = pd.DataFrame(results)
+    print("=== Bootstrapping Result ===")
+    print(df_result.to_string(index=False, formatters={
+        'Discount Factor': '{:.6f}'.format,
+        'Inst. Forward Rate': '{:.4%}'.format
+    }))
 
-# ---------------------------------------------------------
-# 4. 차트 그리기
-# ---------------------------------------------------------
-# 데이터 준비
-t_values = df_result["Tenor (Year)"]
-df_values = df_result["Discount Factor"]
-fwd_values = df_result["Inst. Forward Rate"]
+    # ---------------------------------------------------------
+    # 4. 차트 그리기
+    # ---------------------------------------------------------
+    # 데이터 준비
+    t_values = df_result["Tenor (Year)"]
+    df_values = df_result["Discount Factor"]
+    fwd_values = df_result["Inst. Forward Rate"]
 
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
 
-# Chart 1: Discount Factors
-ax1.plot(t_values, df_values, marker='o', linestyle='-', color='b')
-ax1.set_title("Discount Factors (Bootstrapped)")
-ax1.set_xlabel("Tenor (Years)")
-ax1.set_ylabel("Discount Factor")
-ax1.grid(True)
-for x, y in zip(t_values, df_values):
-    ax1.text(x, y, f"{y:.4f}", ha='left', va='bottom')
+    # Chart 1: Discount Factors
+    ax1.plot(t_values, df_values, marker='o', linestyle='-', color='b')
+    ax1.set_title("Discount Factors (Bootstrapped)")
+    ax1.set_xlabel("Tenor (Years)")
+    ax1.set_ylabel("Discount Factor")
+    ax1.grid(True)
+    for x, y in zip(t_values, df_values):
+        ax1.text(x, y, f"{y:.4f}", ha='left', va='bottom')
 
-# Chart 2: Instantaneous Forward Rates (Step Plot)
-# Step plot logic: Forward rate is constant FROM prev TO current
-# We need to construct step data explicitly for plotting
-step_x = [0] + list(t_values)
-step_y = [fwd_values.iloc[0]] + list(fwd_values) # Start with first fwd
+    # Chart 2: Instantaneous Forward Rates (Step Plot)
+    # Step plot logic: Forward rate is constant FROM prev TO current
+    # We need to construct step data explicitly for plotting
+    step_x = [0] + list(t_values)
+    step_y = [fwd_values.iloc[0]] + list(fwd_values) # Start with first fwd
 
-ax2.step(step_x, step_y, where='pre', color='r', linewidth=2)
-ax2.set_title("Instantaneous Forward Rates (Piecewise Constant)")
-ax2.set_xlabel("Time (Years)")
-ax2.set_ylabel("Rate")
-ax2.grid(True)
-ax2.set_ylim(0, max(fwd_values)*1.2)
+    ax2.step(step_x, step_y, where='pre', color='r', linewidth=2)
+    ax2.set_title("Instantaneous Forward Rates (Piecewise Constant)")
+    ax2.set_xlabel("Time (Years)")
+    ax2.set_ylabel("Rate")
+    ax2.grid(True)
+    ax2.set_ylim(0, max(fwd_values)*1.2)
 
-# Annotate values
-for i, txt in enumerate(fwd_values):
-    ax2.text(t_values[i]-0.5, txt, f"{txt:.2%}", ha='center', va='bottom', color='darkred', fontweight='bold')
+    # Annotate values
+    for i, txt in enumerate(fwd_values):
+        ax2.text(t_values[i]-0.5, txt, f"{txt:.2%}", ha='center', va='bottom', color='darkred', fontweight='bold')
 
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+    plt.tight_layout()
+    plt.show()
\ No newline at end of file
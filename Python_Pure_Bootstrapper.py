@@ -1,19 +1,44 @@
-import xlwings as xw
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from scipy.optimize import newton
 import os
+import argparse
+import webbrowser
+
+from krw_curve.telemetry import RunTelemetry, optional_profile
+from krw_curve.cache import CurveCache, market_curve_key, DEFAULT_CACHE_DIR
+from krw_curve.bootstrap import instrument_accruals, quote_jacobian
+from krw_curve.dates import extend_jump_dates
+from krw_curve.daycount import scalar_year_fraction
+from krw_curve.chart_cache import chart_fingerprint, fingerprinted_path, write_html_if_changed
+
+try:
+    import xlwings as xw
+except ImportError:
+    print("xlwings 라이브러리가 설치되어 있지 않습니다. 'pip install xlwings'를 실행해 주세요.")
+    xw = None
 
 class HybridReporter:
-    def __init__(self, file_path):
+    # 계산 로직이 바뀌면 올려서 이전 캐시 결과를 무효화
+    ENGINE_VERSION = "hybrid-newton-5"
+    # 차트 구성이 바뀌면 올려서 이전 HTML을 무효화
+    CHART_VERSION = "hybrid-chart-1"
+
+    def __init__(self, file_path, telemetry_path=None, profile_path=None, cache_dir=DEFAULT_CACHE_DIR):
         self.file_path = file_path
         self.wb = None
         self.today = None
         self.basis = "ACT/365"
         self.freq = 4
         self.market_data = None
+        # 계측: telemetry_path가 있으면 실행 종료 시 JSON 한 줄 기록 (메모리 피크 포함)
+        self.profile_path = profile_path
+        self.telemetry = RunTelemetry("hybrid", telemetry_path, track_memory=telemetry_path is not None,
+                                      file=file_path)
+        # cache_dir=None 이면 캐시 사용 안 함
+        self.cache = CurveCache(cache_dir) if cache_dir else None
         
     def load_data(self):
         print(f"데이터 로드 중: {self.file_path}")
@@ -39,23 +64,39 @@ class HybridReporter:
         jump_dates_df = ws_main.range(tbl_jumpdates.Range.Address).options(pd.DataFrame, index=False, header=True).value
         jump_dates_df.columns = [str(c).strip() for c in jump_dates_df.columns]
         self.jump_dates_list = sorted(pd.to_datetime(jump_dates_df['Jump Date']).tolist())
-        
+        self.prepare_market_data()
+
+    def prepare_market_data(self):
+        """Today + Tenor로 Mty Date, JumpDates 중 Mty Date 이상 최소값으로 Jump Date 계산"""
         # Python에서 Today + Tenor로 Mty Date 재계산
         self.market_data['Mty Date'] = self.market_data['Inst. Tenor'].apply(
             lambda t: self.calc_mty_date(self.today, t))
         
+        # 인스트루먼트별 지급 스케줄은 solve 반복마다 만들지 않고 여기서 한 번만 생성
+        self.schedules = [self.cashflow_schedule(row['Inst. Tenor'], row['Type'], row['Mty Date'])
+                          for _, row in self.market_data.iterrows()]
+
+        # 영업일 조정된 마지막 지급일이 Jump Date 를 넘으면 그 Jump Date 를 지급일로 옮김 (VBA 커브와 구간 일치)
+        jump_dates = extend_jump_dates(self.jump_dates_list, self.market_data['Mty Date'],
+                                       [cf_dates[-1] for cf_dates, _ in self.schedules])
+
         # Jump Date = JumpDates 중 Mty Date 이상인 날짜 중 최소값
         def find_jump_date(mty_date):
-            for jd in self.jump_dates_list:
+            for jd in jump_dates:
                 if jd >= mty_date:
                     return jd
-            return self.jump_dates_list[-1]
+            return jump_dates[-1]
         
         self.market_data['Jump Date'] = self.market_data['Mty Date'].apply(find_jump_date)
 
+    def cashflow_schedule(self, tenor, inst_type, mty_date):
+        """(지급일 목록, 구간 year fraction 배열) - Deposit 은 만기 1회, IRS 는 월 단위 roll 스케줄"""
+        days, accruals = instrument_accruals(self.today, tenor, inst_type, mty_date, self.freq, self.basis)
+        return [self.today + timedelta(days=int(d)) for d in days], accruals
+
     def year_frac(self, start, end):
-        days = (end - start).days
-        return days / 365.0 # Simplified for internal solver
+        # 워크북 DayCount Basis 사용 (VBA CalcYF 와 동일)
+        return scalar_year_fraction(start.toordinal(), end.toordinal(), self.basis)
 
     def get_df_internal(self, target_date, jump_dates, forward_rates):
         target_yf = self.year_frac(self.today, target_date)
@@ -68,7 +109,8 @@ class HybridReporter:
                 return np.exp(log_df)
             log_df -= forward_rates[i] * (curr_yf - prev_yf)
             prev_yf = curr_yf
-        log_df -= forward_rates[-1] * (target_yf - prev_yf)
+        # 마지막 Jump Date 이후는 마지막 구간 forward 로 외삽 (VBA LogLinearDF_Date 와 동일)
+        log_df -= forward_rates[len(jump_dates) - 1] * (target_yf - prev_yf)
         return np.exp(log_df)
 
     def parse_tenor(self, tenor_str):
@@ -108,28 +150,46 @@ class HybridReporter:
         current_fwds[step_idx] = fwd_guess
         jump_dates = self.market_data['Jump Date'].iloc[:step_idx+1].tolist()
         
-        mkt_rate, mty_date = row['Market Rate'], row['Mty Date']
+        mkt_rate = row['Market Rate']
+        cf_dates, yfs = self.schedules[step_idx]
         if str(row['Type']).lower() == "deposit":
-            df = self.get_df_internal(mty_date, jump_dates, current_fwds)
-            return (1 + mkt_rate * self.year_frac(self.today, mty_date)) * df - 1.0
+            df = self.get_df_internal(cf_dates[-1], jump_dates, current_fwds)
+            return (1 + mkt_rate * yfs[-1]) * df - 1.0
         else:
-            tenor_yf = self.parse_tenor(row['Inst. Tenor'])
-            num_coupons = int(round(tenor_yf * self.freq))
             fixed_pv = 0.0
-            p_date = self.today
-            for j in range(1, num_coupons + 1):
-                c_date = mty_date if j == num_coupons else self.today + timedelta(days=int(j * (365/self.freq)))
-                yf = self.year_frac(p_date, c_date)
+            for c_date, yf in zip(cf_dates, yfs):
                 fixed_pv += mkt_rate * yf * self.get_df_internal(c_date, jump_dates, current_fwds)
-                p_date = c_date
-            return fixed_pv - (1.0 - self.get_df_internal(mty_date, jump_dates, current_fwds))
+            return fixed_pv - (1.0 - self.get_df_internal(cf_dates[-1], jump_dates, current_fwds))
 
-    def run_bootstrap(self):
-        print("파이썬 내부 부트스트랩 계산 중...")
+    def solve(self):
+        """엑셀 없이 market_data만으로 구간별 Forward를 순차적으로 구함"""
         n = len(self.market_data)
         self.solved_fwds = np.zeros(n)
+        self.telemetry.instruments.clear()  # 재실행 시 마지막 solve 기준으로 기록
         for i in range(n):
-            self.solved_fwds[i] = newton(self.npv_error_internal, self.market_data.iloc[i]['Market Rate'], args=(i, self.solved_fwds), tol=1e-12)
+            row = self.market_data.iloc[i]
+            root, info = newton(self.npv_error_internal, row['Market Rate'], args=(i, self.solved_fwds), tol=1e-12,
+                                full_output=True)
+            self.solved_fwds[i] = root
+            self.telemetry.record_solve(i, row['Inst. Tenor'], info.iterations, info.function_calls,
+                                        self.npv_error_internal(root, i, self.solved_fwds), info.converged, root)
+        return self.solved_fwds
+
+    def run_bootstrap(self):
+        print("파이썬 내부 부트스트랩 계산 중...")
+        cached = None
+        if self.cache is not None:
+            key = market_curve_key(self.today, self.basis, self.freq, self.market_data,
+                                   self.jump_dates_list, self.ENGINE_VERSION)
+            cached = self.cache.get(key)
+        self.telemetry.context['cache_hit'] = cached is not None
+        if cached is not None:
+            print("동일 입력의 캐시 결과 사용 (재계산 생략)")
+            self.solved_fwds = np.array(cached['solved_fwds'])
+        else:
+            self.solve()
+            if self.cache is not None:
+                self.cache.put(key, {'solved_fwds': self.solved_fwds.tolist()})
         
         # 엑셀 메인 테이블 업데이트 (Mty Date, Jump Date, Solved Forward)
         ws_main = self.wb.sheets["Main"]
@@ -140,6 +200,18 @@ class HybridReporter:
         self.wb.app.calculate()
         print("계산 완료 및 메인 테이블 업데이트 성공.")
 
+        # 호가 민감도: 풀린 forward 에서 음함수 미분으로 한 번에 계산 (캐시 결과에도 재부트스트랩 없이 적용)
+        self.jacobian = self.calc_jacobian()
+        return self.jacobian
+
+    def calc_jacobian(self):
+        """d(Solved Forward_i)/d(Market Rate_j) 행렬 (N x N, 하삼각)"""
+        pillar_times = [self.year_frac(self.today, d) for d in self.market_data['Jump Date']]
+        times = [np.array([self.year_frac(self.today, d) for d in cf_dates]) for cf_dates, _ in self.schedules]
+        accruals = [yfs for _, yfs in self.schedules]
+        return quote_jacobian(pillar_times, times, accruals, self.market_data['Market Rate'].to_numpy(dtype=float),
+                              self.solved_fwds)
+
     def write_validation_sheets(self):
         print("검증 시트 작성 중 (Excel 수식 적용)...")
         
@@ -159,12 +231,13 @@ class HybridReporter:
             inst_type_filter = "deposit" if "Deposit" in name else "irs"
             
             for i, row in self.market_data.iterrows():
-                if str(row['Type']).lower() != inst_type_filter: continue
+                # OIS 도 고정 leg 와 1 - DF(만기) 형태이므로 IRS 시트에 함께 기록
+                row_kind = "deposit" if str(row['Type']).lower() == "deposit" else "irs"
+                if row_kind != inst_type_filter: continue
                 
                 # 테너별 리포트 블록 작성
                 tenor = row['Inst. Tenor']
                 mkt_rate = row['Market Rate']
-                mty_date = row['Mty Date']
                 
                 ws.range(f"A{curr_row}").value = f"Tenor: {tenor} | Market Rate: {mkt_rate:.4%}"
                 ws.range(f"A{curr_row}").font.bold = True
@@ -175,14 +248,8 @@ class HybridReporter:
                 ws.range(f"A{curr_row}:E{curr_row}").color = (200, 200, 200)
                 start_data_row = curr_row + 1
                 
-                # 현금흐름 날짜 생성
-                cf_dates = []
-                if inst_type_filter == "deposit":
-                    cf_dates = [mty_date]
-                else:
-                    num_coupons = int(round(self.parse_tenor(tenor) * self.freq))
-                    for j in range(1, num_coupons + 1):
-                        cf_dates.append(mty_date if j == num_coupons else self.today + timedelta(days=int(j * (365/self.freq))))
+                # 현금흐름 날짜 (solve 와 같은 스케줄)
+                cf_dates = self.schedules[i][0]
                 
                 # 데이터 입력 및 수식 설정
                 for j, d in enumerate(cf_dates):
@@ -220,8 +287,8 @@ class HybridReporter:
         print("검증 시트 모든 테너 리포트 작성 완료.")
         self.wb.save()
 
-    def plot_results(self):
-        print("결과 차트 생성 중...")
+    def build_figure(self):
+        """Market Rate 및 Solved Forward 차트(Figure) 생성"""
         df_plot = self.market_data.copy()
         
         fig = go.Figure()
@@ -275,13 +342,48 @@ class HybridReporter:
             template="plotly_white", width=1200, height=700,
             hovermode="closest"
         )
+        return fig
 
-        fig.show()
+    def plot_results(self):
+        print("결과 차트 생성 중...")
+        # 그려지는 데이터가 같으면 Figure 재생성 없이 기존 HTML을 그대로 표시
+        plot_cols = ['Mty Date', 'Market Rate', 'Jump Date']
+        fingerprint = chart_fingerprint(self.CHART_VERSION, self.today, self.market_data[plot_cols], self.solved_fwds)
+        output_file = fingerprinted_path("Hybrid_Forward_Chart", fingerprint)
+        written = write_html_if_changed(output_file, fingerprint, self.build_figure)
+        self.telemetry.context['chart_reused'] = not written
+        if not written:
+            print(f"데이터 변경 없음, 기존 차트 재사용: {output_file}")
+        webbrowser.open(f"file://{os.path.abspath(output_file)}")
         print("차트가 브라우저에 표시되었습니다.")
 
+    def run_all(self):
+        """load_data -> run_bootstrap -> write_validation_sheets -> plot_results (단계별 계측)"""
+        with optional_profile(self.profile_path):
+            try:
+                with self.telemetry.phase("load_data"):
+                    self.load_data()
+                self.telemetry.context['today'] = self.today.strftime('%Y-%m-%d')
+                with self.telemetry.phase("run_bootstrap"):
+                    self.run_bootstrap()
+                with self.telemetry.phase("write_validation_sheets"):
+                    self.write_validation_sheets()
+                with self.telemetry.phase("plot_results"):
+                    self.plot_results()
+            except Exception as e:
+                self.telemetry.fail(e)
+                raise
+            finally:
+                self.telemetry.finish()
+
 if __name__ == "__main__":
-    runner = HybridReporter("IRS_Bootstrap_DateBased.xlsm")
-    runner.load_data()
-    runner.run_bootstrap()
-    runner.write_validation_sheets()
-    runner.plot_results()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Hybrid IRS bootstrap report")
+    parser.add_argument("--file", default="IRS_Bootstrap_DateBased.xlsm")
+    parser.add_argument("--telemetry", default=None, help="계측 JSON Lines 출력 경로 (예: telemetry.jsonl)")
+    parser.add_argument("--profile", default=None, help="cProfile 덤프 경로 (예: hybrid.prof)")
+    parser.add_argument("--no-cache", action="store_true", help="부트스트랩 결과 캐시 사용 안 함")
+    args = parser.parse_args()
+
+    runner = HybridReporter(args.file, telemetry_path=args.telemetry, profile_path=args.profile,
+                            cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
+    runner.run_all()
\ No newline at end of file
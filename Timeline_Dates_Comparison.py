@@ -2,6 +2,8 @@ import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime
 
+from krw_curve.chart_layers import add_guide_lines
+
 def create_timeline_chart():
     # 1. 데이터 정의
     mat_dates_str = [
@@ -54,9 +56,8 @@ def create_timeline_chart():
         xanchor="left"
     )
 
-    # 5. 수직 가이드라인 (모든 날짜에 대해)
-    for d in mat_dates_str + bok_dates_str:
-        fig.add_vline(x=d, line_width=0.5, line_dash="dot", line_color="rgba(200,200,200,0.3)")
+    # 5. 수직 가이드라인 (모든 날짜에 대해) - NaN 으로 끊은 트레이스 하나
+    add_guide_lines(fig, mat_dates_str + bok_dates_str, color="rgba(200,200,200,0.3)", width=0.5, dash="dot")
 
     # 6. 레이아웃 설정
     fig.update_layout(
@@ -0,0 +1,33 @@
+"""
+krw_curve - KRW IRS 커브 부트스트랩 패키지
+
+핵심 계산(bootstrap / curve / dates / inputs)은 NumPy 만 사용합니다.
+엑셀 입출력(excel_io), 차트(charts), scipy 폴백은 사용할 때만 import 됩니다.
+
+명령행:
+    python -m krw_curve bootstrap --inputs curve_inputs.json --output curve.json
+    python -m krw_curve bootstrap --inputs curve_inputs.json --output curve.json --jacobian curve_jacobian.csv
+    python -m krw_curve bootstrap --inputs curve_inputs.json --lsq --smoothness 1e-6 --output curve_lsq.json
+    python -m krw_curve batch --inputs curve_inputs.json --start 2026-01-01 --end 2026-01-31 --output-dir Batch_Curves
+    python -m krw_curve batch --inputs curve_inputs.json --start 2022-01-01 --end 2025-12-31 --vectorized
+    python -m krw_curve backfill --inputs curve_inputs.json --start 2016-01-01 --end 2026-06-30 --output-dir Backfill
+    python -m krw_curve chart --curve curve.json --output curve.html
+    python -m krw_curve report --curve curve.json --output validation.csv
+    python -m krw_curve daily --curve curve.json --years 30 --output curve_daily.csv
+    python -m krw_curve fra --curve curve.json --periods bok_periods.csv --output period_forwards.csv
+    python -m krw_curve stream --inputs curve_inputs.json --feed quotes.jsonl --output live_curve.json
+    python -m krw_curve serve --port 8765
+    python -m krw_curve batch --inputs curve_inputs.json --start 2026-01-01 --end 2026-12-31 --store Curve_History
+    python -m krw_curve scenarios --inputs curve_inputs.json --random 10000 --vol-bp 5 --workers 4
+    python -m krw_curve nodes --inputs curve_inputs.json --node-sets node_sets.csv --chart node_comparison.html
+    python -m krw_curve history --store Curve_History --tenors 10Y --start 2026-01-01 --end 2026-12-31
+"""
+
+from .bootstrap import ENGINE_VERSION, BootstrapResult, IncrementalBootstrap, bootstrap_curve
+from .curve import ForwardCurve
+from .inputs import CurveInputs, load_csv, load_json
+
+__all__ = [
+    "ENGINE_VERSION", "BootstrapResult", "IncrementalBootstrap", "bootstrap_curve",
+    "ForwardCurve", "CurveInputs", "load_csv", "load_json",
+]
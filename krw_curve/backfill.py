@@ -0,0 +1,184 @@
+"""
+체크포인트 / 재개 가능한 장기간 과거 커브 backfill
+
+run_batch 는 상태 없이 날짜를 순회하므로 중간에 죽으면 처음부터 다시 돌려야 합니다.
+backfill 은 몇 년치 기준일을 중단 후에도 다시 계산하지 않고 이어서 채웁니다.
+
+    - 기준일: 영업일만 (np.busday: 주말 + holidays 제외)
+    - 날짜별 결과: <output_dir>/curve_YYYY-MM-DD.json 을 임시 파일 + os.replace 로 원자적 기록
+    - 진행 manifest: <output_dir>/manifest.jsonl (append-only, 날짜별 시도 결과 한 줄씩 fsync)
+      다시 실행하면 manifest 를 읽어 완료된 날짜(결과 파일이 있는 것)는 건너뛰고 나머지부터 재개
+    - 실패: 같은 실행에서 retries 번까지 재시도, 진단 정보(예외 / traceback / 미수렴 인스트루먼트)를 manifest 에 기록
+      다음 실행에서도 다시 시도하며, 누적 시도가 max_attempts 를 넘은 날짜는 건너뜀
+    - quotes(QuoteHistory)를 주면 기준일마다 그날의 과거 호가 사용, 호가가 없는 영업일은 건너뜀 (no_quotes)
+    - 미수렴(converged=False) 또는 forward 에 nan/inf 가 있으면 결과를 쓰지 않고 실패로 처리
+
+사용 예:
+    python -m krw_curve backfill --inputs curve_inputs.json --start 2016-01-01 --end 2026-06-30 \\
+        --output-dir Backfill --holidays krx_holidays.csv --store Curve_History
+"""
+
+import json
+import os
+import time
+import traceback
+from datetime import datetime
+
+import numpy as np
+
+from .dates import to_datetime
+from .fileio import atomic_write_text
+from .telemetry import RunTelemetry, write_jsonl
+
+MANIFEST_NAME = "manifest.jsonl"
+DEFAULT_RETRIES = 2
+DEFAULT_MAX_ATTEMPTS = 6
+
+
+def business_days(start, end, holidays=None):
+    """start ~ end (양끝 포함) 영업일 목록 (주말 + holidays 제외)"""
+    first = np.datetime64(to_datetime(start).date(), 'D')
+    last = np.datetime64(to_datetime(end).date(), 'D') + 1
+    if last <= first:
+        return []
+    days = np.arange(first, last)
+    hol = [np.datetime64(to_datetime(h).date(), 'D') for h in (holidays or [])]
+    return [to_datetime(d.item()) for d in days[np.is_busday(days, holidays=hol)]]
+
+
+def _append_durable(path, record):
+    """manifest 한 줄 추가 후 fsync (프로세스가 죽어도 기록된 진행 상황은 남음)"""
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class BackfillManifest:
+    """manifest.jsonl 을 날짜별 최종 상태로 접어 둔 것"""
+
+    def __init__(self, output_dir):
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.completed = {}   # date_str -> 마지막 성공 레코드
+        self.attempts = {}    # date_str -> 누적 시도 횟수
+        self.failed = {}      # date_str -> 마지막 실패 레코드 (이후 성공하면 제거)
+        if os.path.exists(self.path):
+            self._load()
+
+    def _load(self):
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 끊긴 마지막 줄
+                self._apply(record)
+
+    def _apply(self, record):
+        d = record['date']
+        self.attempts[d] = self.attempts.get(d, 0) + 1
+        if record['status'] == 'ok':
+            self.completed[d] = record
+            self.failed.pop(d, None)
+        else:
+            self.failed[d] = record
+
+    def record(self, record):
+        _append_durable(self.path, record)
+        self._apply(record)
+
+    def is_done(self, date_str, output_dir):
+        record = self.completed.get(date_str)
+        return record is not None and os.path.exists(os.path.join(output_dir, record['file']))
+
+
+def _check_result(result):
+    """미수렴 / 비정상 forward 가 있으면 진단 정보와 함께 ValueError"""
+    bad = [s for s in result.stats if s is not None and not s.get('converged', True)]
+    if bad or not np.all(np.isfinite(result.forwards)):
+        error = ValueError(f"부트스트랩 결과 이상: 미수렴 {len(bad)}개, "
+                           f"비정상 forward {int(np.sum(~np.isfinite(result.forwards)))}개")
+        error.diagnostics = {'unconverged': bad, 'forwards': result.forwards.tolist()}
+        raise error
+
+
+def _diagnostics(error, inputs):
+    info = {
+        'error_type': type(error).__name__,
+        'error': str(error),
+        'traceback': traceback.format_exc(),
+        'instruments': len(inputs),
+        'jump_dates': len(inputs.jump_dates),
+    }
+    info.update(getattr(error, 'diagnostics', {}))
+    return info
+
+
+def run_backfill(inputs, start, end, output_dir, cache=None, telemetry_path=None, holidays=None,
+                 retries=DEFAULT_RETRIES, max_attempts=DEFAULT_MAX_ATTEMPTS, store=None, retry_delay=0.0,
+                 quotes=None):
+    """영업일별 부트스트랩을 체크포인트하며 실행. {'completed', 'skipped', 'failed', 'exhausted', 'no_quotes'} 날짜 목록 반환"""
+    from .batch import bootstrap_cached
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = BackfillManifest(output_dir)
+    days = business_days(start, end, holidays)
+    summary = {'completed': [], 'skipped': [], 'failed': [], 'exhausted': [], 'no_quotes': []}
+    print(f"backfill: 영업일 {len(days)}개, 완료 기록 {len(manifest.completed)}개 ({manifest.path})")
+
+    for today in days:
+        date_str = today.strftime('%Y-%m-%d')
+        if manifest.is_done(date_str, output_dir):
+            summary['skipped'].append(date_str)
+            continue
+        if manifest.attempts.get(date_str, 0) >= max_attempts:
+            summary['exhausted'].append(date_str)
+            continue
+
+        if quotes is not None and today not in quotes:
+            summary['no_quotes'].append(date_str)
+            continue
+        day_inputs = inputs.with_today(today) if quotes is None else quotes.inputs_for(today, inputs)
+        for attempt in range(retries + 1):
+            tel = RunTelemetry("krw_curve_backfill_date", telemetry_path, track_memory=False,
+                               today=date_str, attempt=manifest.attempts.get(date_str, 0) + 1)
+            started = time.perf_counter()
+            try:
+                with tel.phase("solve"):
+                    # 재시도는 캐시를 거치지 않고 다시 계산
+                    result = bootstrap_cached(day_inputs, cache if attempt == 0 else None, tel)
+                    _check_result(result)
+                file_name = f"curve_{date_str}.json"
+                with tel.phase("write"):
+                    atomic_write_text(os.path.join(output_dir, file_name),
+                                      json.dumps(result.to_dict(), ensure_ascii=False))
+                    if store is not None and (store.last_date is None or today > store.last_date):
+                        store.append(result)
+                manifest.record({'date': date_str, 'status': 'ok', 'file': file_name,
+                                 'seconds': time.perf_counter() - started,
+                                 'finished_at': datetime.now().isoformat(timespec='seconds')})
+                summary['completed'].append(date_str)
+                print(f"[{date_str}] 완료")
+                break
+            except Exception as e:
+                tel.fail(e)
+                manifest.record({'date': date_str, 'status': 'error', 'attempt': manifest.attempts.get(date_str, 0) + 1,
+                                 'seconds': time.perf_counter() - started,
+                                 'finished_at': datetime.now().isoformat(timespec='seconds'),
+                                 **_diagnostics(e, day_inputs)})
+                print(f"[{date_str}] 에러 (시도 {attempt + 1}/{retries + 1}): {e}")
+                if attempt < retries and retry_delay:
+                    time.sleep(retry_delay)
+            finally:
+                tel.finish()
+        else:
+            summary['failed'].append(date_str)
+
+    if telemetry_path:
+        write_jsonl(telemetry_path, {'run_type': 'krw_curve_backfill_summary', 'start': str(start)[:10],
+                                     'end': str(end)[:10], 'business_days': len(days),
+                                     **{k: len(v) for k, v in summary.items()},
+                                     'failed_dates': summary['failed']})
+    print(f"backfill 종료: 완료 {len(summary['completed'])}, 건너뜀 {len(summary['skipped'])}, "
+          f"실패 {len(summary['failed'])}, 시도 초과 {len(summary['exhausted'])}, 호가 없음 {len(summary['no_quotes'])}")
+    return summary
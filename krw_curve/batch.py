@@ -0,0 +1,152 @@
+"""
+기준일 범위 배치 (엑셀 없이 CurveInputs 의 Today 만 바꿔가며 부트스트랩)
+
+BatchBootstrapper.run_batch 의 엑셀 재계산/차트 저장 없이, 날짜별 결과 JSON 과
+배치 요약을 telemetry JSON Lines 로 남깁니다. store(CurveStore)를 주면 날짜별 커브를 이력 저장소에도 덧붙입니다.
+quotes(QuoteHistory)를 주면 기준일마다 그날의 과거 호가를 사용하고, 호가가 없는 날짜는 건너뜁니다.
+결과 JSON / 차트 쓰기는 RenderStage(pipeline) 에서 계산과 겹쳐 실행됩니다.
+vectorized=True 면 인스트루먼트 구성이 같은 기준일들을 multidate.bootstrap_dates 로 한 번에 풉니다.
+"""
+
+import json
+import os
+import time
+from datetime import timedelta
+
+from .bootstrap import ENGINE_VERSION, BootstrapResult, bootstrap_curve
+from .cache import curve_key
+from .dates import to_datetime
+from .pipeline import DEFAULT_RENDER_WORKERS, RenderStage
+from .schedule import schedule_cache_info
+from .telemetry import RunTelemetry, write_jsonl
+
+
+def date_range(start, end, weekdays_only=True):
+    d, end = to_datetime(start), to_datetime(end)
+    while d <= end:
+        if not weekdays_only or d.weekday() < 5:
+            yield d
+        d += timedelta(days=1)
+
+
+def bootstrap_cached(inputs, cache=None, telemetry=None):
+    """캐시 히트 시 저장된 결과, 미스 시 부트스트랩 후 저장"""
+    key = None
+    if cache is not None:
+        key = curve_key(inputs.today, inputs.basis, inputs.freq, inputs.tenors, inputs.types, inputs.rates,
+                        inputs.jump_dates, ENGINE_VERSION)
+        hit = cache.get(key)
+        if telemetry is not None:
+            telemetry.context['cache_hit'] = hit is not None
+        if hit is not None:
+            return BootstrapResult.from_dict(hit)
+    result = bootstrap_curve(inputs, telemetry=telemetry)
+    if cache is not None:
+        cache.put(key, result.to_dict())
+    return result
+
+
+_CHART_TEMPLATES = {}  # 출력 worker(스레드/프로세스)가 공유하는 차트 템플릿 (처음 한 번만 생성)
+
+
+def write_outputs(result_dict, output_dir, date_str, chart=False):
+    """출력 단계: 결과 JSON + (옵션) HTML 차트. 프로세스 풀에서도 실행되도록 dict 로 받음"""
+    start = time.perf_counter()
+    with open(os.path.join(output_dir, f"curve_{date_str}.json"), 'w', encoding='utf-8') as f:
+        json.dump(result_dict, f, ensure_ascii=False)
+    written = None
+    if chart:
+        from .charts import figure_template, write_html
+        result = BootstrapResult.from_dict(result_dict)
+        template = _CHART_TEMPLATES.get('batch')
+        if template is None:
+            template = _CHART_TEMPLATES['batch'] = figure_template(result)
+        written = write_html(result, os.path.join(output_dir, f"chart_{date_str}.html"), template)
+    return {'seconds': time.perf_counter() - start, 'chart_written': written}
+
+
+def _solve_vectorized(days, cache):
+    """캐시에 없는 기준일을 모아 기준일 축 벡터화 부트스트랩 (multidate.bootstrap_dates) 으로 한 번에 풀이"""
+    from .multidate import bootstrap_dates
+
+    solved, missing = {}, []
+    for _, date_str, day_inputs in days:
+        hit = key = None
+        if cache is not None:
+            key = curve_key(day_inputs.today, day_inputs.basis, day_inputs.freq, day_inputs.tenors, day_inputs.types,
+                            day_inputs.rates, day_inputs.jump_dates, ENGINE_VERSION)
+            hit = cache.get(key)
+        if hit is not None:
+            solved[date_str] = BootstrapResult.from_dict(hit)
+        else:
+            missing.append((date_str, day_inputs, key))
+    for (date_str, _, key), result in zip(missing, bootstrap_dates([m[1] for m in missing])):
+        solved[date_str] = result
+        if cache is not None:
+            cache.put(key, result.to_dict())
+    return solved, len(missing)
+
+
+def run_batch(inputs, start, end, output_dir, cache=None, telemetry_path=None, chart=False, store=None,
+              quotes=None, render_workers=DEFAULT_RENDER_WORKERS, render_executor='thread', vectorized=False):
+    """기준일별 계산은 이 스레드에서, 결과 JSON / 차트 쓰기는 RenderStage worker 에서 (render_workers=0 이면 순차)
+
+    vectorized=True 면 모든 기준일을 먼저 기준일 축 배열 Newton 으로 한 번에 푼 뒤 출력만 기준일별로 진행
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    batch_start = time.perf_counter()
+    days = []
+    for today in date_range(start, end):
+        date_str = today.strftime('%Y-%m-%d')
+        if quotes is not None and today not in quotes:
+            print(f"[{date_str}] 과거 호가 없음, 건너뜀")
+            continue
+        days.append((today, date_str, inputs.with_today(today) if quotes is None else quotes.inputs_for(today, inputs)))
+    solved, vector_solved = {}, 0
+    if vectorized:
+        solve_start = time.perf_counter()
+        solved, vector_solved = _solve_vectorized(days, cache)
+        print(f"기준일 {len(days)}개 중 {vector_solved}개 벡터화 부트스트랩 ({time.perf_counter() - solve_start:.3f}초)")
+    stage = RenderStage(render_workers, executor=render_executor) if render_workers > 0 else None
+    try:
+        for today, date_str, day_inputs in days:
+            tel = RunTelemetry("krw_curve_batch_date", telemetry_path, track_memory=False, today=date_str)
+            try:
+                with tel.phase("solve"):
+                    result = solved.pop(date_str, None) or bootstrap_cached(day_inputs, cache, tel)
+                # stage 가 있으면 queue 에 넣는 시간(대기 포함)만 기록
+                with tel.phase("write"):
+                    if stage is None:
+                        write_outputs(result.to_dict(), output_dir, date_str, chart)
+                    else:
+                        stage.submit(write_outputs, result.to_dict(), output_dir, date_str, chart, label=date_str)
+                    # 저장소는 덧붙이기 전용 (backfill 과 같은 조건) - 마지막 기준일까지의 날짜는 결과 JSON 만 씀
+                    skip_store = store is not None and store.last_date is not None and today <= store.last_date
+                    if store is not None and not skip_store:
+                        store.append(result)
+                results.append(result)
+                if skip_store:
+                    print(f"[{date_str}] 완료 (저장소에 {store.last_date:%Y-%m-%d} 까지 있어 저장소 추가는 건너뜀)")
+                else:
+                    print(f"[{date_str}] 완료")
+            except Exception as e:
+                tel.fail(e)
+                print(f"[{date_str}] 에러: {e}")
+            finally:
+                tel.finish()
+    finally:
+        if stage is not None:
+            stage.close()
+    render_errors = {} if stage is None else stage.errors
+    for date_str, error in sorted(render_errors.items()):
+        print(f"[{date_str}] 출력 에러: {error}")
+    if telemetry_path:
+        render = {} if stage is None else {
+            **stage.stats, 'output_s': sum(r['seconds'] for r in stage.results.values()), 'errors': render_errors}
+        write_jsonl(telemetry_path, {'run_type': 'krw_curve_batch_summary', 'start': str(start)[:10],
+                                     'end': str(end)[:10], 'dates': len(results),
+                                     'wall_s': time.perf_counter() - batch_start, 'render': render,
+                                     'vectorized': vectorized, 'vector_solved': vector_solved,
+                                     'schedule_cache': schedule_cache_info()})
+    return results
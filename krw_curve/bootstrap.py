@@ -0,0 +1,330 @@
+"""
+순차 부트스트랩 엔진 (NumPy 전용)
+
+HybridReporter.npv_error_internal 과 동일한 가정을 사용합니다.
+    - Deposit : (1 + r * yf(Today, Mty)) * DF(Mty) - 1 = 0
+    - IRS     : Σ r * yf_j * DF(t_j) - (1 - DF(t_n)) = 0,
+                지급일 = 만기에서 거꾸로 월 단위 roll + Modified Following (schedule.coupon_schedule)
+    - OIS   : KOFR OIS. 고정 leg 는 1년 이하 만기 1회, 그 이상은 연 1회 (OIS_PERIOD_MONTHS).
+              변동 leg(일별 복리 KOFR)는 구간마다 DF(s)/DF(e) - 1 을 지급일 DF(=DF(e))로 할인한 합이라
+              Σ (DF(s_j) - DF(e_j)) = 1 - DF(t_n) 로 telescoping -> IRS 와 같은 식 (일별 복리 루프 없음)
+    - 인스트루먼트 i 는 자신의 Jump Date 구간 forward f_i 하나를 결정
+      (영업일 조정된 마지막 지급일이 Jump Date 를 넘으면 구간 끝을 그 지급일로, dates.extend_jump_dates)
+    - 시점 t 와 accrual yf 는 모두 Common 의 DayCount Basis 로 계산 (daycount.year_fraction)
+
+i 번째 단계에서 이전 구간 forward 는 확정되어 있으므로 각 현금흐름 DF 는
+    DF(t_j) = exp(A_j - f_i * w_j),  w_j = max(0, t_j - T_{i-1})
+꼴이 되어 NPV 와 그 도함수를 현금흐름 배열 연산 한 번으로 계산하는 Newton 으로 풉니다.
+수렴하지 않는 경우에만 scipy.optimize.brentq 를 지연 import 하여 사용합니다.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+
+from .curve import ForwardCurve
+from .dates import assign_jump_dates, calc_mty_date, day_offsets, extend_jump_dates, tenor_months, to_datetime
+from .daycount import year_fraction
+from .inputs import CurveInputs
+from .schedule import DEFAULT_CONVENTION, coupon_schedule, period_months_for_freq
+
+# 계산 규칙이 바뀌면 올려서 캐시 결과를 무효화
+ENGINE_VERSION = "krw-curve-newton-5"
+
+OIS_TYPES = ("ois", "kofr", "kofr ois")
+OIS_PERIOD_MONTHS = 12
+
+
+def is_ois(inst_type):
+    return str(inst_type).strip().lower() in OIS_TYPES
+
+
+def coupon_period_months(inst_type, tenor_months, freq):
+    """고정 leg 지급 주기(월). IRS 는 Freq, OIS 는 1년 이하 만기 1회 / 그 이상 연 1회"""
+    if is_ois(inst_type):
+        return min(tenor_months, OIS_PERIOD_MONTHS)
+    return period_months_for_freq(freq)
+
+
+def instrument_accruals(today, tenor, inst_type, mty_date, freq, basis="ACT/365", convention=DEFAULT_CONVENTION,
+                        holidays=None):
+    """(Today 로부터 지급일까지 일수 배열, 구간 year fraction 배열)
+
+    Deposit 과 주/일 단위 테너는 만기 1회 지급, IRS / OIS 는 월 단위 roll 스케줄 (schedule.coupon_schedule)
+    """
+    months = tenor_months(tenor)
+    if str(inst_type).lower() == "deposit" or months is None:
+        mty_day = int(day_offsets(today, [mty_date])[0])
+        today_ord = to_datetime(today).toordinal()
+        return np.array([mty_day]), year_fraction([today_ord], [today_ord + mty_day], basis)
+    sched = coupon_schedule(today, months, coupon_period_months(inst_type, months, freq), convention=convention,
+                            basis=basis, holidays=holidays)
+    return sched.payment_days(), sched.accruals
+
+
+def instrument_cashflows(today, tenor, inst_type, rate, mty_date, freq, basis="ACT/365", convention=DEFAULT_CONVENTION,
+                         holidays=None):
+    """NPV = Σ amounts * DF(days) - 1 이 되도록 (일수 배열, 금액 배열) 반환"""
+    days, accruals = instrument_accruals(today, tenor, inst_type, mty_date, freq, basis, convention, holidays)
+    amounts = rate * accruals
+    amounts[-1] += 1.0  # Deposit 원금 / IRS 변동 leg 1 - DF(Mty) 를 좌변으로 이항
+    return days, amounts
+
+
+class BootstrapResult:
+    def __init__(self, inputs, curve, mty_dates, stats):
+        self.inputs = inputs
+        self.curve = curve
+        self.mty_dates = mty_dates
+        self.stats = stats
+
+    @property
+    def forwards(self):
+        return self.curve.forwards
+
+    def to_dict(self):
+        return {
+            'engine': ENGINE_VERSION,
+            'inputs': self.inputs.to_dict(),
+            'curve': self.curve.to_dict(),
+            'mty_dates': [d.strftime('%Y-%m-%d') for d in self.mty_dates],
+            'stats': self.stats,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(CurveInputs.from_dict(data['inputs']),
+                   ForwardCurve.from_dict(data['curve']),
+                   [to_datetime(d) for d in data['mty_dates']],
+                   data.get('stats', []))
+
+
+def _solve_step(amounts, A, w, x0, tol, max_iter):
+    """NPV(f) = Σ a exp(A - f w) - 1 = 0 을 Newton 으로 풀이. (f, 반복, 함수평가, 잔차, 수렴) 반환"""
+    f = float(x0)
+    calls = 0
+    for it in range(1, max_iter + 1):
+        disc = amounts * np.exp(A - f * w)
+        npv = disc.sum() - 1.0
+        deriv = -(disc * w).sum()
+        calls += 1
+        if deriv == 0.0:
+            break
+        step = npv / deriv
+        f -= step
+        if abs(step) < tol:
+            disc = amounts * np.exp(A - f * w)
+            return f, it, calls + 1, float(disc.sum() - 1.0), True
+    # Newton 실패 시 scipy 로 폴백 (지연 import)
+    def npv_of(x):
+        return float((amounts * np.exp(A - x * w)).sum() - 1.0)
+    try:
+        from scipy.optimize import brentq
+        root, info = brentq(npv_of, -0.5, 1.0, xtol=tol, full_output=True, disp=False)
+        return root, it + info.iterations, calls + info.function_calls, npv_of(root), bool(info.converged)
+    except (ImportError, ValueError):
+        return f, it, calls, npv_of(f), False
+
+
+def solve_sequential(pillar_times, cashflows, guesses, labels=None, telemetry=None, tol=1e-12, max_iter=50,
+                     start=0, forwards=None):
+    """연 환산 시점 기준 순차 부트스트랩 (날짜 엔진 / knot 엔진 공용)
+
+    pillar_times : 구간 끝 시점 (오름차순), 인스트루먼트 i 가 구간 i 의 forward 를 결정
+    cashflows    : 인스트루먼트별 (시점 배열, 금액 배열), NPV = Σ 금액 * DF(시점) - 1
+    start        : 이 인스트루먼트부터 다시 풀이 (앞 구간은 forwards 값을 그대로 사용)
+    반환: (forwards, stats) - stats 는 start 이후 인스트루먼트만
+    """
+    pillar_times = np.asarray(pillar_times, dtype=float)
+    n = len(pillar_times)
+    if len(cashflows) != n:
+        raise ValueError(f"인스트루먼트 수({len(cashflows)})와 knot 수({n})가 같아야 합니다.")
+    if np.any(np.diff(pillar_times) < 0):
+        raise ValueError("knot 시점은 오름차순이어야 합니다.")
+    labels = labels if labels is not None else [str(i) for i in range(n)]
+
+    # 현금흐름 -> knot 구간 매핑을 한 번에 계산 (전체 현금흐름을 하나의 배열로)
+    sizes = np.array([len(t) for t, _ in cashflows])
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    flat_t = np.concatenate([np.asarray(t, dtype=float) for t, _ in cashflows])
+    flat_a = np.concatenate([np.asarray(a, dtype=float) for _, a in cashflows])
+    flat_seg = np.searchsorted(pillar_times, flat_t, side='left')
+
+    starts = np.concatenate([[0.0], pillar_times])
+    if start > 0:
+        if forwards is None or len(forwards) != n:
+            raise ValueError("start > 0 이면 이전 forwards 전체가 필요합니다.")
+        forwards = np.array(forwards, dtype=float)
+    else:
+        forwards = np.zeros(n)
+    # pillar 시점 누적 log DF (0 시점 포함), start 이전 구간은 확정값
+    log_df_table = np.concatenate([[0.0], -np.cumsum(forwards * np.diff(starts))])
+    stats = []
+
+    for i in range(start, n):
+        sl = slice(bounds[i], bounds[i + 1])
+        t, amounts = flat_t[sl], flat_a[sl]
+        t_prev = starts[i]
+
+        # 확정된 구간(0 ~ T_{i-1})까지의 log DF
+        if i == 0:
+            A = np.zeros_like(t)
+        else:
+            tc = np.minimum(t, t_prev)
+            seg = np.minimum(flat_seg[sl], i - 1)
+            A = log_df_table[seg] - forwards[seg] * (tc - starts[seg])
+        w = np.maximum(t - t_prev, 0.0)
+
+        f, iterations, calls, residual, converged = _solve_step(amounts, A, w, guesses[i], tol, max_iter)
+        forwards[i] = f
+        log_df_table[i + 1] = log_df_table[i] - f * (pillar_times[i] - t_prev)
+
+        stats.append({'instrument': labels[i], 'iterations': iterations,
+                      'function_calls': calls, 'residual': residual, 'converged': converged})
+        if telemetry is not None:
+            telemetry.record_solve(i, labels[i], iterations, calls, residual, converged, f)
+    return forwards, stats
+
+
+def quote_jacobian(pillar_times, times, accruals, rates, forwards):
+    """d(forward_i)/d(quote_j) (N x N 하삼각) - 풀린 forward 에서 음함수 미분 (bump 재부트스트랩 없음)
+
+    모든 i 에서 NPV_i(f_0..f_i; q_i) = 0 이므로
+        (∂NPV/∂f) · dF/dq = -diag(∂NPV_i/∂q_i)
+        ∂NPV_i/∂f_k = -Σ_j 금액_ij DF(t_ij) overlap(t_ij, 구간 k),  ∂NPV_i/∂q_i = Σ_j accrual_ij DF(t_ij)
+    순차 구조라 ∂NPV/∂f 는 하삼각 (구간 k > i 는 NPV_i 에 영향 없음, 구간 i 는 만기 이후까지 외삽)
+    times / accruals : 인스트루먼트별 현금흐름 시점 / accrual 배열 (solve_sequential 과 같은 순서)
+    """
+    pillar_times = np.asarray(pillar_times, dtype=float)
+    forwards = np.asarray(forwards, dtype=float)
+    n = len(pillar_times)
+    sizes = np.array([len(t) for t in times])
+    bounds = np.concatenate([[0], np.cumsum(sizes)])[:-1]
+    owner = np.repeat(np.arange(n), sizes)
+    t = np.concatenate([np.asarray(x, dtype=float) for x in times])
+    acc = np.concatenate([np.asarray(x, dtype=float) for x in accruals])
+    starts = np.concatenate([[0.0], pillar_times[:-1]])
+
+    # 현금흐름 x 구간 overlap: 확정 구간(k < i)은 구간 폭까지, 자기 구간(k = i)은 만기까지
+    cols = np.arange(n)[None, :]
+    overlap = np.clip(np.minimum(t[:, None], pillar_times[None, :]) - starts[None, :], 0.0, None)
+    overlap = np.where(cols == owner[:, None], np.maximum(t - starts[owner], 0.0)[:, None], overlap)
+    overlap[cols > owner[:, None]] = 0.0
+
+    df = np.exp(-overlap @ forwards)
+    amounts = np.asarray(rates, dtype=float)[owner] * acc
+    amounts[np.cumsum(sizes) - 1] += 1.0
+    d_npv_df = -np.add.reduceat((amounts * df)[:, None] * overlap, bounds, axis=0)
+    d_npv_dq = np.add.reduceat(acc * df, bounds)
+    # 하삼각 구조이므로 위쪽 삼각은 정확히 0 (LU 반올림 잔여 제거)
+    return np.tril(-np.linalg.solve(d_npv_df, np.diag(d_npv_dq)))
+
+
+def forward_attribution(jacobian, quote_changes):
+    """forward 변화의 호가별 분해 (N x N, [i, j] = 호가 j 변화가 forward i 에 준 몫, 행 합 = 1차 근사 forward 변화)"""
+    return np.asarray(jacobian) * np.asarray(quote_changes, dtype=float)[None, :]
+
+
+class IncrementalBootstrap:
+    """Today / 테너 / Jump Date 가 고정되고 금리만 바뀌는 커브 (스트리밍 갱신용)
+
+    현금흐름 시점과 accrual 은 생성 시 한 번만 만들고, 금리가 바뀌면 금액 배열만 다시 계산합니다.
+    순차 부트스트랩이므로 금리가 바뀐 첫 인스트루먼트 이전의 forward 는 그대로 두고
+    그 이후만 이전 forward 를 초기값으로 다시 풉니다.
+    """
+
+    def __init__(self, inputs, tol=1e-12, max_iter=50):
+        self.inputs = inputs
+        self.tol = tol
+        self.max_iter = max_iter
+        today = inputs.today
+        self.mty_dates = [calc_mty_date(today, t) for t in inputs.tenors]
+        today_ord = today.toordinal()
+
+        self.times, self.accruals, last_days = [], [], []
+        for i in range(len(inputs)):
+            days, accruals = instrument_accruals(today, inputs.tenors[i], inputs.types[i], self.mty_dates[i],
+                                                 inputs.freq, inputs.basis)
+            self.times.append(year_fraction(today_ord, today_ord + days, inputs.basis))
+            self.accruals.append(accruals)
+            last_days.append(int(days[-1]))
+        # 마지막 지급일이 Jump Date 를 넘으면 구간을 지급일까지 (dates.extend_jump_dates)
+        pay_dates = [today + timedelta(days=d) for d in last_days]
+        self.pillar_dates = assign_jump_dates(self.mty_dates, extend_jump_dates(inputs.jump_dates, self.mty_dates,
+                                                                                pay_dates))
+        self.pillar_times = year_fraction(today_ord, today_ord + day_offsets(today, self.pillar_dates), inputs.basis)
+        self.index = {t: i for i, t in enumerate(inputs.tenors)}
+        self.rates = np.array(inputs.rates, dtype=float)
+        self.forwards = None
+        self.stats = [None] * len(inputs)
+        self._dirty = 0
+
+    def __len__(self):
+        return len(self.rates)
+
+    def set_rate(self, tenor, rate):
+        """테너의 금리 변경 (변경되었으면 True). 없는 테너는 KeyError"""
+        i = self.index[str(tenor).strip()]
+        rate = float(rate)
+        if rate == self.rates[i]:
+            return False
+        self.rates[i] = rate
+        self._dirty = min(self._dirty, i)
+        return True
+
+    @property
+    def dirty_from(self):
+        """다시 풀어야 하는 첫 인스트루먼트 (없으면 None)"""
+        return self._dirty if self._dirty < len(self) else None
+
+    def _cashflows(self):
+        flows = []
+        for t, acc, rate in zip(self.times, self.accruals, self.rates):
+            amounts = rate * acc
+            amounts[-1] += 1.0
+            flows.append((t, amounts))
+        return flows
+
+    def solve(self, telemetry=None):
+        """바뀐 구간부터 다시 풀고 BootstrapResult 반환"""
+        start = self._dirty
+        if start < len(self):
+            guesses = self.rates if self.forwards is None else self.forwards
+            self.forwards, stats = solve_sequential(self.pillar_times, self._cashflows(), guesses, self.inputs.tenors,
+                                                    telemetry, self.tol, self.max_iter,
+                                                    start=start, forwards=self.forwards if start > 0 else None)
+            self.stats[start:] = stats
+            self._dirty = len(self)
+        return self.result()
+
+    def jacobian(self):
+        """현재 해의 d(forward_i)/d(quote_j) (N x N). solve() 이후에 호출"""
+        if self.forwards is None or self.dirty_from is not None:
+            self.solve()
+        return quote_jacobian(self.pillar_times, self.times, self.accruals, self.rates, self.forwards)
+
+    def result(self):
+        inputs = self.inputs
+        if self.rates.tolist() != inputs.rates:
+            inputs = CurveInputs(inputs.today, inputs.tenors, inputs.types, self.rates.tolist(), inputs.jump_dates,
+                                 inputs.basis, inputs.freq)
+        curve = ForwardCurve(inputs.today, self.pillar_dates, self.forwards.copy(), inputs.basis)
+        return BootstrapResult(inputs, curve, self.mty_dates, list(self.stats))
+
+
+def bootstrap_curve(inputs, telemetry=None, tol=1e-12, max_iter=50):
+    """CurveInputs -> BootstrapResult (인스트루먼트 하나당 forward 하나)"""
+    return IncrementalBootstrap(inputs, tol, max_iter).solve(telemetry)
+
+
+def result_jacobian(result):
+    """BootstrapResult (캐시 / JSON 에서 읽은 결과 포함) -> d(forward_i)/d(quote_j). 스케줄만 다시 만들고 다시 풀지 않음"""
+    inputs, curve = result.inputs, result.curve
+    today_ord = inputs.today.toordinal()
+    times, accruals = [], []
+    for i in range(len(inputs)):
+        days, acc = instrument_accruals(inputs.today, inputs.tenors[i], inputs.types[i], result.mty_dates[i],
+                                        inputs.freq, inputs.basis)
+        times.append(year_fraction(today_ord, today_ord + days, inputs.basis))
+        accruals.append(acc)
+    return quote_jacobian(curve.pillar_times, times, accruals, inputs.rates, curve.forwards)
@@ -0,0 +1,172 @@
+"""
+Curve Cache
+
+입력값(Today, Basis, Freq, 인스트루먼트 Tenor/Type/Rate, JumpDates, 엔진 버전)의 해시를 키로
+부트스트랩 결과(Solved Forward 등)를 디스크에 저장하는 content-addressed 캐시입니다.
+입력이 같으면 재부트스트랩 대신 파일 한 개를 읽습니다.
+
+    - 저장 위치: Curve_Cache/<key 앞 2자리>/<key>.json
+    - 쓰기: 임시 파일 작성 후 os.replace (원자적) -> 여러 프로세스가 동시에 써도 깨진 파일이 보이지 않음
+    - LRU: 조회 시 파일 mtime 갱신, 전체 크기가 max_bytes를 넘으면 오래된 순서로 삭제
+      put 은 쓴 크기를 누적만 하고, 누적이 max_bytes 를 넘거나 EVICT_RESCAN_PUTS 번마다(다른 프로세스가 쓴 양 반영)만
+      디렉터리를 훑음 -> put 한 번의 비용이 캐시 항목 수에 비례하지 않음
+    - 정리는 max_bytes 의 EVICT_LOW_WATER 비율까지 (경계에서 put 마다 다시 정리하지 않도록)
+    - eviction은 lock 파일(O_EXCL)로 한 프로세스만 수행, 다른 프로세스가 지운 파일은 조용히 무시
+
+사용 예:
+    cache = CurveCache()
+    key = market_curve_key(today, basis, freq, market_data, jump_dates_list, "hybrid-newton-1")
+    hit = cache.get(key)
+    if hit is None:
+        ... 부트스트랩 ...
+        cache.put(key, {'solved_fwds': list(solved_fwds)})
+"""
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+from .fileio import TMP_PREFIX, atomic_write_text
+
+DEFAULT_CACHE_DIR = "Curve_Cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+LOCK_STALE_SECONDS = 60
+EVICT_RESCAN_PUTS = 256
+EVICT_LOW_WATER = 0.9
+
+
+def _date_str(d):
+    if isinstance(d, str):
+        return d[:10]
+    return d.strftime('%Y-%m-%d')
+
+
+def curve_key(today, basis, freq, tenors, types, rates, jump_dates, engine_version):
+    """입력값을 정규화한 JSON의 sha256 (16진수)"""
+    payload = {
+        'today': _date_str(today),
+        'basis': str(basis).upper().strip(),
+        'freq': str(freq),
+        'instruments': [
+            [str(t).upper().strip(), str(ty).lower().strip(), repr(float(r))]
+            for t, ty, r in zip(tenors, types, rates)
+        ],
+        'jump_dates': sorted(_date_str(d) for d in jump_dates),
+        'engine': str(engine_version),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def market_curve_key(today, basis, freq, market_data, jump_dates, engine_version):
+    """MarketTable DataFrame(Inst. Tenor / Type / Market Rate)에서 바로 키 생성"""
+    return curve_key(today, basis, freq,
+                     market_data['Inst. Tenor'].tolist(),
+                     market_data['Type'].tolist(),
+                     market_data['Market Rate'].tolist(),
+                     jump_dates, engine_version)
+
+
+class CurveCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._total = None  # 마지막 스캔 이후 누적 크기 추정 (None 이면 아직 스캔 전)
+        self._puts = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """캐시 히트 시 저장된 dict, 미스(또는 읽는 도중 삭제/손상) 시 None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        try:
+            os.utime(path, None)  # LRU: 최근 사용 시각 갱신
+        except FileNotFoundError:
+            pass
+        return entry.get('value')
+
+    def put(self, key, value):
+        """임시 파일에 쓴 뒤 os.replace로 원자적 교체, 누적 크기가 max_bytes를 넘을 때만 evict"""
+        path = self._path(key)
+        try:
+            old_size = os.stat(path).st_size
+        except FileNotFoundError:
+            old_size = 0
+        entry = {'key': key, 'created_at': datetime.now().isoformat(timespec='seconds'), 'value': value}
+        text = json.dumps(entry, default=str)
+        atomic_write_text(path, text)
+        self._puts += 1
+        if self._total is None or self._puts >= EVICT_RESCAN_PUTS:
+            self.evict()
+            return
+        self._total += len(text) - old_size  # ensure_ascii 기본값이므로 글자 수 = 바이트 수
+        if self._total > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json") or name.startswith(TMP_PREFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self):
+        """총 크기가 max_bytes를 넘으면 max_bytes * EVICT_LOW_WATER 이하가 될 때까지 가장 오래 사용되지 않은 항목부터 삭제"""
+        lock_path = os.path.join(self.cache_dir, ".evict.lock")
+        try:
+            lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # 다른 프로세스가 정리 중. 비정상 종료로 남은 오래된 lock이면 제거만 하고 이번엔 건너뜀
+            try:
+                if time.time() - os.stat(lock_path).st_mtime > LOCK_STALE_SECONDS:
+                    os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+            return 0
+
+        removed = 0
+        try:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes if total <= self.max_bytes else self.max_bytes * EVICT_LOW_WATER
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                total -= size
+            self._total, self._puts = total, 0
+        finally:
+            os.close(lock_fd)
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._total, self._puts = None, 0
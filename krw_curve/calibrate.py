@@ -0,0 +1,171 @@
+"""
+전역 최소자승 커브 캘리브레이션 (Jump Date 전체 구간 forward 를 모든 호가에 동시 적합)
+
+순차 부트스트랩은 인스트루먼트 하나가 새 Jump Date 구간 하나를 정한다고 가정합니다.
+18M 과 2Y 가 같은 금통위 날짜로 매핑되면 한 구간에 식이 두 개가 되고,
+인스트루먼트가 없는 Jump Date(예: 17개 날짜에 호가 7개)는 건너뛰게 됩니다.
+calibrate_curve 는 Today 이후 모든 Jump Date 를 구간 끝으로 하는 forward 벡터 f 를 한 번에 구합니다.
+
+    min_f  Σ_i r_i(f)^2  +  smoothness * Σ_k (f_k - f_{k-1})^2  +  ridge * Σ_k (f_k - f0_k)^2
+    r_i(f) = (Σ_j a_ij DF(t_ij) - 1) / annuity_i       (호가 단위 잔차, annuity 는 초기 커브 기준 고정)
+    log DF(t) = -Σ_k f_k * overlap(t, 구간 k)          (f 에 대해 선형 -> B: 현금흐름 x 구간 sparse 행렬)
+    dr_i/df_k = -Σ_j a_ij DF(t_ij) B_jk / annuity_i     (해석적 Jacobian, B 의 0 이 아닌 원소만 사용)
+
+    - B 는 COO(행, 열, 값) 배열로만 보관하고 Jacobian 은 np.bincount 로 조립 (scipy 불필요)
+    - Levenberg-Marquardt (K x K 정규방정식, K = 구간 수)
+    - 마지막 Jump Date 이후는 마지막 구간 forward 로 외삽 (ForwardCurve 와 동일)
+    - smoothness / ridge -> 0 이고 인스트루먼트와 구간이 1:1 이면 순차 부트스트랩과 같은 해
+      (knot_dates 를 생략하면 bootstrap_curve 와 같은 노드: 마지막 지급일까지 늘린 Jump Date, dates.extend_jump_dates)
+
+사용 예:
+    result = calibrate_curve(inputs, smoothness=1e-6)
+    result.curve.df(dates), result.stats[i]['residual']
+"""
+
+from datetime import timedelta
+
+import numpy as np
+
+from .bootstrap import BootstrapResult, instrument_accruals
+from .curve import ForwardCurve
+from .dates import calc_mty_date, day_offsets, extend_jump_dates
+from .daycount import year_fraction
+
+DEFAULT_SMOOTHNESS = 1e-6
+DEFAULT_RIDGE = 1e-12
+
+
+def overlap_matrix(times, knots):
+    """현금흐름 시점 x 구간 overlap 을 COO (rows, cols, vals) 로. 마지막 구간은 끝없이 연장"""
+    times = np.asarray(times, dtype=float)
+    knots = np.asarray(knots, dtype=float)
+    k = len(knots)
+    seg = np.minimum(np.searchsorted(knots, times, side='left'), k - 1)
+    counts = seg + 1
+    rows = np.repeat(np.arange(len(times)), counts)
+    cols = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    starts = np.concatenate([[0.0], knots])[cols]
+    ends = np.where(cols == k - 1, np.inf, knots[cols])
+    vals = np.clip(np.minimum(times[rows], ends) - starts, 0.0, None)
+    keep = vals > 0
+    return rows[keep], cols[keep], vals[keep]
+
+
+class LeastSquaresCurve:
+    """인스트루먼트 현금흐름과 구간 overlap 을 한 번 만들어 두고 forward 를 최소자승으로 적합"""
+
+    def __init__(self, inputs, knot_dates=None, smoothness=DEFAULT_SMOOTHNESS, ridge=DEFAULT_RIDGE, weights=None):
+        self.inputs = inputs
+        today = inputs.today
+        today_ord = today.toordinal()
+        self.mty_dates = [calc_mty_date(today, t) for t in inputs.tenors]
+
+        times, accruals, owner, pay_dates = [], [], [], []
+        for i in range(len(inputs)):
+            days, acc = instrument_accruals(today, inputs.tenors[i], inputs.types[i], self.mty_dates[i],
+                                            inputs.freq, inputs.basis)
+            times.append(year_fraction(today_ord, today_ord + days, inputs.basis))
+            accruals.append(acc)
+            owner.append(np.full(len(days), i))
+            pay_dates.append(today + timedelta(days=int(days[-1])))
+
+        # Jump Date 를 그대로 쓰면 bootstrap_curve 와 같은 노드 (마지막 지급일까지 늘린 구간)
+        if knot_dates is None:
+            dates = extend_jump_dates(inputs.jump_dates, self.mty_dates, pay_dates)
+        else:
+            dates = sorted(knot_dates)
+        self.knot_dates = [d for d in dates if d > today]
+        if not self.knot_dates:
+            raise ValueError("Today 이후 Jump Date 가 없습니다.")
+        self.knots = year_fraction(today_ord, today_ord + day_offsets(today, self.knot_dates), inputs.basis)
+        self.times = np.concatenate(times)
+        self.owner = np.concatenate(owner)
+        rates = np.asarray(inputs.rates, dtype=float)
+        self.accruals = np.concatenate(accruals)
+        self.amounts = rates[self.owner] * self.accruals
+        self.amounts[np.cumsum([len(t) for t in times]) - 1] += 1.0
+        self.B = overlap_matrix(self.times, self.knots)
+
+        k = len(self.knots)
+        self.weights = np.ones(len(inputs)) if weights is None else np.asarray(weights, dtype=float)
+        diff = np.diff(np.eye(k), axis=0)
+        self.smooth = smoothness * diff.T @ diff
+        self.ridge = ridge
+
+    def initial_forwards(self):
+        """구간 끝 이후 가장 먼저 만기가 오는 호가 (없으면 마지막 호가)"""
+        today_ord = self.inputs.today.toordinal()
+        mty = year_fraction(today_ord, today_ord + day_offsets(self.inputs.today, self.mty_dates), self.inputs.basis)
+        order = np.argsort(mty, kind='stable')
+        idx = np.minimum(np.searchsorted(mty[order], self.knots, side='left'), len(order) - 1)
+        return np.asarray(self.inputs.rates, dtype=float)[order][idx]
+
+    def log_dfs(self, f):
+        rows, cols, vals = self.B
+        return -np.bincount(rows, weights=vals * f[cols], minlength=len(self.times))
+
+    def residuals(self, f, scale):
+        disc = self.amounts * np.exp(self.log_dfs(f))
+        return (np.bincount(self.owner, weights=disc, minlength=len(scale)) - 1.0) * scale, disc
+
+    def jacobian(self, disc, scale):
+        rows, cols, vals = self.B
+        n, k = len(scale), len(self.knots)
+        flat = np.bincount(self.owner[rows] * k + cols, weights=-disc[rows] * vals, minlength=n * k)
+        return flat.reshape(n, k) * scale[:, None]
+
+    def solve(self, f0=None, tol=1e-12, max_iter=100):
+        """Levenberg-Marquardt. (forwards, 잔차, 반복 수, 잔차 계산 수, 수렴 여부) 반환"""
+        f = self.initial_forwards() if f0 is None else np.asarray(f0, dtype=float).copy()
+        prior = f.copy()
+        # 잔차를 호가 단위로: 초기 커브 기준 annuity 로 나눔 (반복 중에는 고정)
+        annuity = np.bincount(self.owner, weights=self.accruals * np.exp(self.log_dfs(f)), minlength=len(self.inputs))
+        scale = self.weights / annuity
+
+        def objective(x, r):
+            d = x - prior
+            return r @ r + x @ self.smooth @ x + self.ridge * (d @ d)
+
+        r, disc = self.residuals(f, scale)
+        cost = objective(f, r)
+        calls = 1
+        mu = 1e-3
+        converged = False
+        for it in range(1, max_iter + 1):
+            J = self.jacobian(disc, scale)
+            A = J.T @ J + self.smooth + self.ridge * np.eye(len(f))
+            g = J.T @ r + self.smooth @ f + self.ridge * (f - prior)
+            if np.max(np.abs(g)) < tol:
+                converged = True
+                break
+            # 목적함수가 줄어드는 step 만 받음. damping 이 상한에 닿으면 f 를 그대로 두고 미수렴으로 반환
+            while True:
+                step = np.linalg.solve(A + mu * np.diag(np.diag(A) + 1e-30), -g)
+                r_new, disc_new = self.residuals(f + step, scale)
+                calls += 1
+                cost_new = objective(f + step, r_new)
+                if cost_new <= cost:
+                    break
+                mu *= 10.0
+                if mu > 1e12:
+                    return f, r, it, calls, False
+            decrease = cost - cost_new
+            f, r, disc, cost = f + step, r_new, disc_new, cost_new
+            mu = max(mu / 10.0, 1e-12)
+            if decrease <= tol * cost and np.max(np.abs(step)) < tol:
+                converged = True
+                break
+        return f, r, it, calls, converged
+
+    def result(self, tol=1e-12, max_iter=100):
+        f, r, iterations, calls, converged = self.solve(tol=tol, max_iter=max_iter)
+        stats = [{'instrument': t, 'iterations': iterations, 'function_calls': calls, 'residual': float(res),
+                  'converged': converged} for t, res in zip(self.inputs.tenors, r)]
+        curve = ForwardCurve(self.inputs.today, self.knot_dates, f, self.inputs.basis)
+        return BootstrapResult(self.inputs, curve, self.mty_dates, stats)
+
+
+def calibrate_curve(inputs, smoothness=DEFAULT_SMOOTHNESS, ridge=DEFAULT_RIDGE, weights=None, knot_dates=None,
+                    tol=1e-12, max_iter=100):
+    """CurveInputs -> BootstrapResult (Today 이후 Jump Date 마다 forward 하나, stats 의 residual 은 호가 단위)"""
+    return LeastSquaresCurve(inputs, knot_dates, smoothness, ridge, weights).result(tol, max_iter)
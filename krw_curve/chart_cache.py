@@ -0,0 +1,69 @@
+"""
+Chart Cache
+
+차트에 그려지는 데이터와 레이아웃 옵션의 해시(fingerprint)를 HTML 첫 줄에 주석으로 기록하고,
+같은 fingerprint 의 파일이 이미 있으면 Figure 생성과 HTML 쓰기를 모두 건너뜁니다.
+
+    - 파일명: 고정 이름(예: Bootstrap_2026-01-15.html) 또는 fingerprinted_path 로 만든 내용 기반 이름
+    - 쓰기: 임시 파일 작성 후 os.replace (원자적)
+    - 차트 코드(트레이스 구성, 스타일)를 바꾸면 version 문자열을 올려서 기존 파일을 무효화
+
+사용 예:
+    fp = chart_fingerprint("irs-chart-1", df_plot, dict(width=1500, height=700))
+    write_html_if_changed("IRS_Bootstrap_Analysis.html", fp, lambda: build_figure(df_plot))
+"""
+
+import hashlib
+import json
+import os
+from datetime import date, datetime
+
+from .fileio import atomic_write_text
+
+FINGERPRINT_PREFIX = "<!-- chart-fingerprint: "
+
+
+def _default(obj):
+    # pandas / numpy 는 import 하지 않고 덕 타이핑으로 정규화
+    if hasattr(obj, 'to_json'):  # DataFrame / Series
+        return obj.to_json(orient='split', date_format='iso', double_precision=15)
+    if hasattr(obj, 'tolist'):  # ndarray / numpy scalar
+        return obj.tolist()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def chart_fingerprint(*parts):
+    """차트 입력(데이터, 옵션, 버전 문자열)의 sha256 (16진수)"""
+    blob = json.dumps(parts, default=_default, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def fingerprinted_path(prefix, fingerprint, directory=".", ext="html"):
+    """타임스탬프 대신 내용 해시로 만든 파일명 (같은 데이터면 같은 파일)"""
+    return os.path.join(directory, f"{prefix}_{fingerprint[:12]}.{ext}")
+
+
+def existing_fingerprint(path):
+    """기존 HTML 첫 줄의 fingerprint (없거나 형식이 다르면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            first = f.readline().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if first.startswith(FINGERPRINT_PREFIX) and first.endswith("-->"):
+        return first[len(FINGERPRINT_PREFIX):-3].strip()
+    return None
+
+
+def write_html_if_changed(path, fingerprint, build_figure, include_plotlyjs='cdn', **html_kwargs):
+    """fingerprint 가 같으면 기존 파일 재사용(False), 다르면 build_figure() 로 다시 생성(True)"""
+    if existing_fingerprint(path) == fingerprint:
+        return False
+
+    fig = build_figure()
+    html = fig.to_html(full_html=True, include_plotlyjs=include_plotlyjs, **html_kwargs)
+
+    atomic_write_text(path, f"{FINGERPRINT_PREFIX}{fingerprint} -->\n{html}")
+    return True
@@ -0,0 +1,101 @@
+"""
+차트 레이어 (단일 트레이스 렌더링)
+
+Jump Date 가이드라인(vline)과 구간별 Forward 선을 구간마다 add_vline / go.Scatter 로 추가하면
+레이아웃 계산 비용이 shape·trace 개수에 비례해 커집니다.
+여기서는 모든 가이드라인을 None 으로 끊은 scatter 트레이스 하나로,
+모든 Forward 구간을 점별 라벨을 가진 트레이스 하나로 만듭니다.
+
+    - 트레이스는 plotly 를 import 하지 않는 dict 로 반환 (fig.add_trace 에 그대로 전달 가능)
+    - 가이드라인은 범위 [0, 1] 로 고정된 보이지 않는 보조 y축(GUIDE_YAXIS)에 그려서
+      add_vline(yref='paper') 처럼 플롯 높이 전체를 덮음
+
+사용 예:
+    fig.add_trace(forward_segments_trace(starts, ends, fwds))
+    add_guide_lines(fig, jump_dates, dash="dash", color="rgba(150,150,150,0.5)")
+"""
+
+import numpy as np
+
+from .dates import to_datetime
+
+# 가이드라인 전용 보조 y축 (layout 키는 'yaxis9')
+GUIDE_YAXIS = "y9"
+
+
+def _unique_sorted(dates):
+    return sorted(set(d for d in dates if d is not None))
+
+
+def guide_axis_layout(overlaying="y"):
+    """가이드라인 보조 y축 설정 (0~1 고정, 숨김)"""
+    return dict(overlaying=overlaying, range=[0, 1], visible=False, fixedrange=True, showgrid=False, zeroline=False)
+
+
+def guide_lines_trace(dates, color="rgba(200,200,200,0.5)", width=1, dash="dot", name="Guide", yaxis=GUIDE_YAXIS):
+    """모든 날짜의 수직선을 하나의 트레이스로 (x: d, d, None 반복)"""
+    x, y = [], []
+    for d in _unique_sorted(dates):
+        x += [d, d, None]
+        y += [0, 1, None]
+    return dict(
+        type='scatter', x=x, y=y, yaxis=yaxis,
+        mode='lines', name=name, showlegend=False, hoverinfo='skip',
+        line=dict(color=color, width=width, dash=dash),
+    )
+
+
+def add_guide_lines(fig, dates, overlaying="y", **style):
+    """가이드라인 트레이스와 보조 y축을 fig 에 추가"""
+    fig.add_trace(guide_lines_trace(dates, **style))
+    fig.update_layout({"yaxis" + GUIDE_YAXIS[1:]: guide_axis_layout(overlaying)})
+    return fig
+
+
+def forward_segments_trace(start_dates, end_dates, forwards, name="Solved Forward", color='#2ca02c', width=3,
+                           label_fmt="<b>{:.2%}</b>", text_font=None, showlegend=False,
+                           hovertemplate="<b>Forward Rate: %{y:.4%}</b><br>Period: %{customdata}<extra></extra>"):
+    """구간별 Forward 계단선을 하나의 트레이스로 (구간마다 시작/중앙/끝 3점, 중앙에 라벨)"""
+    x, y, text, custom = [], [], [], []
+    for s, e, f in zip(start_dates, end_dates, forwards):
+        f = float(f)
+        mid = s + (e - s) / 2
+        period = f"<b>{s.strftime('%Y-%m-%d')}</b> ~ <b>{e.strftime('%Y-%m-%d')}</b>"
+        x += [s, mid, e, None]
+        y += [f, f, f, None]
+        text += ["", label_fmt.format(f) if label_fmt else "", "", ""]
+        custom += [period, period, period, None]
+    return dict(
+        type='scatter', x=x, y=y,
+        mode='lines+text' if label_fmt else 'lines', name=name, showlegend=showlegend,
+        line=dict(color=color, width=width), connectgaps=False,
+        text=text, textposition="top center",
+        textfont=text_font or dict(size=11, color="green"),
+        customdata=custom, hovertemplate=hovertemplate,
+    )
+
+
+def daily_step_arrays(start_date, end_dates, forwards, period_fmt="{} ~ {}"):
+    """구간마다 일 단위로 샘플링한 계단선 배열 (선 전체 호버용)
+
+    구간 [시작, 끝] 의 모든 날짜에 forward 값을 두고 구간 사이에 NaT / NaN / None 구분점을 넣습니다.
+    반환: x (datetime64[D]), y (float), customdata (구간 문자열, object)
+    """
+    ends = np.array([np.datetime64(to_datetime(d), 'D') for d in end_dates])
+    starts = np.concatenate([[np.datetime64(to_datetime(start_date), 'D')], ends[:-1]])
+    fwds = np.asarray(forwards, dtype=float)
+
+    # 구간별 점 개수 = (일수 + 1) + 구분점 1
+    lengths = np.maximum((ends - starts).astype(np.int64) + 1, 0) + 1
+    seg = np.repeat(np.arange(len(ends)), lengths)
+    offset = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    is_sep = offset == lengths[seg] - 1
+
+    x = starts[seg] + offset.astype('timedelta64[D]')
+    x[is_sep] = np.datetime64('NaT')
+    y = fwds[seg]
+    y[is_sep] = np.nan
+    periods = np.array([period_fmt.format(s, e) for s, e in zip(starts.astype(str), ends.astype(str))], dtype=object)
+    custom = periods[seg]
+    custom[is_sep] = None
+    return x, y, custom
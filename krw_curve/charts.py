@@ -0,0 +1,85 @@
+"""
+커브 차트 (plotly 지연 import)
+
+HybridReporter.build_figure 와 같은 구성(Market Rate 점 + 구간별 Solved Forward 계단선)입니다.
+배치에서는 figure_template 으로 만든 dict 템플릿에 날짜별 데이터만 교체하여 씁니다.
+"""
+
+from .chart_cache import chart_fingerprint, write_html_if_changed
+
+# 차트 구성이 바뀌면 올려서 이전 HTML을 무효화
+CHART_VERSION = "krw-curve-chart-1"
+
+
+def curve_traces(result):
+    """결과마다 바뀌는 차트 데이터 (트레이스 index -> 속성)"""
+    inputs, curve = result.inputs, result.curve
+
+    # 구간 시작/끝 두 점만 찍은 계단선 (None 으로 구간 분리)
+    step_x, step_y, step_text = [], [], []
+    p_date = curve.today
+    for c_date, f_rate in zip(curve.pillar_dates, curve.forwards):
+        if c_date <= p_date:
+            continue
+        period_str = f"<b>{p_date.strftime('%Y-%m-%d')} ~ {c_date.strftime('%Y-%m-%d')}</b>"
+        step_x += [p_date, c_date, None]
+        step_y += [float(f_rate), float(f_rate), None]
+        step_text += [period_str, period_str, None]
+        p_date = c_date
+
+    return {
+        0: dict(x=list(result.mty_dates), y=list(inputs.rates), text=[f"{r:.2%}" for r in inputs.rates]),
+        1: dict(x=step_x, y=step_y, customdata=step_text),
+    }
+
+
+def chart_title(result):
+    return f"IRS Forward Curve Analysis ({result.curve.today.strftime('%Y-%m-%d')})"
+
+
+def build_figure(result):
+    import plotly.graph_objects as go
+
+    traces = curve_traces(result)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        **traces[0],
+        mode='markers+text', name='Market Rate',
+        textposition="top center",
+        marker=dict(size=10, color='gray'),
+        hovertemplate="<b>Market Rate</b><br>Date: %{x|%Y-%m-%d}<br>Rate: %{y:.4%}<extra></extra>"
+    ))
+    fig.add_trace(go.Scatter(
+        **traces[1],
+        mode='lines', name='Solved Forward',
+        line=dict(color='red', width=3),
+        hovertemplate="<b>Forward Rate</b><br>Rate: %{y:.4%}<br>Period: %{customdata}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=dict(text=chart_title(result), x=0.5, font=dict(size=22)),
+        xaxis=dict(title="Timeline", type='date', tickformat='%Y-%m-%d', tickangle=-45, gridcolor='#eee'),
+        yaxis=dict(title="Rate (%)", tickformat=".2%", gridcolor='#eee'),
+        template="plotly_white", width=1200, height=700,
+        hovermode="closest"
+    )
+    return fig
+
+
+def figure_template(result):
+    """build_figure 를 한 번만 검증하여 만든 dict 템플릿 (배치용)"""
+    from .fast_figure import FigureTemplate
+    return FigureTemplate.from_figure(build_figure(result))
+
+
+def render_fast(result, template):
+    title = {**template.layout['title'], 'text': chart_title(result)}
+    return template.render(curve_traces(result), {'title': title})
+
+
+def write_html(result, output_path, template=None):
+    """커브 내용이 같으면 기존 HTML 재사용. 새로 썼으면 True (template 이 있으면 dict 경로로 생성)"""
+    fingerprint = chart_fingerprint(CHART_VERSION, result.curve.to_dict(), result.inputs.rates,
+                                    [d.strftime('%Y-%m-%d') for d in result.mty_dates])
+    if template is not None:
+        return write_html_if_changed(output_path, fingerprint, lambda: render_fast(result, template))
+    return write_html_if_changed(output_path, fingerprint, lambda: build_figure(result))
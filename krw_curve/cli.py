@@ -0,0 +1,435 @@
+"""
+명령행 진입점: python -m krw_curve <bootstrap|batch|backfill|chart|report|daily|fra|stream|serve|history|scenarios|nodes|reprice>
+
+무거운 의존성(xlwings, pandas, plotly, scipy)은 해당 서브커맨드가 실행될 때만 import 합니다.
+"""
+
+import argparse
+import json
+import sys
+
+from .cache import DEFAULT_CACHE_DIR
+
+
+def _load_inputs(args):
+    from .inputs import load_csv, load_json
+    if args.inputs:
+        inputs = load_json(args.inputs)
+    elif args.market and args.jumps:
+        if not args.today:
+            raise SystemExit("--market/--jumps 사용 시 --today 가 필요합니다.")
+        inputs = load_csv(args.market, args.jumps, args.today, args.basis, args.freq)
+    elif args.workbook:
+        from .excel_io import open_book, read_workbook_inputs
+        inputs = read_workbook_inputs(open_book(args.workbook))
+    else:
+        raise SystemExit("--inputs, --market/--jumps, --workbook 중 하나를 지정해 주세요.")
+    if args.today:
+        inputs = inputs.with_today(args.today)
+    return inputs
+
+
+def _load_result(path):
+    from .bootstrap import BootstrapResult
+    with open(path, encoding='utf-8') as f:
+        return BootstrapResult.from_dict(json.load(f))
+
+
+def _cache(args):
+    if args.no_cache:
+        return None
+    from .cache import CurveCache
+    return CurveCache(args.cache_dir)
+
+
+def cmd_bootstrap(args):
+    from .batch import bootstrap_cached
+    from .telemetry import RunTelemetry
+
+    if args.lsq and args.jacobian:
+        raise SystemExit("--jacobian 은 순차 부트스트랩 결과에만 사용할 수 있습니다 (--lsq 제외).")
+    if args.lsq and args.write_back:
+        # MarketTable 은 인스트루먼트당 forward 하나 - 전역 적합은 Jump Date 마다 하나라서 행이 맞지 않음
+        raise SystemExit("--lsq 결과는 MarketTable 에 기록할 수 없습니다 (--write-back 제외).")
+    inputs = _load_inputs(args)
+    tel = RunTelemetry("krw_curve", args.telemetry, track_memory=args.telemetry is not None,
+                       today=inputs.today.strftime('%Y-%m-%d'))
+    try:
+        with tel.phase("solve"):
+            if args.lsq:
+                from .calibrate import calibrate_curve
+                result = calibrate_curve(inputs, smoothness=args.smoothness, ridge=args.ridge)
+            else:
+                result = bootstrap_cached(inputs, _cache(args), tel)
+        with tel.phase("write"):
+            payload = json.dumps(result.to_dict(), ensure_ascii=False, indent=2)
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+            else:
+                print(payload)
+            if args.jacobian:
+                _write_jacobian(result, args.jacobian)
+            if args.workbook and args.write_back:
+                from .excel_io import open_book, write_result
+                write_result(open_book(args.workbook), result)
+    except Exception as e:
+        tel.fail(e)
+        raise
+    finally:
+        tel.finish()
+
+
+def _write_jacobian(result, path):
+    import csv
+    from .bootstrap import result_jacobian
+
+    jac = result_jacobian(result)
+    tenors = result.inputs.tenors
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Forward", "Jump Date"] + [f"d/d {t}" for t in tenors])
+        for tenor, d, row in zip(tenors, result.curve.pillar_dates, jac):
+            writer.writerow([tenor, d.strftime('%Y-%m-%d')] + [repr(float(v)) for v in row])
+    print(f"호가 민감도(Jacobian) 저장 완료: {path}")
+
+
+def _quotes(args):
+    if not args.quotes:
+        return None
+    from .quotes import QuoteHistory
+    quotes = QuoteHistory.load(args.quotes)
+    print(f"과거 호가 로드: {args.quotes} ({len(quotes)}개 날짜, {len(quotes.ords)}건)")
+    return quotes
+
+
+def cmd_batch(args):
+    from .batch import run_batch
+    inputs = _load_inputs(args)
+    store = None
+    if args.store:
+        from .store import CurveStore
+        store = CurveStore(args.store)
+    run_batch(inputs, args.start, args.end, args.output_dir, _cache(args), args.telemetry, args.chart, store,
+              _quotes(args), args.render_workers, 'process' if args.render_processes else 'thread', args.vectorized)
+
+
+def cmd_backfill(args):
+    from .backfill import run_backfill
+    holidays = None
+    if args.holidays:
+        from .inputs import _read_csv_rows
+        holidays = [r['Date'] for r in _read_csv_rows(args.holidays) if r.get('Date')]
+    store = None
+    if args.store:
+        from .store import CurveStore
+        store = CurveStore(args.store)
+    summary = run_backfill(_load_inputs(args), args.start, args.end, args.output_dir, _cache(args), args.telemetry,
+                           holidays, args.retries, args.max_attempts, store, quotes=_quotes(args))
+    if summary['failed']:
+        print(f"실패한 날짜 (진단: {args.output_dir}/manifest.jsonl): {', '.join(summary['failed'])}")
+        return 1
+    return 0
+
+
+def cmd_chart(args):
+    from .charts import write_html
+    if write_html(_load_result(args.curve), args.output):
+        print(f"차트 저장 완료: {args.output}")
+    else:
+        print(f"커브 변경 없음, 기존 차트 재사용: {args.output}")
+
+
+def cmd_report(args):
+    from .report import write_csv
+    write_csv(_load_result(args.curve), args.output)
+    print(f"검증 리포트 저장 완료: {args.output}")
+
+
+def cmd_daily(args):
+    import csv
+    curve = _load_result(args.curve).curve
+    days = None if args.years is None else int(round(args.years * 365.25))
+    daily = curve.daily(days)
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Date", "DF", "Zero", "Overnight Forward"])
+        writer.writerows(zip(daily['dates'].astype(str), daily['df'].tolist(), daily['zero'].tolist(),
+                             daily['overnight'].tolist()))
+    print(f"일별 커브 저장 완료: {args.output} ({len(daily['dates'])}일)")
+
+
+def cmd_fra(args):
+    import csv
+    import numpy as np
+    from .inputs import _read_csv_rows
+    from .pricing import period_forwards
+
+    curve = _load_result(args.curve).curve
+    rows = [r for r in _read_csv_rows(args.periods) if r.get('Start') and r.get('End')]
+    basis = [r.get('Basis') or curve.basis for r in rows]
+    fwds = period_forwards(curve, [r['Start'] for r in rows], [r['End'] for r in rows], basis, args.compounding)
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Start", "End", "Basis", "Forward"])
+        for r, b, fwd in zip(rows, basis, fwds.tolist()):
+            writer.writerow([r['Start'][:10], r['End'][:10], b, repr(fwd)])
+    print(f"구간 forward 저장 완료: {args.output} ({len(rows)}개 구간)")
+    started = int(np.isnan(fwds).sum())
+    if started:
+        print(f"  시작일이 커브 Today 이전인 {started}개 구간은 NaN 으로 기록")
+
+
+def cmd_stream(args):
+    from .stream import CurveStream
+    stream = CurveStream(_load_inputs(args), args.output, args.telemetry)
+    print(f"feed 대기 중: {args.feed} -> {args.output}")
+    summary = stream.run(args.feed, args.poll_ms / 1000.0, args.from_start, args.max_refreshes, args.idle_timeout)
+    lat = summary['latency_ms']
+    if lat['count']:
+        print(f"갱신 {lat['count']}회, 지연(ms) p50 {lat['p50']:.2f} / p90 {lat['p90']:.2f} / "
+              f"p99 {lat['p99']:.2f} / max {lat['max']:.2f}")
+    print(json.dumps(summary, ensure_ascii=False))
+
+
+def cmd_serve(args):
+    from .service import run
+    run(args.host, args.port, args.workers, _cache(args))
+
+
+def cmd_history(args):
+    import csv
+    from .store import CurveStore
+
+    store = CurveStore(args.store)
+    columns = {}
+    for tenor in args.tenors or []:
+        dates, columns[f"{args.measure}_{tenor}"] = store.query(tenor, args.measure, args.start, args.end)
+    for pair in args.forward or []:
+        s, e = pair.split(":")
+        dates, columns[f"fwd_{s}_{e}"] = store.forward_rates(s, e, args.start, args.end)
+    if args.events:
+        from .inputs import _read_csv_rows
+        events = [r['Date'] for r in _read_csv_rows(args.events) if r.get('Date')]
+        dates, columns["event_fwd"] = store.event_forwards(events, args.start, args.end)
+    if not columns:
+        raise SystemExit("--tenors, --forward, --events 중 하나 이상을 지정해 주세요.")
+
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Date"] + list(columns))
+        for i, d in enumerate(dates):
+            writer.writerow([str(d)] + [repr(float(v[i])) for v in columns.values()])
+    print(f"이력 조회 저장 완료: {args.output} ({len(dates)}개 기준일)")
+
+
+def cmd_scenarios(args):
+    import csv
+    from .scenarios import random_scenarios, run_scenarios, shift_scenarios
+
+    inputs = _load_inputs(args)
+    if args.random:
+        quotes = random_scenarios(inputs.rates, args.random, args.vol_bp, args.seed)
+    else:
+        quotes = shift_scenarios(inputs.rates, args.shifts_bp or [0.0])
+    out = run_scenarios(inputs, quotes, args.workers)
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Scenario", "Converged"] + [f"rate_{t}" for t in out['tenors']]
+                        + [f"fwd_{d:%Y-%m-%d}" for d in out['pillar_dates']])
+        for i, (rates, fwds) in enumerate(zip(quotes, out['forwards'])):
+            writer.writerow([i, bool(out['converged'][i])] + [repr(float(r)) for r in rates]
+                            + [repr(float(x)) for x in fwds])
+    stats = out['stats']
+    print(f"시나리오 {stats['scenarios']}개 완료: {args.output} (worker {stats['workers']}개, {stats['wall_s']:.2f}초, "
+          f"미수렴 {int((~out['converged']).sum())}개)")
+    print(json.dumps(stats, ensure_ascii=False))
+
+
+def cmd_nodes(args):
+    import csv
+    from .nodes import compare_node_sets, maturity_nodes, write_overlay_html
+
+    inputs = _load_inputs(args)
+    node_sets = {"inputs": inputs.jump_dates, "maturities": maturity_nodes(inputs)}
+    if args.node_sets:
+        from .inputs import _read_csv_rows
+        for r in _read_csv_rows(args.node_sets):
+            if r.get('Scheme') and r.get('Jump Date'):
+                node_sets.setdefault(r['Scheme'], []).append(r['Jump Date'])
+    fits = compare_node_sets(inputs, node_sets, args.method, args.smoothness, args.workers)
+
+    columns = ['nodes', 'reprice_rmse_bp', 'reprice_max_bp', 'fwd_roughness_bp', 'fwd_max_jump_bp',
+               'fwd_total_variation_bp', 'converged']
+    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Scheme", "Method"] + columns)
+        for fit in fits:
+            writer.writerow([fit['name'], fit['method']] + [fit['stats'][c] for c in columns])
+    for fit in fits:
+        st = fit['stats']
+        print(f"[{fit['name']}] {fit['method']}: 노드 {st['nodes']}개, 재가격 RMSE {st['reprice_rmse_bp']:.3f}bp, "
+              f"forward 평활도 {st['fwd_roughness_bp']:.2f}bp")
+    print(f"노드 배치 비교 저장 완료: {args.output} ({len(fits)}개)")
+    if args.chart:
+        write_overlay_html(fits, args.chart)
+        print(f"비교 차트: {args.chart}")
+
+
+def cmd_reprice(args):
+    from .nodes import check_repricing, maturity_nodes
+
+    inputs = _load_inputs(args)
+    inputs_list = [inputs.with_today(d) for d in (args.dates or [inputs.today])]
+    if args.maturity_nodes:
+        inputs_list = [x.with_jump_dates(maturity_nodes(x)) for x in inputs_list]
+    rows = check_repricing(inputs_list, args.tol_bp)
+    for r in rows:
+        print(f"{r['today']} {r['engine']:<10} 최대 재가격 오차 {r['reprice_max_bp']:.2e}bp "
+              f"(주말 만기 {r['weekend_maturities']}개){'' if r['ok'] else '  <- 허용 오차 초과'}")
+    failed = sum(not r['ok'] for r in rows)
+    print(f"재가격 검사: {len(rows) - failed}/{len(rows)} 통과 (허용 오차 {args.tol_bp:g}bp)")
+    return 1 if failed else 0
+
+
+def _add_input_args(p):
+    p.add_argument("--inputs", help="CurveInputs JSON 경로")
+    p.add_argument("--market", help="MarketTable CSV (Inst. Tenor, Type, Market Rate)")
+    p.add_argument("--jumps", help="JumpDates CSV (Jump Date)")
+    p.add_argument("--workbook", help="엑셀 파일 (xlwings 필요)")
+    p.add_argument("--today", help="기준일 YYYY-MM-DD (입력값의 Today 를 덮어씀)")
+    p.add_argument("--basis", default="ACT/365")
+    p.add_argument("--freq", type=int, default=4)
+    p.add_argument("--telemetry", default=None, help="계측 JSON Lines 출력 경로")
+    p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    p.add_argument("--no-cache", action="store_true", help="부트스트랩 결과 캐시 사용 안 함")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="krw_curve", description="KRW IRS curve bootstrap")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("bootstrap", help="커브 한 개 부트스트랩 -> JSON")
+    _add_input_args(p)
+    p.add_argument("--output", help="결과 JSON 경로 (생략 시 표준출력)")
+    p.add_argument("--write-back", action="store_true", help="--workbook 의 MarketTable 에 결과 기록")
+    p.add_argument("--jacobian", default=None, help="d(forward)/d(호가) 행렬 CSV 경로")
+    p.add_argument("--lsq", action="store_true", help="순차 부트스트랩 대신 모든 Jump Date 구간 전역 최소자승 적합")
+    p.add_argument("--smoothness", type=float, default=1e-6, help="--lsq: 인접 구간 forward 차이 벌점")
+    p.add_argument("--ridge", type=float, default=1e-12, help="--lsq: 초기 forward 로 당기는 벌점")
+    p.set_defaults(func=cmd_bootstrap)
+
+    p = sub.add_parser("batch", help="기준일 범위 부트스트랩")
+    _add_input_args(p)
+    p.add_argument("--start", required=True)
+    p.add_argument("--end", required=True)
+    p.add_argument("--output-dir", default="Batch_Curves")
+    p.add_argument("--chart", action="store_true", help="날짜별 HTML 차트도 저장 (plotly 필요)")
+    p.add_argument("--render-workers", type=int, default=2, help="결과 JSON / 차트 쓰기 worker 수 (0: 순차)")
+    p.add_argument("--render-processes", action="store_true", help="출력 worker 를 스레드 대신 프로세스로")
+    p.add_argument("--vectorized", action="store_true", help="기준일 전체를 단계별 배열 Newton 으로 한 번에 풀이")
+    p.add_argument("--store", default=None, help="커브 이력 저장소 디렉터리 (날짜별 커브를 덧붙임)")
+    p.add_argument("--quotes", default=None, help="기준일별 과거 호가 CSV/Parquet (Date, Inst. Tenor, Type, Market Rate)")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("backfill", help="영업일 범위 부트스트랩 (체크포인트 / 중단 후 재개 / 실패 재시도)")
+    _add_input_args(p)
+    p.add_argument("--start", required=True)
+    p.add_argument("--end", required=True)
+    p.add_argument("--output-dir", default="Backfill")
+    p.add_argument("--holidays", help="휴일 CSV (Date 열), 주말과 함께 제외")
+    p.add_argument("--retries", type=int, default=2, help="실패 날짜를 같은 실행에서 다시 시도할 횟수")
+    p.add_argument("--max-attempts", type=int, default=6, help="실행을 거듭한 누적 시도가 이 값을 넘으면 건너뜀")
+    p.add_argument("--store", default=None, help="커브 이력 저장소 디렉터리 (완료된 커브를 덧붙임)")
+    p.add_argument("--quotes", default=None, help="기준일별 과거 호가 CSV/Parquet (Date, Inst. Tenor, Type, Market Rate)")
+    p.set_defaults(func=cmd_backfill)
+
+    p = sub.add_parser("chart", help="결과 JSON -> HTML 차트")
+    p.add_argument("--curve", required=True)
+    p.add_argument("--output", default="curve.html")
+    p.set_defaults(func=cmd_chart)
+
+    p = sub.add_parser("report", help="결과 JSON -> 현금흐름 검증 CSV")
+    p.add_argument("--curve", required=True)
+    p.add_argument("--output", default="validation.csv")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("daily", help="결과 JSON -> 매일의 DF / zero / overnight forward CSV")
+    p.add_argument("--curve", required=True)
+    p.add_argument("--years", type=float, default=None, help="기간 (년, 기본: 마지막 Jump Date 까지)")
+    p.add_argument("--output", default="curve_daily.csv")
+    p.set_defaults(func=cmd_daily)
+
+    p = sub.add_parser("fra", help="결과 JSON + (Start, End[, Basis]) 구간 CSV -> 구간 forward CSV")
+    p.add_argument("--curve", required=True)
+    p.add_argument("--periods", required=True, help="구간 CSV (Start, End, 선택: Basis)")
+    p.add_argument("--compounding", choices=["simple", "continuous"], default="simple")
+    p.add_argument("--output", default="period_forwards.csv")
+    p.set_defaults(func=cmd_fra)
+
+    p = sub.add_parser("stream", help="호가 feed(JSON Lines 파일) tail -> 커브 증분 갱신 및 게시")
+    _add_input_args(p)
+    p.add_argument("--feed", required=True, help="호가 JSON Lines 파일 ({\"tenor\": \"1Y\", \"rate\": 0.0325})")
+    p.add_argument("--output", default="live_curve.json", help="게시할 커브 JSON 경로 (원자적 교체)")
+    p.add_argument("--poll-ms", type=float, default=1.0, help="feed 확인 간격 (ms)")
+    p.add_argument("--from-start", action="store_true", help="feed 파일을 처음부터 읽음 (기본: 끝부터)")
+    p.add_argument("--max-refreshes", type=int, default=None, help="갱신 횟수 도달 시 종료")
+    p.add_argument("--idle-timeout", type=float, default=None, help="입력 없이 지난 초가 넘으면 종료")
+    p.set_defaults(func=cmd_stream)
+
+    p = sub.add_parser("serve", help="로컬 HTTP/JSON 커브 서비스 (asyncio)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--workers", type=int, default=None, help="계산용 프로세스 수 (기본: CPU 수)")
+    p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    p.add_argument("--no-cache", action="store_true", help="디스크 캐시 사용 안 함 (메모리 캐시만)")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("scenarios", help="금리 시나리오 다중 프로세스 부트스트랩 (shared_memory 입력)")
+    _add_input_args(p)
+    p.add_argument("--shifts-bp", type=float, nargs="*", help="평행 이동 시나리오 (bp, 예: -50 -25 0 25 50)")
+    p.add_argument("--random", type=int, default=0, help="테너별 정규 충격 시나리오 개수")
+    p.add_argument("--vol-bp", type=float, default=5.0, help="--random 충격 표준편차 (bp)")
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 0: 현재 프로세스)")
+    p.add_argument("--output", default="scenario_forwards.csv")
+    p.set_defaults(func=cmd_scenarios)
+
+    p = sub.add_parser("nodes", help="Jump Date 배치안 여러 개로 같은 호가 부트스트랩 / 적합 통계 비교")
+    _add_input_args(p)
+    p.add_argument("--node-sets", help="후보 노드 CSV (Scheme, Jump Date), inputs / maturities 배치는 항상 포함")
+    p.add_argument("--method", choices=["auto", "bootstrap", "lsq"], default="auto",
+                   help="auto: 같은 노드로 매핑되는 인스트루먼트가 있으면 lsq")
+    p.add_argument("--smoothness", type=float, default=0.0, help="lsq 인접 구간 forward 차이 벌점")
+    p.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 0: 현재 프로세스)")
+    p.add_argument("--output", default="node_comparison.csv")
+    p.add_argument("--chart", default=None, help="비교 차트 HTML 경로 (plotly 필요)")
+    p.set_defaults(func=cmd_nodes)
+
+    p = sub.add_parser("reprice", help="여러 기준일에서 부트스트랩 커브가 자기 호가를 다시 맞히는지 검사 (실패 시 종료 코드 1)")
+    _add_input_args(p)
+    p.add_argument("--dates", nargs="*", help="기준일 목록 (기본: 입력의 Today), 주말 만기가 생기는 날짜 포함 권장")
+    p.add_argument("--maturity-nodes", action="store_true", help="기준일마다 Jump Date 를 인스트루먼트 만기일로 교체")
+    p.add_argument("--tol-bp", type=float, default=1e-6, help="허용 재가격 오차 (bp)")
+    p.set_defaults(func=cmd_reprice)
+
+    p = sub.add_parser("history", help="커브 이력 저장소 -> 기준일별 시계열 CSV")
+    p.add_argument("--store", default="Curve_History")
+    p.add_argument("--tenors", nargs="*", help="조회할 테너 (예: 3M 10Y)")
+    p.add_argument("--measure", default="zero", choices=["df", "zero", "forward"])
+    p.add_argument("--forward", nargs="*", help="구간 forward (예: 1Y:2Y)")
+    p.add_argument("--events", help="이벤트 날짜 CSV (Date 열, 예: 금통위) -> 다음 이벤트 구간 forward")
+    p.add_argument("--start", default=None)
+    p.add_argument("--end", default=None)
+    p.add_argument("--output", default="curve_history.csv")
+    p.set_defaults(func=cmd_history)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
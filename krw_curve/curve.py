@@ -0,0 +1,153 @@
+"""
+Piecewise-flat instantaneous forward 커브
+
+Jump Date(pillar) 사이 구간마다 forward 가 일정하다고 가정합니다.
+    log DF(t) = -∫_0^t f(s) ds
+pillar 시점의 누적 log DF 표를 한 번 만들어 두고, 임의 시점 배열의 DF를
+searchsorted + 선형 계산으로 한 번에 구합니다. 마지막 pillar 이후는 마지막 forward 로 외삽합니다.
+(엑셀 LogLinearDF_Date 와 동일한 규칙)
+매일의 DF / zero / overnight forward 는 ForwardCurve.daily 가 일별 year fraction 증분의 누적합 한 번으로 구합니다.
+"""
+
+import numpy as np
+
+from .dates import day_offsets, to_datetime
+from .daycount import year_fraction
+
+DAYS_PER_YEAR = 365.0
+
+
+class PiecewiseFlatForward:
+    """연 환산 시점(knot) 기준 piecewise-flat forward 커브 (날짜 없이 year fraction 만 사용)
+
+    extrapolate=True  : 마지막 knot 이후 마지막 forward 로 외삽
+    extrapolate=False : 마지막 knot 이후 DF 고정 (np.interp 로 log DF 를 보간하던 스크립트와 동일)
+    """
+
+    def __init__(self, knot_times, forwards, extrapolate=True):
+        self.pillar_times = np.asarray(knot_times, dtype=float)
+        self.forwards = np.asarray(forwards, dtype=float)
+        self.extrapolate = extrapolate
+        self._starts = np.concatenate([[0.0], self.pillar_times])[:len(self.forwards)]
+
+        # pillar 시점 누적 log DF 표 (0 시점 포함)
+        widths = np.diff(np.concatenate([[0.0], self.pillar_times]))
+        self.log_df_table = np.concatenate([[0.0], -np.cumsum(self.forwards * widths)])
+
+    @classmethod
+    def from_node_dfs(cls, nodes, dfs, extrapolate=False):
+        """(0 시점 포함) 노드 / DF 표 -> 커브. 노드 사이 log DF 선형 보간과 같음"""
+        nodes = np.asarray(nodes, dtype=float)
+        log_dfs = np.log(np.asarray(dfs, dtype=float))
+        widths = np.diff(nodes)
+        safe = np.where(widths > 0, widths, 1.0)
+        forwards = np.where(widths > 0, -np.diff(log_dfs) / safe, 0.0)
+        return cls(nodes[1:], forwards, extrapolate)
+
+    def log_df_t(self, t):
+        """연 환산 시점 배열 t 의 log DF"""
+        t = np.asarray(t, dtype=float)
+        if len(self.forwards) == 0:
+            return np.zeros_like(t)
+        if not self.extrapolate:
+            t = np.minimum(t, self.pillar_times[-1])
+        # target <= pillar 이면 해당 구간 forward 사용 -> side='left'
+        seg = np.searchsorted(self.pillar_times, t, side='left')
+        seg = np.minimum(seg, len(self.forwards) - 1)
+        out = self.log_df_table[seg] - self.forwards[seg] * (t - self._starts[seg])
+        return np.where(t <= 0, 0.0, out)
+
+    def df_t(self, t):
+        return np.exp(self.log_df_t(t))
+
+    def forward_t(self, t):
+        seg = np.minimum(np.searchsorted(self.pillar_times, np.asarray(t, dtype=float), side='left'),
+                         len(self.forwards) - 1)
+        return self.forwards[seg]
+
+
+class ForwardCurve(PiecewiseFlatForward):
+    """Jump Date(날짜) 기준 커브. 시점은 Today 로부터 Basis 별 year fraction (VBA LogLinearDF_Date 와 동일)"""
+
+    def __init__(self, today, pillar_dates, forwards, basis="ACT/365"):
+        self.today = to_datetime(today)
+        self.basis = basis
+        self.pillar_dates = [to_datetime(d) for d in pillar_dates]
+        self.pillar_days = day_offsets(self.today, self.pillar_dates)
+        super().__init__(self.day_times(self.pillar_days), forwards)
+
+    def day_times(self, days):
+        """Today 로부터 일수 배열 -> year fraction 배열"""
+        today_ord = self.today.toordinal()
+        return year_fraction(today_ord, today_ord + np.asarray(days, dtype=np.int64), self.basis)
+
+    def times(self, dates):
+        return self.day_times(day_offsets(self.today, dates))
+
+    def df(self, dates):
+        """날짜 배열의 Discount Factor"""
+        return self.df_t(self.times(dates))
+
+    def zero_rate(self, dates):
+        """연속복리 zero rate (-ln DF / t), t=0 은 첫 구간 forward"""
+        t = self.times(dates)
+        log_df = self.log_df_t(t)
+        safe_t = np.where(t > 0, t, 1.0)
+        return np.where(t > 0, -log_df / safe_t, self.forwards[0])
+
+    def instantaneous_forward(self, dates):
+        return self.forward_t(self.times(dates))
+
+    def daily(self, days=None, out=None):
+        """Today 부터 days 일까지 매일의 DF / zero / overnight forward (누적합 한 번)
+
+        Jump Date 는 일 단위이므로 하루 구간 (k, k+1] 의 forward 는 구간마다 일수만큼 반복한 값과 같고
+            log DF(k) = -Σ_{j<k} f_j (t_{j+1} - t_j)
+        를 np.cumsum 한 번으로 구합니다. 날짜마다 searchsorted 하지 않습니다.
+        days : 마지막 일수 (기본: 마지막 Jump Date), 마지막 Jump Date 이후는 마지막 forward 로 외삽
+        out  : {'df', 'zero', 'overnight'} 중 일부를 길이 days + 1 배열로 주면 그 배열에 바로 기록
+        반환: {'dates' (datetime64[D]), 'df', 'zero', 'overnight'(단리, [k, k+1] 구간), 'forward'(연속복리, 같은 구간)}
+        """
+        days = int(self.pillar_days[-1] if days is None else days)
+        out = out or {}
+        n = days + 1
+        # 하루 구간별 forward: 구간 i 가 차지하는 일수만큼 반복 (+ overnight 용 하루)
+        bounds = np.clip(np.asarray(self.pillar_days, dtype=np.int64), 0, n)
+        counts = np.diff(np.concatenate([[0], bounds]))
+        counts[-1] += n - bounds[-1]
+        fwd = np.repeat(self.forwards, counts)
+
+        t = self.day_times(np.arange(n + 1))
+        dt = np.diff(t)
+        log_df = np.empty(n)
+        log_df[0] = 0.0
+        np.cumsum(fwd[:-1] * dt[:-1], out=log_df[1:])
+        np.negative(log_df, out=log_df)
+
+        df = np.exp(log_df, out=out.get('df'))
+        zero = out.get('zero')
+        if zero is None:
+            zero = np.empty(n)
+        np.divide(-log_df, t[:n], out=zero, where=t[:n] > 0)
+        zero[t[:n] <= 0] = self.forwards[0]
+        zero[0] = self.forwards[0]
+        overnight = out.get('overnight')
+        if overnight is None:
+            overnight = np.empty(n)
+        # 30/360 등에서 하루 year fraction 이 0 이면 극한값 f
+        np.divide(np.expm1(fwd * dt), dt, out=overnight, where=dt > 0)
+        overnight[dt <= 0] = fwd[dt <= 0]
+        dates = np.datetime64(self.today.date(), 'D') + np.arange(n).astype('timedelta64[D]')
+        return {'dates': dates, 'df': df, 'zero': zero, 'overnight': overnight, 'forward': fwd}
+
+    def to_dict(self):
+        return {
+            'today': self.today.strftime('%Y-%m-%d'),
+            'pillar_dates': [d.strftime('%Y-%m-%d') for d in self.pillar_dates],
+            'forwards': self.forwards.tolist(),
+            'basis': self.basis,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['today'], data['pillar_dates'], data['forwards'], data.get('basis', "ACT/365"))
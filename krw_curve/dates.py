@@ -0,0 +1,145 @@
+"""
+날짜 / 테너 유틸리티 (NumPy + 표준 라이브러리만 사용)
+
+HybridReporter / BatchBootstrapper 의 calc_mty_date, parse_tenor, find_jump_date 와 동일한 규칙을
+함수로 제공하고, Jump Date 매핑은 searchsorted 로 한 번에 계산합니다.
+"""
+
+import calendar
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+
+def to_datetime(d):
+    """date / datetime / 'YYYY-MM-DD' 문자열을 datetime(자정)으로 정규화"""
+    if isinstance(d, datetime):
+        return datetime(d.year, d.month, d.day)
+    if isinstance(d, date):
+        return datetime(d.year, d.month, d.day)
+    if hasattr(d, 'to_pydatetime'):  # pandas.Timestamp (pandas를 import하지 않고 처리)
+        d = d.to_pydatetime()
+        return datetime(d.year, d.month, d.day)
+    return datetime.strptime(str(d)[:10], '%Y-%m-%d')
+
+
+def to_ordinals(dates):
+    """날짜 배열 -> ordinal(int64) 배열. 정수 배열은 ordinal 로 간주, datetime64 는 그대로 변환"""
+    arr = np.asarray(dates)
+    if arr.dtype.kind in 'iu':
+        return arr.astype(np.int64)
+    if arr.dtype.kind != 'M':
+        # date / datetime / Timestamp / 'YYYY-MM-DD' 를 앞 10자리로 한 번에 변환 (원소마다 strptime 하지 않음)
+        arr = np.array([str(d)[:10] for d in arr.ravel()], dtype='datetime64[D]').reshape(arr.shape)
+    return arr.astype('datetime64[D]').astype(np.int64) + date(1970, 1, 1).toordinal()
+
+
+def day_offsets(today, dates):
+    """today 로부터의 경과 일수 배열 (int64)"""
+    base = to_datetime(today).toordinal()
+    return np.array([to_datetime(d).toordinal() - base for d in dates], dtype=np.int64)
+
+
+def parse_tenor(tenor_str):
+    """'6M' -> 0.5, '2Y' -> 2.0 (월은 /12, 그 외는 년으로 간주)"""
+    s = str(tenor_str).upper()
+    num = float(''.join(filter(lambda x: x.isdigit() or x == '.', s)))
+    if 'M' in s:
+        return num / 12.0
+    return num
+
+
+def tenor_months(tenor_str):
+    """'6M' -> 6, '2Y' -> 24, 주/일 단위 테너는 None (calc_mty_date 와 같은 단위 판정)"""
+    s = str(tenor_str).upper().strip()
+    num = int(''.join(filter(str.isdigit, s)))
+    if 'W' in s:
+        return None
+    if 'M' in s:
+        return num
+    if 'Y' in s:
+        return num * 12
+    return None
+
+
+def add_months(d, months):
+    """월 단위 가산 (월말 초과 시 해당 월 말일로 조정)"""
+    new_month = d.month + months
+    new_year = d.year + (new_month - 1) // 12
+    new_month = (new_month - 1) % 12 + 1
+    last_day = calendar.monthrange(new_year, new_month)[1]
+    return d.replace(year=new_year, month=new_month, day=min(d.day, last_day))
+
+
+def calc_mty_date(today, tenor_str):
+    """Today + Tenor로 만기일 계산"""
+    today = to_datetime(today)
+    s = str(tenor_str).upper().strip()
+    num = int(''.join(filter(str.isdigit, s)))
+
+    if 'W' in s:
+        return today + timedelta(weeks=num)
+    elif 'M' in s:
+        return add_months(today, num)
+    elif 'Y' in s:
+        try:
+            return today.replace(year=today.year + num)
+        except ValueError:
+            # 윤년 처리 (2/29)
+            return today.replace(year=today.year + num, day=28)
+    else:
+        return today + timedelta(days=num)
+
+
+def add_months_ordinals(ords, months):
+    """ordinal 배열 + 개월 수(배열 가능, 음수 허용) -> ordinal 배열 (add_months 의 벡터 버전, 말일 clamp)"""
+    epoch = date(1970, 1, 1).toordinal()
+    d = (np.asarray(ords, dtype=np.int64) - epoch).astype('datetime64[D]')
+    m = d.astype('datetime64[M]')
+    day = (d - m.astype('datetime64[D]')).astype(np.int64)
+    target = m + np.asarray(months, dtype=np.int64)
+    last_day = ((target + 1).astype('datetime64[D]') - target.astype('datetime64[D]')).astype(np.int64) - 1
+    out = target.astype('datetime64[D]') + np.minimum(day, last_day)
+    return out.astype(np.int64) + epoch
+
+
+def add_tenor_ordinals(ords, tenor_str):
+    """ordinal 배열 + Tenor -> 만기 ordinal 배열 (calc_mty_date 의 벡터 버전, 월/년은 해당 월 말일로 clamp)"""
+    ords = np.asarray(ords, dtype=np.int64)
+    s = str(tenor_str).upper().strip()
+    num = int(''.join(filter(str.isdigit, s)))
+    months = tenor_months(s)
+    if months is None:
+        return ords + (7 * num if 'W' in s else num)
+    return add_months_ordinals(ords, months)
+
+
+def assign_jump_dates(mty_dates, jump_dates):
+    """각 만기일에 대해 JumpDates 중 만기일 이상인 최소 날짜 (없으면 마지막 날짜)"""
+    jumps = sorted(to_datetime(d) for d in jump_dates)
+    jump_ord = np.array([d.toordinal() for d in jumps], dtype=np.int64)
+    mty_ord = np.array([to_datetime(d).toordinal() for d in mty_dates], dtype=np.int64)
+    idx = np.searchsorted(jump_ord, mty_ord, side='left')
+    idx = np.minimum(idx, len(jumps) - 1)
+    return [jumps[i] for i in idx]
+
+
+def extend_jump_dates(jump_dates, mty_dates, pay_dates):
+    """배정된 Jump Date 가 인스트루먼트의 마지막 지급일(영업일 조정 후)보다 앞서면 그 지급일로 옮긴 Jump Date 목록
+
+    만기가 주말이면 Modified Following 으로 마지막 지급일이 만기(= Jump Date)를 넘을 수 있습니다.
+    그대로 두면 부트스트랩은 그 며칠을 자기 구간 forward 로 할인하지만 커브는 다음 구간 forward 를 쓰므로
+    구간 끝을 지급일까지 늘려 커브가 자기 호가를 다시 맞히도록 합니다. 만기가 마지막 Jump Date 이후(외삽)면 그대로.
+    원래 Jump Date 와 옮긴 지급일 사이에 있던 다른 Jump Date(촘촘한 노드, 같은 주말 / 휴일)는 옮긴 노드로 합치고
+    정렬 / 중복 제거해서 반환합니다 (그 노드가 만기를 가져가 지급일이 다시 구간 밖으로 나가지 않도록).
+    """
+    original = sorted(to_datetime(d) for d in jump_dates)
+    jumps = list(original)
+    jump_ord = np.array([d.toordinal() for d in jumps], dtype=np.int64)
+    mty_ord = np.array([to_datetime(d).toordinal() for d in mty_dates], dtype=np.int64)
+    for i, pay in zip(np.searchsorted(jump_ord, mty_ord, side='left'), pay_dates):
+        pay = to_datetime(pay)
+        if i < len(jumps) and pay > jumps[i]:
+            jumps[i] = pay
+    moved = [(o, d) for o, d in zip(original, jumps) if d != o]
+    return sorted({max([d] + [p for o, p in moved if o < d < p]) for d in jumps})
@@ -0,0 +1,135 @@
+"""
+Day Count (ordinal 배열 기준 year fraction)
+
+VBA CalcYF 와 같은 Basis 문자열(ACT/365, ACT/360, ACT/ACT, 30/360)을 사용합니다. 날짜는
+datetime.toordinal() 정수 배열로 받아 포트폴리오 전체 구간을 한 번에 계산합니다.
+
+    - ACT/365 (ACT/365F)  : 일수 / 365
+    - ACT/360             : 일수 / 360
+    - ACT/ACT (ISDA)      : 연도별 실제 일수 / 해당 연도 일수(365 또는 366) 의 합
+    - 30/360 (Bond Basis) : D1=31 -> 30, D1>=30 이고 D2=31 -> 30 (VBA CalcYF 와 동일)
+    - 30/360 US           : Bond Basis + 2월 말일 규칙
+    - 30E/360             : D1, D2 가 31 이면 30
+    - 30E/360 ISDA        : 월말이면 30 (만기일인 2월 말일 D2 는 제외)
+    - 그 외               : CalcYF 의 Case Else 와 같이 일수 / 365
+
+사용 예:
+    yf = year_fraction(accrual_start_ords, accrual_end_ords, "ACT/ACT")
+"""
+
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def normalize_basis(basis):
+    return " ".join(str(basis).upper().split())
+
+
+def _ordinals(x):
+    return np.asarray(x, dtype=np.int64)
+
+
+def _ymd(ords):
+    """ordinal 배열 -> (년, 월, 일, 월말 여부) 배열"""
+    d = (ords - EPOCH_ORDINAL).astype('datetime64[D]')
+    months = d.astype('datetime64[M]')
+    year = months.astype('datetime64[Y]').astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (d - months.astype('datetime64[D]')).astype(np.int64) + 1
+    month_end = (months + 1).astype('datetime64[D]') - np.timedelta64(1, 'D') == d
+    return year, month, day, month_end
+
+
+def _thirty_360(y1, m1, d1, y2, m2, d2):
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+
+
+def act_365(start_ord, end_ord):
+    return (_ordinals(end_ord) - _ordinals(start_ord)) / 365.0
+
+
+def act_360(start_ord, end_ord):
+    return (_ordinals(end_ord) - _ordinals(start_ord)) / 360.0
+
+
+def act_act_isda(start_ord, end_ord):
+    """시작 연도 잔여분 + 중간 연도 수 + 종료 연도 경과분 (같은 연도면 일수 / 연도 일수)"""
+    start_ord, end_ord = _ordinals(start_ord), _ordinals(end_ord)
+    y1 = _ymd(start_ord)[0]
+    y2 = _ymd(end_ord)[0]
+    jan1 = lambda y: (y - 1970).astype('datetime64[Y]').astype('datetime64[D]').astype(np.int64) + EPOCH_ORDINAL
+    start_next, end_jan1 = jan1(y1 + 1), jan1(y2)
+    len1 = start_next - jan1(y1)
+    len2 = jan1(y2 + 1) - end_jan1
+    return (y2 - y1 - 1) + (start_next - start_ord) / len1 + (end_ord - end_jan1) / len2
+
+
+def thirty_360_bond(start_ord, end_ord):
+    y1, m1, d1, _ = _ymd(_ordinals(start_ord))
+    y2, m2, d2, _ = _ymd(_ordinals(end_ord))
+    d1 = np.minimum(d1, 30)
+    d2 = np.where((d2 == 31) & (d1 == 30), 30, d2)
+    return _thirty_360(y1, m1, d1, y2, m2, d2)
+
+
+def thirty_360_us(start_ord, end_ord):
+    y1, m1, d1, eom1 = _ymd(_ordinals(start_ord))
+    y2, m2, d2, eom2 = _ymd(_ordinals(end_ord))
+    feb_end1 = (m1 == 2) & eom1
+    feb_end2 = (m2 == 2) & eom2
+    d2 = np.where(feb_end1 & feb_end2, 30, d2)
+    d1 = np.where(feb_end1, 30, d1)
+    d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
+    d1 = np.minimum(d1, 30)
+    return _thirty_360(y1, m1, d1, y2, m2, d2)
+
+
+def thirty_e_360(start_ord, end_ord):
+    y1, m1, d1, _ = _ymd(_ordinals(start_ord))
+    y2, m2, d2, _ = _ymd(_ordinals(end_ord))
+    return _thirty_360(y1, m1, np.minimum(d1, 30), y2, m2, np.minimum(d2, 30))
+
+
+def thirty_e_360_isda(start_ord, end_ord, termination_ord=None):
+    end_ord = _ordinals(end_ord)
+    y1, m1, d1, eom1 = _ymd(_ordinals(start_ord))
+    y2, m2, d2, eom2 = _ymd(end_ord)
+    keep = (m2 == 2) & (end_ord == termination_ord) if termination_ord is not None else False
+    d1 = np.where(eom1, 30, d1)
+    d2 = np.where(eom2 & ~keep, 30, d2)
+    return _thirty_360(y1, m1, d1, y2, m2, d2)
+
+
+DAY_COUNTS = {
+    "ACT/365": act_365,
+    "ACT/365F": act_365,
+    "ACT/360": act_360,
+    "ACT/ACT": act_act_isda,
+    "ACT/ACT ISDA": act_act_isda,
+    "30/360": thirty_360_bond,
+    "30/360 BOND": thirty_360_bond,
+    "30/360 US": thirty_360_us,
+    "30E/360": thirty_e_360,
+    "30E/360 ISDA": thirty_e_360_isda,
+}
+
+
+def year_fraction(start_ord, end_ord, basis="ACT/365", termination_ord=None):
+    """start_ord ~ end_ord (ordinal 정수 배열) 의 year fraction 배열
+
+    termination_ord 는 30E/360 ISDA 의 만기일 2월 말일 예외에만 사용
+    """
+    func = DAY_COUNTS.get(normalize_basis(basis), act_365)
+    if func is thirty_e_360_isda:
+        return func(start_ord, end_ord, termination_ord)
+    return func(start_ord, end_ord)
+
+
+@lru_cache(maxsize=65536)
+def scalar_year_fraction(start_ord, end_ord, basis="ACT/365"):
+    """스칼라 호출용 (날짜 단위로 반복 호출하는 스크립트 엔진에서 같은 구간을 다시 계산하지 않도록 캐시)"""
+    return float(year_fraction(start_ord, end_ord, basis))
@@ -0,0 +1,60 @@
+"""
+엑셀 입출력 (xlwings / pandas 지연 import)
+
+엑셀 백엔드가 없는 환경(Linux 등)에서는 이 모듈의 함수를 호출할 때만 ExcelUnavailableError 가 발생하며,
+패키지 import 나 CSV/JSON 기반 bootstrap 에는 영향이 없습니다.
+"""
+
+from .inputs import CurveInputs
+
+
+class ExcelUnavailableError(RuntimeError):
+    pass
+
+
+def _xlwings():
+    try:
+        import xlwings as xw
+    except ImportError:
+        raise ExcelUnavailableError("xlwings 라이브러리가 설치되어 있지 않습니다. 'pip install xlwings'를 실행해 주세요.")
+    try:
+        xw.apps.count
+    except Exception as e:
+        raise ExcelUnavailableError(f"엑셀 백엔드를 사용할 수 없습니다: {e}")
+    return xw
+
+
+def open_book(file_path):
+    xw = _xlwings()
+    app = xw.apps.active if xw.apps.count > 0 else xw.App(visible=True, add_book=False)
+    return app.books.open(file_path)
+
+
+def _read_table(ws_main, name):
+    import pandas as pd
+    tbl = ws_main.api.ListObjects(name)
+    df = ws_main.range(tbl.Range.Address).options(pd.DataFrame, index=False, header=True).value
+    df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+def read_workbook_inputs(wb):
+    """Main 시트의 Common / MarketTable / JumpDates 테이블 -> CurveInputs"""
+    ws_main = wb.sheets["Main"]
+    df_common = _read_table(ws_main, "Common")
+    market = _read_table(ws_main, "MarketTable")
+    jumps = _read_table(ws_main, "JumpDates")
+    return CurveInputs(df_common['Today'].iloc[0],
+                       market['Inst. Tenor'].tolist(), market['Type'].tolist(), market['Market Rate'].tolist(),
+                       jumps['Jump Date'].dropna().tolist(),
+                       df_common['DayCount Basis'].iloc[0], int(df_common['IRS Coupon Freq'].iloc[0]))
+
+
+def write_result(wb, result):
+    """MarketTable 의 Mty Date / Jump Date / Solved Forward 컬럼 갱신"""
+    ws_main = wb.sheets["Main"]
+    tbl_market = ws_main.api.ListObjects("MarketTable")
+    ws_main.range(tbl_market.ListColumns("Mty Date").DataBodyRange.Address).value = [[d] for d in result.mty_dates]
+    ws_main.range(tbl_market.ListColumns("Jump Date").DataBodyRange.Address).value = [[d] for d in result.curve.pillar_dates]
+    ws_main.range(tbl_market.ListColumns("Solved Forward").DataBodyRange.Address).value = [[float(f)] for f in result.forwards]
+    wb.app.calculate()
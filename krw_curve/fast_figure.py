@@ -0,0 +1,150 @@
+"""
+Fast Figure (dict 기반 Figure 템플릿)
+
+plotly.graph_objects 로 Figure 를 만들면 트레이스마다 속성 검증이 수행되어, 배치처럼 날짜마다
+Figure 를 새로 만들면 검증 시간이 차트 생성 시간의 대부분을 차지합니다.
+
+    - FigureTemplate.from_figure(fig): 한 번 만든(검증된) Figure 를 plain dict 스펙으로 보관
+    - template.render(traces, layout): 트레이스의 데이터 배열과 레이아웃 일부만 교체 (검증 없음)
+    - dumps: NumPy 배열을 직접 직렬화 (orjson 이 있으면 사용, 없으면 표준 json)
+    - render 결과는 to_html / to_json 을 제공하여 write_html_if_changed 에 그대로 전달 가능
+
+사용 예:
+    template = FigureTemplate.from_figure(build_chart(first_day_data))
+    fast_fig = template.render({0: dict(x=mty_dates, y=rates)}, {'title': {'text': "..."}})
+    write_html_if_changed(path, fingerprint, lambda: fast_fig)
+"""
+
+import json
+import uuid
+from datetime import date, datetime
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _plain(obj):
+    """JSON 비호환 객체 변환 (datetime64 / NaN 은 null 로)"""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'M':
+            out = np.datetime_as_string(obj, unit='D').astype(object)
+            out[np.isnat(obj)] = None
+            return out.tolist()
+        if obj.dtype.kind == 'f':
+            out = obj.astype(object)
+            out[np.isnan(obj)] = None
+            return out.tolist()
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):  # pandas Series / Index
+        return _plain(np.asarray(obj))
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(obj)}")
+
+
+def _prepare(obj):
+    """orjson 이 잘못 처리하는 datetime64 배열만 미리 문자열로 변환"""
+    if isinstance(obj, dict):
+        return {k: _prepare(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_prepare(v) for v in obj]
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in 'MO':
+        return _plain(obj)
+    return obj
+
+
+def dumps(obj):
+    """Figure 스펙(dict) -> JSON 문자열"""
+    if orjson is not None:
+        return orjson.dumps(_prepare(obj), default=_plain,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, default=_plain, separators=(',', ':'))
+
+
+def _plotlyjs_script(include_plotlyjs):
+    if include_plotlyjs is True:
+        from plotly.offline import get_plotlyjs
+        return f'<script type="text/javascript">{get_plotlyjs()}</script>'
+    if include_plotlyjs == 'cdn':
+        from plotly.offline import get_plotlyjs_version
+        return f'<script charset="utf-8" src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+    return ""
+
+
+class FastFigure:
+    """render 결과 (plotly Figure 의 to_html / to_json 최소 대체)"""
+
+    def __init__(self, template, data, layout):
+        self.template = template
+        self.data = data
+        self.layout = layout
+
+    def to_dict(self):
+        return {'data': self.data, 'layout': self.layout}
+
+    def layout_json(self):
+        # 레이아웃 템플릿(plotly_white 등)은 FigureTemplate 에서 미리 만든 JSON 을 이어 붙임
+        text = dumps(self.layout)
+        if self.template.layout_template_json is None:
+            return text
+        sep = "," if len(text) > 2 else ""
+        return f'{text[:-1]}{sep}"template":{self.template.layout_template_json}}}'
+
+    def to_json(self):
+        return f'{{"data":{dumps(self.data)},"layout":{self.layout_json()}}}'
+
+    def to_html(self, full_html=True, include_plotlyjs=True, div_id=None):
+        div_id = div_id or str(uuid.uuid4())
+        script = (f'window.PLOTLYENV=window.PLOTLYENV || {{}};'
+                  f'if (document.getElementById("{div_id}")) {{'
+                  f'Plotly.newPlot("{div_id}", {dumps(self.data)}, {self.layout_json()}, {self.template.config_json})}};')
+        div = (f'<div style="height:100%; width:100%;">{self.template.plotlyjs(include_plotlyjs)}'
+               f'<div id="{div_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>'
+               f'<script type="text/javascript">{script}</script></div>')
+        if not full_html:
+            return div
+        return ('<!doctype html>\n<html>\n<head>\n    <meta charset="utf-8" />\n'
+                '    <style>html, body {height: 100%;}</style>\n</head>\n<body>\n    '
+                f'{div}\n</body>\n</html>')
+
+    def write_html(self, path, **kwargs):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_html(**kwargs))
+
+
+class FigureTemplate:
+    def __init__(self, data, layout, config=None):
+        self.data = data
+        self.layout = dict(layout)
+        # 크기가 큰 레이아웃 템플릿은 한 번만 직렬화
+        template = self.layout.pop('template', None)
+        self.layout_template_json = None if template is None else dumps(template)
+        self.config_json = dumps(config or {'responsive': True})
+        self._plotlyjs = {}
+
+    @classmethod
+    def from_figure(cls, fig, config=None):
+        """검증된 plotly Figure 를 plain dict 템플릿으로 (검증은 여기서 한 번만)"""
+        spec = fig.to_plotly_json()
+        return cls(spec['data'], spec['layout'], config)
+
+    def plotlyjs(self, include_plotlyjs):
+        key = include_plotlyjs if isinstance(include_plotlyjs, str) else bool(include_plotlyjs)
+        if key not in self._plotlyjs:
+            self._plotlyjs[key] = _plotlyjs_script(include_plotlyjs)
+        return self._plotlyjs[key]
+
+    def render(self, traces=None, layout=None):
+        """traces: {트레이스 index: {속성: 값}}, layout: {속성: 값} 만 교체한 FastFigure"""
+        data = list(self.data)
+        for idx, updates in (traces or {}).items():
+            data[idx] = {**data[idx], **updates}
+        new_layout = {**self.layout, **(layout or {})}
+        return FastFigure(self, data, new_layout)
+
@@ -0,0 +1,27 @@
+"""
+원자적 파일 쓰기 (표준 라이브러리만 사용)
+
+캐시 / 차트 캐시 / 스트리밍 게시 / 커브 저장소 / backfill 이 같은 방식으로 파일을 씁니다.
+    - 같은 디렉터리에 임시 파일(.tmp_*.tmp) 작성 후 os.replace -> 읽는 쪽에서 쓰다 만 파일이 보이지 않음
+    - 실패하면 임시 파일을 지우고 예외를 그대로 전달
+"""
+
+import os
+import tempfile
+
+TMP_PREFIX = ".tmp_"
+
+
+def atomic_write_text(path, text):
+    """임시 파일 작성 후 os.replace (여러 프로세스가 동시에 써도 깨진 파일이 보이지 않음)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=TMP_PREFIX, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,78 @@
+"""
+커브 입력값 (Common / MarketTable / JumpDates 에 해당)
+
+엑셀 없이도 CSV 또는 JSON 으로 입력을 읽을 수 있도록 표준 라이브러리만 사용합니다.
+
+    market CSV : Inst. Tenor, Type, Market Rate 컬럼 (엑셀 MarketTable 과 동일한 헤더)
+    jump CSV   : Jump Date 컬럼 (YYYY-MM-DD)
+    JSON       : {"today": ..., "basis": ..., "freq": ..., "instruments": [{"tenor", "type", "rate"}], "jump_dates": [...]}
+"""
+
+import csv
+import json
+
+from .dates import to_datetime
+
+
+class CurveInputs:
+    def __init__(self, today, tenors, types, rates, jump_dates, basis="ACT/365", freq=4):
+        self.today = to_datetime(today)
+        self.tenors = [str(t).strip() for t in tenors]
+        self.types = [str(t).strip() for t in types]
+        self.rates = [float(r) for r in rates]
+        self.jump_dates = sorted(to_datetime(d) for d in jump_dates)
+        self.basis = str(basis).upper().strip()
+        self.freq = int(freq)
+
+    def __len__(self):
+        return len(self.tenors)
+
+    def with_today(self, today):
+        """Today 만 바꾼 복사본 (배치에서 기준일별로 사용)"""
+        return CurveInputs(today, self.tenors, self.types, self.rates, self.jump_dates, self.basis, self.freq)
+
+    def with_jump_dates(self, jump_dates):
+        """Jump Date 만 바꾼 복사본 (노드 배치 비교 / 재가격 검사용)"""
+        return CurveInputs(self.today, self.tenors, self.types, self.rates, jump_dates, self.basis, self.freq)
+
+    def to_dict(self):
+        return {
+            'today': self.today.strftime('%Y-%m-%d'),
+            'basis': self.basis,
+            'freq': self.freq,
+            'instruments': [{'tenor': t, 'type': ty, 'rate': r}
+                            for t, ty, r in zip(self.tenors, self.types, self.rates)],
+            'jump_dates': [d.strftime('%Y-%m-%d') for d in self.jump_dates],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        inst = data['instruments']
+        return cls(data['today'],
+                   [i['tenor'] for i in inst], [i['type'] for i in inst], [i['rate'] for i in inst],
+                   data['jump_dates'], data.get('basis', "ACT/365"), data.get('freq', 4))
+
+
+def _read_csv_rows(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        rows = []
+        for row in reader:
+            rows.append({str(k).strip(): v for k, v in row.items()})
+        return rows
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return CurveInputs.from_dict(json.load(f))
+
+
+def load_csv(market_path, jump_path, today, basis="ACT/365", freq=4):
+    market_rows = [r for r in _read_csv_rows(market_path) if r.get('Inst. Tenor')]
+    jump_rows = [r for r in _read_csv_rows(jump_path) if r.get('Jump Date')]
+    return CurveInputs(today,
+                       [r['Inst. Tenor'] for r in market_rows],
+                       [r['Type'] for r in market_rows],
+                       [r['Market Rate'] for r in market_rows],
+                       [r['Jump Date'] for r in jump_rows],
+                       basis, freq)
@@ -0,0 +1,51 @@
+"""
+N-knot 부트스트랩 (year fraction 기준, 만기와 분리된 knot 벡터)
+
+KRW_IRS_Bootstrapping_Custom_Knots.py 의 obj_1d ~ obj_1y 를 일반화한 엔진입니다.
+    - 인스트루먼트 i 는 knot 구간 i 의 forward 하나를 결정 (knot 은 만기와 무관하게 지정)
+    - knot i 이후 구간은 아직 없으므로 현재 forward 로 외삽 (원본의 nodes[:i+1] 과 동일)
+    - Deposit/Call : (1 + r * T) * DF(T) = 1
+    - IRS          : r * Σ dt_j * DF(t_j) + DF(T) = 1,  t_j = j / freq, 마지막 지급 = T
+
+사용 예:
+    instruments = [("deposit", 1/365, 0.035), ("deposit", 0.25, 0.036), ("irs", 0.5, 0.037)]
+    curve, stats = bootstrap_knots(instruments, knots=[2/12, 5/12, 7/12])
+    curve.df_t([0.1, 0.3, 0.6])
+"""
+
+import numpy as np
+
+from .bootstrap import solve_sequential
+from .curve import PiecewiseFlatForward
+
+
+def deposit_cashflows(rate, maturity):
+    return np.array([maturity], dtype=float), np.array([1.0 + rate * maturity])
+
+
+def irs_cashflows(rate, maturity, freq=4):
+    """고정 지급 시점 j/freq (마지막은 만기), 금액 r * dt, 만기에 원금 1 추가"""
+    num_coupons = max(int(round(maturity * freq)), 1)
+    times = np.arange(1, num_coupons + 1) / freq
+    times[-1] = maturity
+    amounts = rate * np.diff(np.concatenate([[0.0], times]))
+    amounts[-1] += 1.0
+    return times, amounts
+
+
+def instrument_cashflows(inst_type, maturity, rate, freq=4):
+    if str(inst_type).lower() in ("deposit", "depo", "call"):
+        return deposit_cashflows(rate, maturity)
+    return irs_cashflows(rate, maturity, freq)
+
+
+def bootstrap_knots(instruments, knots, freq=4, telemetry=None, tol=1e-12, max_iter=50):
+    """instruments: (종류, 만기(년), 금리) 목록, knots: 인스트루먼트 수와 같은 길이의 knot 시점(년)
+
+    반환: (PiecewiseFlatForward, stats)
+    """
+    cashflows = [instrument_cashflows(kind, mty, rate, freq) for kind, mty, rate in instruments]
+    labels = [f"{kind} {mty:.4f}y" for kind, mty, _ in instruments]
+    guesses = [rate for _, _, rate in instruments]
+    forwards, stats = solve_sequential(knots, cashflows, guesses, labels, telemetry, tol, max_iter)
+    return PiecewiseFlatForward(knots, forwards), stats
@@ -0,0 +1,180 @@
+"""
+기준일 축 벡터화 부트스트랩 (여러 기준일을 한 번에)
+
+run_batch 는 기준일마다, 기준일 안에서는 인스트루먼트마다 스칼라 Newton 을 돌립니다.
+인스트루먼트 구성(테너 / Type / Freq / Basis)이 같은 기준일들은 k 번째 단계의 구조가 같으므로
+기준일을 행으로 하는 (기준일 x 현금흐름) 배열에 현금흐름 시점 / 금액을 모아
+k 번째 forward 를 모든 기준일에 대해 배열 Newton 한 번으로 풉니다.
+
+    D 개 기준일 x N 개 인스트루먼트 -> N 단계 x (Newton 반복) 번의 NumPy 연산 (D 와 무관)
+    - 행마다 solve_sequential 과 같은 식 / 같은 수렴 판정 (|Newton step| < tol)
+    - 수렴하지 않았거나 값이 유한하지 않은 행만 해당 기준일 스칼라 풀이(_solve_step, brentq 폴백)로 다시 품
+    - 만기 / Jump Date / 쿠폰 스케줄 / accrual 도 기준일 축 배열 연산으로 생성 (stacked_schedules)
+    - 결과는 기준일별 bootstrap_curve 와 같음
+
+사용 예:
+    results = bootstrap_dates([inputs.with_today(d) for d in dates])
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from .bootstrap import BootstrapResult, _solve_step, coupon_period_months
+from .curve import ForwardCurve
+from .dates import add_months_ordinals, add_tenor_ordinals, tenor_months, to_datetime
+from .daycount import year_fraction
+from .schedule import DEFAULT_CONVENTION, adjust_ordinals, roll_month_offsets
+
+
+def solve_stacked(pillar_times, times, amounts, guesses, tol=1e-12, max_iter=50):
+    """행(기준일)별 순차 부트스트랩을 단계마다 배열 Newton 으로 동시에 풀이
+
+    pillar_times : (D x N) 구간 끝 시점
+    times / amounts : 길이 N 리스트, k 번째는 (D x M_k) 현금흐름 시점 / 금액
+    guesses      : (D x N) 초기값
+    반환: forwards (D x N), iterations / function_calls (D x N, int), residuals (D x N), converged (D x N, bool)
+    """
+    pillar_times = np.asarray(pillar_times, dtype=float)
+    d, n = pillar_times.shape
+    rows = np.arange(d)
+    starts = np.concatenate([np.zeros((d, 1)), pillar_times], axis=1)
+    forwards = np.zeros((d, n))
+    log_df_table = np.zeros((d, n + 1))
+    iterations = np.zeros((d, n), dtype=int)
+    calls = np.zeros((d, n), dtype=int)
+    residuals = np.zeros((d, n))
+    converged = np.zeros((d, n), dtype=bool)
+
+    for k in range(n):
+        t, a = times[k], amounts[k]
+        t_prev = starts[:, k:k + 1]
+        if k == 0:
+            A = np.zeros_like(t)
+        else:
+            # side='left' 구간 번호 (앞에서 확정된 구간까지로 제한)
+            seg = np.minimum((pillar_times[:, None, :k] < t[:, :, None]).sum(axis=2), k - 1)
+            A = (np.take_along_axis(log_df_table, seg, axis=1)
+                 - np.take_along_axis(forwards, seg, axis=1)
+                 * (np.minimum(t, t_prev) - np.take_along_axis(starts, seg, axis=1)))
+        w = np.maximum(t - t_prev, 0.0)
+
+        f = np.array(guesses[:, k], dtype=float)
+        active = rows
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            for it in range(1, max_iter + 1):
+                disc = a[active] * np.exp(A[active] - f[active, None] * w[active])
+                npv = disc.sum(axis=1) - 1.0
+                deriv = -(disc * w[active]).sum(axis=1)
+                calls[active, k] += 1
+                step = npv / deriv
+                f[active] -= step
+                iterations[active, k] = it
+                done = np.abs(step) < tol
+                converged[active[done], k] = True
+                active = active[~done & np.isfinite(step)]
+                if len(active) == 0:
+                    break
+            disc = a * np.exp(A - f[:, None] * w)
+            residuals[:, k] = disc.sum(axis=1) - 1.0
+        calls[converged[:, k], k] += 1
+
+        # 배열 Newton 으로 안 풀린 기준일만 스칼라 풀이 (brentq 폴백 포함)
+        for r in np.flatnonzero(~converged[:, k] | ~np.isfinite(f)):
+            f[r], iters, n_calls, residuals[r, k], converged[r, k] = _solve_step(a[r], A[r], w[r], guesses[r, k],
+                                                                                   tol, max_iter)
+            iterations[r, k] += iters
+            calls[r, k] += n_calls
+
+        forwards[:, k] = f
+        log_df_table[:, k + 1] = log_df_table[:, k] - f * (pillar_times[:, k] - starts[:, k])
+    return forwards, iterations, calls, residuals, converged
+
+
+def _group_key(inputs, jump_cache):
+    # 배치 기준일들은 대부분 같은 Jump Date 목록이므로 ordinal 변환은 목록마다 한 번만
+    key = tuple(inputs.jump_dates)
+    jumps = jump_cache.get(key)
+    if jumps is None:
+        jumps = jump_cache[key] = tuple(sorted(to_datetime(d).toordinal() for d in key))
+    return tuple(inputs.tenors), tuple(str(t).lower() for t in inputs.types), inputs.freq, inputs.basis, jumps
+
+
+def stacked_schedules(today_ords, tenors, types, freq, basis, jump_ords):
+    """기준일 배열(D) -> 만기 / Jump Date ordinal (D x N), pillar 시점 (D x N), 인스트루먼트별 시점 / accrual (D x M_k)
+
+    instrument_accruals 와 같은 규칙을 기준일 축으로 한 번에 적용합니다.
+        - Deposit / 주·일 테너: 만기(calc_mty_date) 1회 지급
+        - IRS / OIS: 만기에서 거꾸로 월 roll (short front stub) + Modified Following, accrual 은 조정된 지급일 사이
+        - pillar: 만기 이상 첫 Jump Date, 마지막 지급일이 그보다 뒤면 지급일까지 (dates.extend_jump_dates)
+    인스트루먼트 구성이 같으면 지급 횟수도 같으므로 padding 이 필요 없습니다.
+    """
+    today_ords = np.asarray(today_ords, dtype=np.int64)
+    jump_ords = np.asarray(jump_ords, dtype=np.int64)
+    mty = np.stack([add_tenor_ordinals(today_ords, t) for t in tenors], axis=1)
+
+    times, accruals, last_pay = [], [], []
+    for k, (tenor, inst_type) in enumerate(zip(tenors, types)):
+        months = tenor_months(tenor)
+        if str(inst_type).lower() == "deposit" or months is None:
+            pay = mty[:, k:k + 1]
+            acc_start = today_ords[:, None]
+        else:
+            end = add_months_ordinals(today_ords, months)
+            back = np.array(roll_month_offsets(months, coupon_period_months(inst_type, months, freq))[1:]) - months
+            pay = adjust_ordinals(add_months_ordinals(end[:, None], back[None, :]), DEFAULT_CONVENTION)
+            acc_start = np.concatenate([today_ords[:, None], pay[:, :-1]], axis=1)
+        times.append(year_fraction(today_ords[:, None], pay, basis))
+        accruals.append(year_fraction(acc_start, pay, basis))
+        last_pay.append(pay[:, -1])
+
+    # 기준일(행)마다 dates.extend_jump_dates: 마지막 지급일이 배정된 Jump Date 를 넘으면 그 지급일로 옮김
+    idx = np.searchsorted(jump_ords, mty, side='left')
+    inside = idx < len(jump_ords)
+    jumps = np.repeat(jump_ords[None, :], len(today_ords), axis=0)
+    rows = np.broadcast_to(np.arange(len(today_ords))[:, None], mty.shape)
+    np.maximum.at(jumps, (rows[inside], idx[inside]), np.stack(last_pay, axis=1)[inside])
+    # 원래 Jump Date 와 옮긴 지급일 사이의 Jump Date 는 옮긴 노드로 합치고, 행마다 정렬해서 구간 번호를 다시 찾음
+    # (합쳐진 노드는 같은 값으로 중복되어 같은 pillar 로 매핑)
+    moved = jumps != jump_ords[None, :]
+    inner = moved[:, None, :] & (jump_ords[None, None, :] < jumps[:, :, None]) & (jumps[:, :, None] < jumps[:, None, :])
+    jumps = np.maximum(jumps, np.where(inner, jumps[:, None, :], 0).max(axis=2))
+    jumps.sort(axis=1)
+    idx = (jumps[:, None, :] < mty[:, :, None]).sum(axis=2)
+    pillar = np.take_along_axis(jumps, np.minimum(idx, len(jump_ords) - 1), axis=1)
+    pillar_times = year_fraction(today_ords[:, None], pillar, basis)
+    return mty, pillar, pillar_times, times, accruals
+
+
+def bootstrap_dates(inputs_list, tol=1e-12, max_iter=50):
+    """CurveInputs 목록 -> BootstrapResult 목록 (입력 순서 유지)
+
+    인스트루먼트 구성 / Jump Date 가 같은 기준일끼리 묶어 solve_stacked 로 한 번에 풉니다 (금리는 달라도 됨).
+    """
+    results = [None] * len(inputs_list)
+    groups, jump_cache = {}, {}
+    for i, inputs in enumerate(inputs_list):
+        groups.setdefault(_group_key(inputs, jump_cache), []).append(i)
+
+    for (tenors, _, freq, basis, jump_ords), members in groups.items():
+        first = inputs_list[members[0]]
+        today_ords = np.array([inputs_list[i].today.toordinal() for i in members], dtype=np.int64)
+        rates = np.array([inputs_list[i].rates for i in members], dtype=float)
+        mty, pillar, pillar_times, times, accruals = stacked_schedules(today_ords, tenors, first.types, freq, basis,
+                                                                      jump_ords)
+        amounts = []
+        for k, acc in enumerate(accruals):
+            flows = rates[:, k:k + 1] * acc
+            flows[:, -1] += 1.0
+            amounts.append(flows)
+        forwards, iterations, calls, residuals, converged = solve_stacked(pillar_times, times, amounts, rates,
+                                                                           tol, max_iter)
+        for row, i in enumerate(members):
+            inputs = inputs_list[i]
+            stats = [{'instrument': tenors[k], 'iterations': int(iterations[row, k]),
+                      'function_calls': int(calls[row, k]), 'residual': float(residuals[row, k]),
+                      'converged': bool(converged[row, k])} for k in range(len(tenors))]
+            curve = ForwardCurve(inputs.today, [datetime.fromordinal(int(o)) for o in pillar[row]], forwards[row].copy(),
+                                 inputs.basis)
+            results[i] = BootstrapResult(inputs, curve, [datetime.fromordinal(int(o)) for o in mty[row]], stats)
+    return results
@@ -0,0 +1,175 @@
+"""
+Jump Date(노드) 배치안 비교
+
+Generate_Homework_CombinedChart / MultiChart 는 워크북 시트 1, 2 에 미리 계산된 두 시나리오
+("금통위 노드" vs "채권만기 노드")만 비교합니다. compare_node_sets 는 같은 호가를 후보 노드 집합 여러 개로
+각각 부트스트랩하고(프로세스 병렬), 적합 통계를 계산해 한 차트에 겹쳐 그립니다.
+
+    - method='bootstrap' : 순차 부트스트랩 (인스트루먼트마다 서로 다른 Jump Date 필요)
+    - method='lsq'       : 전역 최소자승 (calibrate.calibrate_curve, 노드 수와 인스트루먼트 수가 달라도 됨)
+    - method='auto'      : 두 인스트루먼트가 같은 노드로 매핑되면 lsq, 아니면 bootstrap
+    - 통계: 재가격 오차(커브에서 다시 구한 par rate - 호가, bp), forward 평활도(인접 구간 차이 RMS / 최대 / 합, bp)
+    - check_repricing: 여러 기준일에서 순차 / 벡터화 부트스트랩이 자기 호가를 다시 맞히는지 검사 (CLI reprice)
+
+사용 예:
+    schemes = {"금통위": bok_dates, "채권만기": bond_dates, "분기": quarterly_dates}
+    fits = compare_node_sets(inputs, schemes, workers=4)
+    write_overlay_html(fits, "node_comparison.html")
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .bootstrap import IncrementalBootstrap, bootstrap_curve, instrument_accruals
+from .dates import calc_mty_date, to_datetime
+from .inputs import CurveInputs
+
+BP = 1e4
+METHODS = ("auto", "bootstrap", "lsq")
+REPRICE_TOL_BP = 1e-6
+
+
+def maturity_nodes(inputs):
+    """인스트루먼트 만기일을 그대로 노드로 (인스트루먼트와 구간 1:1)"""
+    return sorted({calc_mty_date(inputs.today, t) for t in inputs.tenors})
+
+
+def repricing_errors(result):
+    """커브에서 다시 구한 par rate - 호가 (인스트루먼트별 배열)"""
+    inputs, curve = result.inputs, result.curve
+    errors = np.zeros(len(inputs))
+    for i, (tenor, inst_type, rate) in enumerate(zip(inputs.tenors, inputs.types, inputs.rates)):
+        days, acc = instrument_accruals(inputs.today, tenor, inst_type, result.mty_dates[i], inputs.freq, inputs.basis)
+        dfs = curve.df_t(curve.day_times(days))
+        if inst_type.lower() == "deposit" or len(days) == 1:
+            par = (1.0 / dfs[-1] - 1.0) / acc[-1]
+        else:
+            par = (1.0 - dfs[-1]) / float((acc * dfs).sum())
+        errors[i] = par - rate
+    return errors
+
+
+def check_repricing(inputs_list, tol_bp=REPRICE_TOL_BP):
+    """기준일마다 bootstrap_curve / multidate.bootstrap_dates 로 풀어 자기 호가를 다시 맞히는지 검사
+
+    주말 만기(Modified Following 으로 마지막 지급일이 Jump Date 를 넘는 경우)를 포함한 기준일들로 확인합니다.
+    반환: 기준일 x 엔진별 {'today', 'engine', 'reprice_max_bp', 'weekend_maturities', 'ok'}
+    """
+    from .multidate import bootstrap_dates
+    rows = []
+    vectorized = bootstrap_dates(inputs_list)
+    for inputs, multi in zip(inputs_list, vectorized):
+        weekend = sum(d.weekday() >= 5 for d in multi.mty_dates)
+        for engine, result in (("bootstrap", bootstrap_curve(inputs)), ("vectorized", multi)):
+            worst = float(np.max(np.abs(repricing_errors(result)))) * BP
+            rows.append({'today': inputs.today.strftime('%Y-%m-%d'), 'engine': engine, 'reprice_max_bp': worst,
+                         'weekend_maturities': weekend, 'ok': worst <= tol_bp})
+    return rows
+
+
+def fit_statistics(result):
+    """재가격 오차 / forward 평활도 요약 (bp 단위)"""
+    curve = result.curve
+    used = np.asarray([d > curve.today for d in curve.pillar_dates])
+    forwards = np.asarray(curve.forwards)[used]
+    jumps = np.diff(forwards) * BP
+    errors = repricing_errors(result) * BP
+    return {
+        'nodes': int(used.sum()),
+        'reprice_rmse_bp': float(np.sqrt(np.mean(errors ** 2))),
+        'reprice_max_bp': float(np.max(np.abs(errors))),
+        'fwd_roughness_bp': float(np.sqrt(np.mean(jumps ** 2))) if len(jumps) else 0.0,
+        'fwd_max_jump_bp': float(np.max(np.abs(jumps))) if len(jumps) else 0.0,
+        'fwd_total_variation_bp': float(np.abs(jumps).sum()),
+        'converged': all(s['converged'] for s in result.stats),
+    }
+
+
+def fit_node_set(inputs, name, jump_dates, method="auto", smoothness=0.0):
+    """노드 집합 하나로 부트스트랩 -> {'name', 'method', 'result', 'stats'} (worker 에서 실행)"""
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 method 입니다: {method} (가능: {', '.join(METHODS)})")
+    scheme = CurveInputs(inputs.today, inputs.tenors, inputs.types, inputs.rates, jump_dates, inputs.basis, inputs.freq)
+    engine = IncrementalBootstrap(scheme) if method in ("auto", "bootstrap") else None
+    if method == "auto":
+        method = "bootstrap" if len(set(engine.pillar_dates)) == len(inputs) else "lsq"
+    if method == "bootstrap":
+        result = engine.solve()
+    else:
+        from .calibrate import calibrate_curve
+        result = calibrate_curve(scheme, smoothness=smoothness)
+    return {'name': name, 'method': method, 'result': result, 'stats': fit_statistics(result)}
+
+
+def compare_node_sets(inputs, node_sets, method="auto", smoothness=0.0, workers=None):
+    """{이름: Jump Date 목록} 마다 같은 호가로 부트스트랩. workers=0 이면 현재 프로세스에서 순차 실행
+
+    반환: fit_node_set 결과 리스트 (node_sets 순서)
+    """
+    node_sets = {name: [to_datetime(d) for d in dates] for name, dates in node_sets.items()}
+    if workers is None:
+        workers = min(len(node_sets), os.cpu_count() or 1)
+    if workers <= 1 or len(node_sets) <= 1:
+        return [fit_node_set(inputs, name, dates, method, smoothness) for name, dates in node_sets.items()]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fit_node_set, inputs, name, dates, method, smoothness)
+                   for name, dates in node_sets.items()]
+        return [f.result() for f in futures]
+
+
+def overlay_figure(fits, title=None):
+    """Market Rate 점 + 노드 집합별 forward 계단선 + 노드 위치 표시 (plotly 지연 import)"""
+    import plotly.graph_objects as go
+    import plotly.colors
+
+    palette = plotly.colors.qualitative.Plotly
+    fig = go.Figure()
+    base = fits[0]['result']
+    fig.add_trace(go.Scatter(
+        x=list(base.mty_dates), y=list(base.inputs.rates), mode='markers', name='Market Rate',
+        marker=dict(size=10, color='#555'),
+        hovertemplate="<b>Market Rate</b><br>Date: %{x|%Y-%m-%d}<br>Rate: %{y:.4%}<extra></extra>"
+    ))
+    for k, fit in enumerate(fits):
+        curve, stats, color = fit['result'].curve, fit['stats'], palette[k % len(palette)]
+        step_x, step_y, nodes = [], [], []
+        p_date = curve.today
+        for c_date, f_rate in zip(curve.pillar_dates, curve.forwards):
+            if c_date <= p_date:
+                continue
+            step_x += [p_date, c_date, None]
+            step_y += [float(f_rate), float(f_rate), None]
+            nodes.append(c_date)
+            p_date = c_date
+        label = (f"{fit['name']} ({fit['method']}, RMSE {stats['reprice_rmse_bp']:.2f}bp, "
+                 f"평활도 {stats['fwd_roughness_bp']:.1f}bp)")
+        fig.add_trace(go.Scatter(
+            x=step_x, y=step_y, mode='lines', name=label, legendgroup=fit['name'],
+            line=dict(color=color, width=3),
+            hovertemplate=f"<b>{fit['name']}</b><br>Rate: %{{y:.4%}}<br>Date: %{{x|%Y-%m-%d}}<extra></extra>"
+        ))
+        fig.add_trace(go.Scatter(
+            x=nodes, y=curve.forward_t(curve.times(nodes)).tolist(),
+            mode='markers', name=f"{fit['name']} nodes", legendgroup=fit['name'], showlegend=False,
+            marker=dict(size=7, color=color, symbol='line-ns-open'),
+            hovertemplate=f"<b>{fit['name']} node</b><br>%{{x|%Y-%m-%d}}<extra></extra>"
+        ))
+    fig.update_layout(
+        title=dict(text=title or f"Jump Date 배치 비교 ({base.curve.today.strftime('%Y-%m-%d')})", x=0.5,
+                   font=dict(size=22)),
+        xaxis=dict(title="Date", type='date', tickformat='%Y-%m-%d', tickangle=-45, gridcolor='#eee'),
+        yaxis=dict(title="Rate (%)", tickformat=".2%", gridcolor='#eee'),
+        template="plotly_white", width=1400, height=800, hovermode="closest",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5)
+    )
+    return fig
+
+
+def write_overlay_html(fits, output_path, title=None):
+    """비교 내용이 같으면 기존 HTML 재사용. 새로 썼으면 True"""
+    from .chart_cache import chart_fingerprint, write_html_if_changed
+    fingerprint = chart_fingerprint("node-overlay-1", title, [(f['name'], f['method'], f['result'].to_dict())
+                                                            for f in fits])
+    return write_html_if_changed(output_path, fingerprint, lambda: overlay_figure(fits, title))
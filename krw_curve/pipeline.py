@@ -0,0 +1,97 @@
+"""
+배치 계산 / 출력 단계 파이프라인
+
+배치에서 기준일마다 부트스트랩(CPU) -> 차트 생성 / HTML 쓰기(디스크)를 순서대로 하면 전체 시간은 두 단계의 합입니다.
+RenderStage 는 출력 작업을 별도 worker pool 에서 실행하고, 계산 단계(호출한 스레드)는 바로 다음 기준일로 넘어갑니다.
+전체 시간은 두 단계 중 느린 쪽에 가까워집니다.
+
+    - bounded queue: 처리 중인 출력 작업이 max_pending 개면 submit 이 대기 (메모리 / 디스크 backlog 제한)
+    - executor: 'thread' (기본, 파일 쓰기 위주) 또는 'process' (함수 / 인자가 pickle 가능해야 함)
+    - enabled=False 면 submit 은 아무것도 하지 않음 (렌더링 생략)
+    - 작업 결과 / 예외는 label 별로 모아 drain() 에서 반환, 계산 단계가 기다린 시간은 stats['wait_s']
+
+사용 예:
+    with RenderStage(workers=2, max_pending=8) as stage:
+        for today in dates:
+            result = bootstrap(...)
+            stage.submit(write_outputs, result.to_dict(), path, label=today)
+    print(stage.stats, stage.errors)
+"""
+
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+DEFAULT_RENDER_WORKERS = 2
+DEFAULT_MAX_PENDING = 8
+
+
+class RenderStage:
+    def __init__(self, workers=DEFAULT_RENDER_WORKERS, max_pending=DEFAULT_MAX_PENDING, executor='thread',
+                 enabled=True, on_done=None):
+        self.enabled = enabled
+        self.on_done = on_done
+        self.results = {}
+        self.errors = {}
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'skipped': 0, 'wait_s': 0.0}
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._futures = []
+        self._pool = None
+        if enabled:
+            pool_cls = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+            self._pool = pool_cls(max_workers=max(1, workers))
+
+    def submit(self, func, *args, label=None):
+        """출력 작업 추가. queue 가 차 있으면 자리가 날 때까지 대기"""
+        if not self.enabled:
+            self.stats['skipped'] += 1
+            return None
+        start = time.perf_counter()
+        self._slots.acquire()
+        self.stats['wait_s'] += time.perf_counter() - start
+        self.stats['submitted'] += 1
+        try:
+            future = self._pool.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._finished(label, f))
+        self._futures.append(future)
+        return future
+
+    def _finished(self, label, future):
+        self._slots.release()
+        error = future.exception()
+        with self._lock:
+            if error is None:
+                self.stats['completed'] += 1
+                self.results[label] = future.result()
+            else:
+                self.stats['failed'] += 1
+                self.errors[label] = f"{type(error).__name__}: {error}"
+        if self.on_done is not None:
+            self.on_done(label, None if error is not None else future.result(), error)
+
+    def drain(self):
+        """남은 출력 작업을 모두 기다리고 {label: 예외 메시지} 반환"""
+        for future in self._futures:
+            try:
+                future.result()
+            except Exception:
+                pass  # _finished 에서 errors 에 기록됨
+        self._futures = []
+        return dict(self.errors)
+
+    def close(self):
+        self.drain()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,116 @@
+"""
+스왑 가격 계산 (단일 커브, Today 시작 IRS)
+
+부트스트랩과 같은 지급 스케줄(schedule.coupon_schedule)과 Basis 를 사용합니다.
+    - annuity   = Σ yf_j * DF(t_j)
+    - float leg = 1 - DF(t_n)
+    - par rate  = float leg / annuity
+    - NPV       = notional * (float leg - rate * annuity)  (pay fixed 기준, receive 는 부호 반대)
+
+swaps 항목: {"tenor": "5Y", "rate": 0.035, "notional": 1e10, "pay_fixed": true, "type": "OIS"}
+(notional / pay_fixed / type 생략 가능, type 기본 IRS. OIS 변동 leg 도 telescoping 으로 1 - DF(t_n))
+
+구간 forward (FRA / 변동 leg 추정 / 금통위 구간 평균 forward):
+    - F(s, e) = (DF(s) / DF(e) - 1) / yf(s, e, basis)           (단리, CD / KOFR fixing 추정)
+    - F(s, e) = (log DF(s) - log DF(e)) / (t_e - t_s)            (연속복리, 구간 평균 instantaneous forward)
+    - (시작, 끝) 날짜 쌍 배열 전체를 누적 log DF 표의 searchsorted 한 번으로 계산 (쌍마다 커브를 훑지 않음)
+"""
+
+import numpy as np
+
+from .bootstrap import instrument_accruals
+from .dates import calc_mty_date, to_ordinals
+from .daycount import year_fraction
+
+COMPOUNDING = ("simple", "continuous")
+
+
+def price_swaps(result, swaps):
+    """BootstrapResult 와 스왑 목록 -> 스왑별 {tenor, rate, par_rate, annuity, npv, pv01}"""
+    inputs, curve = result.inputs, result.curve
+    out = []
+    for swap in swaps:
+        tenor = str(swap['tenor']).strip()
+        rate = float(swap['rate'])
+        notional = float(swap.get('notional', 1.0))
+        sign = 1.0 if swap.get('pay_fixed', True) else -1.0
+
+        mty_date = calc_mty_date(inputs.today, tenor)
+        days, accruals = instrument_accruals(inputs.today, tenor, swap.get('type', "IRS"), mty_date, inputs.freq,
+                                             inputs.basis)
+        dfs = curve.df_t(curve.day_times(days))
+        annuity = float(np.dot(accruals, dfs))
+        float_leg = 1.0 - float(dfs[-1])
+        out.append({
+            'tenor': tenor,
+            'rate': rate,
+            'par_rate': float_leg / annuity,
+            'annuity': annuity,
+            'npv': sign * notional * (float_leg - rate * annuity),
+            # 고정 leg 1bp 의 현재가치 (커브 고정)
+            'pv01': notional * annuity * 1e-4,
+        })
+    return out
+
+
+def _accrual_fractions(start_ords, end_ords, basis):
+    """basis 가 하나면 한 번에, 배열이면 basis 값별로 묶어서 year fraction"""
+    if np.ndim(basis) == 0:
+        return year_fraction(start_ords, end_ords, basis)
+    basis = np.asarray(basis, dtype=object)
+    out = np.empty(len(start_ords))
+    for b in set(basis.tolist()):
+        mask = basis == b
+        out[mask] = year_fraction(start_ords[mask], end_ords[mask], b)
+    return out
+
+
+def _log_dfs(curve, ords):
+    """날짜 ordinal 배열 -> log DF. Today 이전 날짜는 커브 밖이므로 NaN (DF=1 로 취급하면 그럴듯한 가짜 forward 가 나옴)"""
+    days = ords - curve.today.toordinal()
+    return np.where(days < 0, np.nan, curve.log_df_t(curve.day_times(days)))
+
+
+def period_forwards(curve, starts, ends, basis=None, compounding="simple"):
+    """(시작, 끝) 날짜 쌍 배열 -> 구간 forward 배열
+
+    starts / ends : date / 'YYYY-MM-DD' / datetime64 / ordinal 배열 (같은 길이)
+    basis         : accrual Basis (하나 또는 쌍별 배열, 기본: 커브 Basis), compounding='simple' 에만 사용
+    시작일이 Today 이전인 구간은 NaN (이미 시작된 구간은 fixing 이 필요하므로 커브로 추정하지 않음)
+    """
+    if compounding not in COMPOUNDING:
+        raise ValueError(f"지원하지 않는 compounding 입니다: {compounding} (가능: {', '.join(COMPOUNDING)})")
+    start_ords, end_ords = to_ordinals(starts), to_ordinals(ends)
+    if start_ords.shape != end_ords.shape:
+        raise ValueError(f"시작일({start_ords.shape})과 종료일({end_ords.shape}) 배열 길이가 다릅니다.")
+    log_ratio = _log_dfs(curve, start_ords) - _log_dfs(curve, end_ords)  # log(DF(s) / DF(e))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if compounding == "continuous":
+            today_ord = curve.today.toordinal()
+            return log_ratio / (curve.day_times(end_ords - today_ord) - curve.day_times(start_ords - today_ord))
+        yf = _accrual_fractions(start_ords, end_ords, curve.basis if basis is None else basis)
+        return np.expm1(log_ratio) / yf
+
+
+def project_floating_leg(curve, starts, ends, pay_dates=None, notionals=1.0, spread=0.0, basis=None, trade_ids=None):
+    """변동 leg 쿠폰 추정 (단리 forward + spread) 과 현재가치
+
+    쿠폰 하나당 한 행(여러 거래의 쿠폰을 이어 붙인 배열). trade_ids 를 주면 거래별 PV 합계도 반환
+    시작일이 Today 이전인 쿠폰은 forward / coupon / pv 가 NaN (fixing 된 쿠폰은 호출 측에서 따로 처리)
+    반환: {'forwards', 'coupons'(notional * (F + spread) * yf), 'pv'(쿠폰 x DF(지급일)), 'trade_pv'(선택)}
+    """
+    start_ords, end_ords = to_ordinals(starts), to_ordinals(ends)
+    log_df_start, log_df_end = _log_dfs(curve, start_ords), _log_dfs(curve, end_ords)
+    yf = _accrual_fractions(start_ords, end_ords, curve.basis if basis is None else basis)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        forwards = np.expm1(log_df_start - log_df_end) / yf
+    coupons = np.asarray(notionals, dtype=float) * (forwards + spread) * yf
+    # 지급일을 따로 주지 않으면 구간 끝 DF 재사용
+    pay_log_df = log_df_end if pay_dates is None else _log_dfs(curve, to_ordinals(pay_dates))
+    pv = coupons * np.exp(pay_log_df)
+    out = {'forwards': forwards, 'coupons': coupons, 'pv': pv}
+    if trade_ids is not None:
+        ids, inverse = np.unique(np.asarray(trade_ids), return_inverse=True)
+        out['trade_ids'] = ids
+        out['trade_pv'] = np.bincount(inverse.ravel(), weights=pv, minlength=len(ids))
+    return out
@@ -0,0 +1,132 @@
+"""
+기준일별 과거 호가 (long format: date, tenor, type, rate)
+
+배치가 기준일마다 그날의 MarketTable 금리를 쓰도록 과거 호가 전체를 한 번만 읽어
+날짜 순으로 정렬된 배열 + 날짜별 [시작, 끝) offset 으로 보관합니다.
+기준일 하나의 호가는 dict 조회 한 번과 배열 slice 로 얻으므로 10년 x 30개 인스트루먼트도 날짜마다 훑지 않습니다.
+
+    - 파일: CSV (표준 라이브러리) 또는 Parquet (pandas 필요, 사용할 때만 import)
+    - 컬럼: Date / Inst. Tenor / Type / Market Rate (대소문자 무관, date / tenor / type / rate 도 허용)
+      type 컬럼이 없으면 테너가 1Y 미만은 Deposit, 그 외는 IRS
+    - 같은 날짜 안에서는 테너 만기 순으로 정렬 (부트스트랩 순서), 같은 (날짜, 테너)가 여러 줄이면 마지막 값
+
+사용 예:
+    quotes = QuoteHistory.load("krw_quotes.parquet")
+    day_inputs = quotes.inputs_for("2026-01-15", base_inputs)   # Jump Date / Basis / Freq 는 base_inputs
+    rates = quotes.rates_for("2026-01-15", ["3M", "1Y", "10Y"])
+"""
+
+import numpy as np
+
+from .dates import tenor_months, to_datetime
+from .daycount import EPOCH_ORDINAL
+from .inputs import CurveInputs, _read_csv_rows
+
+COLUMN_ALIASES = {
+    'date': ('date', 'today', 'trade date', 'as of date'),
+    'tenor': ('inst. tenor', 'tenor', 'inst tenor'),
+    'type': ('type', 'inst. type'),
+    'rate': ('market rate', 'rate', 'quote'),
+}
+
+
+def _tenor_days(tenor):
+    """정렬용 대략적인 테너 일수"""
+    s = str(tenor).upper().strip()
+    months = tenor_months(s)
+    if months is not None:
+        return months * 30.4375
+    num = int(''.join(filter(str.isdigit, s)))
+    return num * 7 if 'W' in s else num
+
+
+def _find_columns(names):
+    lower = {str(n).strip().lower(): n for n in names}
+    found = {}
+    for key, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lower:
+                found[key] = lower[alias]
+                break
+    missing = [k for k in ('date', 'tenor', 'rate') if k not in found]
+    if missing:
+        raise ValueError(f"과거 호가 파일에 필요한 컬럼이 없습니다: {missing} (컬럼: {list(names)})")
+    return found
+
+
+class QuoteHistory:
+    def __init__(self, dates, tenors, types, rates):
+        # 'YYYY-MM-DD' 앞 10자리를 datetime64 로 한 번에 변환 (행마다 strptime 하지 않음)
+        days = np.array([str(d)[:10] for d in dates], dtype='datetime64[D]')
+        ords = days.astype(np.int64) + EPOCH_ORDINAL
+        tenors = np.array([str(t).strip().upper() for t in tenors], dtype=object)
+        types = np.array([str(t).strip() for t in types], dtype=object)
+        rates = np.asarray(rates, dtype=float)
+
+        # (날짜, 테너 만기, 파일 순서) 로 정렬 후 같은 (날짜, 테너) 중 파일에서 나중 줄만 남김
+        tenor_days = np.array([_tenor_days(t) for t in tenors], dtype=float)
+        order = np.lexsort((np.arange(len(ords)), tenor_days, ords))
+        ords, tenors, types, rates, tenor_days = ords[order], tenors[order], types[order], rates[order], tenor_days[order]
+        last = np.ones(len(ords), dtype=bool)
+        if len(ords) > 1:
+            last[:-1] = (ords[1:] != ords[:-1]) | (tenors[1:] != tenors[:-1])
+
+        self.ords, self.tenors, self.types, self.rates = ords[last], tenors[last], types[last], rates[last]
+        self.dates, starts = np.unique(self.ords, return_index=True)
+        self.offsets = np.append(starts, len(self.ords))
+        self._index = {int(d): i for i, d in enumerate(self.dates)}
+
+    @classmethod
+    def load(cls, path):
+        """CSV 또는 Parquet (.parquet / .pq) 파일을 한 번 읽어 QuoteHistory 생성"""
+        if str(path).lower().endswith(('.parquet', '.pq')):
+            import pandas as pd
+            df = pd.read_parquet(path)
+            cols = _find_columns(df.columns)
+            return cls._from_columns(df[cols['date']].tolist(), df[cols['tenor']].tolist(),
+                                     df[cols['type']].tolist() if 'type' in cols else None,
+                                     df[cols['rate']].tolist())
+        rows = _read_csv_rows(path)
+        cols = _find_columns(rows[0].keys() if rows else [])
+        rows = [r for r in rows if r.get(cols['date']) and r.get(cols['tenor'])]
+        return cls._from_columns([r[cols['date']] for r in rows], [r[cols['tenor']] for r in rows],
+                                 [r[cols['type']] for r in rows] if 'type' in cols else None,
+                                 [r[cols['rate']] for r in rows])
+
+    @classmethod
+    def _from_columns(cls, dates, tenors, types, rates):
+        if types is None:
+            types = ["Deposit" if _tenor_days(t) < 365 else "IRS" for t in tenors]
+        return cls(dates, tenors, types, rates)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __contains__(self, d):
+        return to_datetime(d).toordinal() in self._index
+
+    def _slice(self, d):
+        i = self._index.get(to_datetime(d).toordinal())
+        if i is None:
+            raise KeyError(f"과거 호가가 없는 날짜입니다: {to_datetime(d):%Y-%m-%d}")
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def quotes(self, d):
+        """기준일 호가 (tenors, types, rates) - 테너 만기 순"""
+        sl = self._slice(d)
+        return self.tenors[sl].tolist(), self.types[sl].tolist(), self.rates[sl]
+
+    def rates_for(self, d, tenors):
+        """요청한 테너 순서대로 그날의 금리 배열 (없는 테너가 있으면 KeyError)"""
+        sl = self._slice(d)
+        lookup = dict(zip(self.tenors[sl], self.rates[sl]))
+        wanted = [str(t).strip().upper() for t in tenors]
+        missing = [t for t in wanted if t not in lookup]
+        if missing:
+            raise KeyError(f"{to_datetime(d):%Y-%m-%d} 호가에 없는 테너입니다: {missing}")
+        return np.array([lookup[t] for t in wanted], dtype=float)
+
+    def inputs_for(self, d, base):
+        """base(CurveInputs)의 Jump Date / Basis / Freq 에 그날의 인스트루먼트와 금리를 넣은 CurveInputs"""
+        tenors, types, rates = self.quotes(d)
+        return CurveInputs(d, tenors, types, rates, base.jump_dates, base.basis, base.freq)
@@ -0,0 +1,46 @@
+"""
+검증 리포트 (표준 라이브러리 CSV)
+
+HybridReporter.write_validation_sheets 와 같은 항목(Date, Cpn YF, DF, CF Amount, DCF)을
+인스트루먼트별로 계산하고 NPV Error 를 함께 기록합니다. 엑셀 수식 대신 값으로 출력합니다.
+"""
+
+import csv
+from datetime import timedelta
+
+from .bootstrap import instrument_accruals
+
+COLUMNS = ["Tenor", "Type", "Market Rate", "Date", "Cpn YF", "DF", "CF Amount", "DCF", "NPV Error"]
+
+
+def validation_rows(result):
+    inputs, curve = result.inputs, result.curve
+    rows = []
+    for i, (tenor, inst_type, rate) in enumerate(zip(inputs.tenors, inputs.types, inputs.rates)):
+        days, yfs = instrument_accruals(inputs.today, tenor, inst_type, result.mty_dates[i], inputs.freq, inputs.basis)
+        dfs = curve.df_t(curve.day_times(days))
+        is_deposit = inst_type.lower() == "deposit"
+        cf = rate * yfs
+        if is_deposit:
+            cf[-1] += 1.0
+            npv_error = float((cf * dfs).sum() - 1.0)
+        else:
+            # 리포트에는 고정 쿠폰만 표시하고 NPV 에는 변동 leg 1 - DF(만기) 반영
+            npv_error = float((cf * dfs).sum() - (1.0 - dfs[-1]))
+        for j in range(len(days)):
+            rows.append({
+                "Tenor": tenor, "Type": inst_type, "Market Rate": rate,
+                "Date": (inputs.today + timedelta(days=int(days[j]))).strftime('%Y-%m-%d'),
+                "Cpn YF": float(yfs[j]), "DF": float(dfs[j]),
+                "CF Amount": float(cf[j]), "DCF": float(cf[j] * dfs[j]),
+                "NPV Error": npv_error if j == len(days) - 1 else "",
+            })
+    return rows
+
+
+def write_csv(result, output_path):
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(validation_rows(result))
+    return output_path
@@ -0,0 +1,127 @@
+"""
+다중 프로세스 금리 시나리오 부트스트랩 (shared_memory 입력)
+
+Today / 테너 / Jump Date 가 같고 금리만 다른 시나리오 S 개(호가 행렬 S x N)를 여러 프로세스로 나눠 풉니다.
+쿠폰 스케줄 / accrual / 시점은 부모 프로세스에서 한 번만 만들고(IncrementalBootstrap 과 동일),
+호가 행렬과 함께 SharedArrays 블록에 올려 worker 에는 spec(블록 이름)과 행 범위만 보냅니다.
+worker 는 복사 없는 view 로 읽고 결과 forward 행렬(S x N)의 자기 행에 바로 씁니다.
+worker 수가 늘어도 작업당 직렬화 크기와 worker 별 입력 메모리는 늘지 않습니다.
+
+    shared 입력 : quotes (S x N), pillar_times (N, Jump Date 매핑 후 시점), cf_times / cf_accruals (현금흐름 flat),
+                  cf_bounds (N+1)
+    shared 결과 : forwards (S x N), converged (S), max_residual (S)
+    - 같은 chunk 안에서는 직전 시나리오의 forward 를 다음 시나리오 초기값으로 사용
+
+사용 예:
+    quotes = shift_scenarios(inputs.rates, [-50, -25, 0, 25, 50])
+    out = run_scenarios(inputs, quotes, workers=4)
+    out['forwards']   # (5, N)
+"""
+
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .bootstrap import IncrementalBootstrap, solve_sequential
+from .shared import SharedArrays, attach
+
+CHUNKS_PER_WORKER = 4
+
+
+def shift_scenarios(base_rates, shifts_bp):
+    """평행 이동 시나리오 호가 행렬 (len(shifts) x N)"""
+    return np.asarray(base_rates, dtype=float)[None, :] + np.asarray(shifts_bp, dtype=float)[:, None] * 1e-4
+
+
+def random_scenarios(base_rates, n, vol_bp=5.0, seed=None):
+    """테너별 독립 정규 충격 시나리오 호가 행렬 (n x N)"""
+    base = np.asarray(base_rates, dtype=float)
+    rng = np.random.default_rng(seed)
+    return base[None, :] + rng.normal(0.0, vol_bp * 1e-4, size=(int(n), len(base)))
+
+
+def solve_rows(spec, lo, hi, tol=1e-12, max_iter=50):
+    """worker 작업: 시나리오 [lo, hi) 를 풀어 공유 결과 행렬에 기록. (lo, hi, 소요 초) 반환"""
+    return _solve_rows(attach(spec), lo, hi, tol, max_iter)
+
+
+def _solve_rows(a, lo, hi, tol, max_iter):
+    start = time.perf_counter()
+    bounds = a['cf_bounds']
+    n = len(bounds) - 1
+    owner = np.repeat(np.arange(n), np.diff(bounds))
+    last = bounds[1:] - 1
+    times = [a['cf_times'][bounds[i]:bounds[i + 1]] for i in range(n)]
+
+    guesses = None
+    for row in range(lo, hi):
+        rates = a['quotes'][row]
+        amounts = rates[owner] * a['cf_accruals']
+        amounts[last] += 1.0
+        flows = [(times[i], amounts[bounds[i]:bounds[i + 1]]) for i in range(n)]
+        forwards, stats = solve_sequential(a['pillar_times'], flows, rates if guesses is None else guesses,
+                                           tol=tol, max_iter=max_iter)
+        a['forwards'][row] = forwards
+        a['converged'][row] = all(s['converged'] for s in stats)
+        a['max_residual'][row] = max(abs(s['residual']) for s in stats)
+        guesses = forwards
+    return lo, hi, time.perf_counter() - start
+
+
+def _chunks(n, parts):
+    edges = np.linspace(0, n, max(1, min(n, parts)) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def run_scenarios(inputs, quotes, workers=None, tol=1e-12, max_iter=50):
+    """호가 행렬(S x N)의 시나리오별 forward. workers=0 이면 현재 프로세스에서 순차 실행
+
+    반환: {'forwards', 'converged', 'max_residual', 'pillar_dates', 'tenors', 'stats'}
+    """
+    quotes = np.atleast_2d(np.asarray(quotes, dtype=float))
+    if quotes.shape[1] != len(inputs):
+        raise ValueError(f"호가 행렬 열 수({quotes.shape[1]})와 인스트루먼트 수({len(inputs)})가 다릅니다.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    base = IncrementalBootstrap(inputs, tol, max_iter)
+    sizes = [len(t) for t in base.times]
+    s = len(quotes)
+    arrays = {
+        'quotes': quotes,
+        'pillar_times': base.pillar_times,
+        'cf_times': np.concatenate(base.times),
+        'cf_accruals': np.concatenate(base.accruals),
+        'cf_bounds': np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64),
+    }
+    outputs = {'forwards': np.zeros((s, len(inputs))), 'converged': np.zeros(s, dtype=bool),
+               'max_residual': np.zeros(s)}
+
+    started = time.perf_counter()
+    with SharedArrays(arrays, outputs) as shared:
+        chunks = _chunks(s, max(1, workers) * CHUNKS_PER_WORKER)
+        if workers <= 0:
+            # 현재 프로세스는 블록을 만든 쪽이므로 attach 하지 않고 view 를 그대로 사용 (블록은 with 종료 시 해제)
+            views = {name: shared[name] for name in shared.spec}
+            busy = [_solve_rows(views, lo, hi, tol, max_iter)[2] for lo, hi in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(solve_rows, shared.spec, lo, hi, tol, max_iter) for lo, hi in chunks]
+                busy = [f.result()[2] for f in futures]
+        out = {name: shared[name].copy() for name in outputs}
+
+    out.update({
+        'pillar_dates': base.pillar_dates,
+        'tenors': list(inputs.tenors),
+        'stats': {
+            'scenarios': s, 'workers': workers, 'chunks': len(chunks),
+            'wall_s': time.perf_counter() - started, 'busy_s': float(sum(busy)),
+            'shared_bytes': int(sum(v.nbytes for v in arrays.values()) + sum(v.nbytes for v in outputs.values())),
+            # 작업 하나에 실제로 보내는 크기 vs 입력 배열을 매번 pickle 했을 때의 크기
+            'task_payload_bytes': len(pickle.dumps((shared.spec, 0, 1, tol, max_iter))),
+            'pickled_inputs_bytes': len(pickle.dumps(arrays)),
+        },
+    })
+    return out
@@ -0,0 +1,162 @@
+"""
+쿠폰 스케줄 (월 단위 roll, stub, 영업일 조정, Basis 별 accrual)
+
+IRS 고정 leg 지급일을 Today + int(j * 365 / freq) 일 대신 월 단위 roll 로 생성합니다.
+    - 기본: 만기에서 거꾸로 roll (short front stub), 일자는 유지하고 월말 초과 시 말일로 조정
+    - stub: short_front / long_front / short_back / long_back
+    - eom=True 이고 시작일이 월말이면 모든 roll 일을 월말로
+    - 영업일 조정: np.busday_offset (주말 + holidays), 기본 Modified Following
+    - accrual: 조정된 지급일 사이 year fraction (daycount.year_fraction)
+
+미조정 roll 일수 배열(roll 패턴)은 시작일의 (년, 월) 과 28일 초과 일자, 테너/주기/stub 로 결정되므로
+lru_cache 로 보관합니다. 같은 달의 연속된 배치 기준일은 패턴을 다시 만들지 않고
+영업일 조정과 accrual 만 배열 연산 한 번으로 계산합니다.
+
+사용 예:
+    sched = coupon_schedule(today, tenor_months=24, period_months=3)
+    sched.payment_days()   # Today 로부터 지급일까지 일수
+    sched.accruals         # 구간별 year fraction
+"""
+
+import calendar
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
+
+from .dates import add_months, to_datetime
+from .daycount import year_fraction
+
+DEFAULT_CONVENTION = "MODIFIED_FOLLOWING"
+
+# 영업일 조정 규칙 -> np.busday_offset 의 roll 인자 (None 은 조정 안 함)
+BUSINESS_DAY_CONVENTIONS = {
+    "UNADJUSTED": None,
+    "FOLLOWING": "following",
+    "MODIFIED_FOLLOWING": "modifiedfollowing",
+    "PRECEDING": "preceding",
+    "MODIFIED_PRECEDING": "modifiedpreceding",
+}
+
+STUB_TYPES = ("short_front", "long_front", "short_back", "long_back")
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _is_month_end(d):
+    return d.day == calendar.monthrange(d.year, d.month)[1]
+
+
+def _roll(d, months, eom):
+    out = add_months(d, months)
+    if eom:
+        out = out.replace(day=calendar.monthrange(out.year, out.month)[1])
+    return out
+
+
+def period_months_for_freq(freq):
+    """연 지급 횟수 -> 지급 주기(월)"""
+    freq = int(freq)
+    if freq < 1 or 12 % freq:
+        raise ValueError(f"IRS Coupon Freq({freq})는 12의 약수여야 합니다.")
+    return 12 // freq
+
+
+def roll_month_offsets(tenor_months, period_months, stub="short_front"):
+    """시작일 기준 roll 월 오프셋 (0 과 tenor_months 포함, 오름차순)"""
+    if stub not in STUB_TYPES:
+        raise ValueError(f"지원하지 않는 stub 입니다: {stub} (가능: {', '.join(STUB_TYPES)})")
+    if tenor_months <= period_months:
+        return [0, tenor_months]
+
+    has_stub = tenor_months % period_months != 0
+    if stub.endswith("front"):
+        months = list(range(tenor_months, -1, -period_months))[::-1]
+        if has_stub:
+            months = [0] + months
+            if stub == "long_front":
+                months.pop(1)
+    else:
+        months = list(range(0, tenor_months + 1, period_months))
+        if has_stub:
+            months.append(tenor_months)
+            if stub == "long_back":
+                months.pop(-2)
+    return months
+
+
+@lru_cache(maxsize=4096)
+def _roll_pattern(year, month, day, tenor_months, period_months, stub, eom):
+    """시작일 대비 미조정 roll 일수 배열 (시작일 0 포함, 읽기 전용)"""
+    start = date(year, month, day)
+    months = roll_month_offsets(tenor_months, period_months, stub)
+    if stub.endswith("front"):
+        # 만기에서 거꾸로 roll
+        end = _roll(start, tenor_months, eom)
+        dates = [start] + [_roll(end, m - tenor_months, eom) for m in months[1:]]
+    else:
+        dates = [start] + [_roll(start, m, eom) for m in months[1:]]
+    offsets = np.array([d.toordinal() - start.toordinal() for d in dates], dtype=np.int64)
+    offsets.flags.writeable = False
+    return offsets
+
+
+def schedule_cache_info():
+    """roll 패턴 캐시 통계 (hits / misses / currsize)"""
+    info = _roll_pattern.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'currsize': info.currsize}
+
+
+def adjust_ordinals(ordinals, convention=DEFAULT_CONVENTION, holidays=None):
+    """ordinal 배열을 영업일로 조정 (주말 + holidays)"""
+    key = str(convention).upper().strip().replace(" ", "_")
+    if key not in BUSINESS_DAY_CONVENTIONS:
+        raise ValueError(f"지원하지 않는 영업일 조정 규칙입니다: {convention}")
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    roll = BUSINESS_DAY_CONVENTIONS[key]
+    if roll is None:
+        return ordinals
+    days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+    hol = [np.datetime64(to_datetime(h).date(), 'D') for h in (holidays or [])]
+    adjusted = np.busday_offset(days, 0, roll=roll, holidays=hol)
+    return adjusted.astype(np.int64) + EPOCH_ORDINAL
+
+
+class CouponSchedule:
+    """시작일(ordinal) 과 구간별 accrual 시작/종료(=지급일) ordinal 배열"""
+
+    def __init__(self, start_ord, accrual_start, accrual_end, basis="ACT/365"):
+        self.start_ord = int(start_ord)
+        self.accrual_start = np.asarray(accrual_start, dtype=np.int64)
+        self.accrual_end = np.asarray(accrual_end, dtype=np.int64)
+        self.basis = basis
+        self.accruals = year_fraction(self.accrual_start, self.accrual_end, basis)
+
+    def __len__(self):
+        return len(self.accrual_end)
+
+    def payment_days(self):
+        """시작일로부터 지급일까지 일수 (int64)"""
+        return self.accrual_end - self.start_ord
+
+    def payment_dates(self):
+        return [datetime.fromordinal(int(o)) for o in self.accrual_end]
+
+
+def coupon_schedule(start, tenor_months, period_months, stub="short_front", convention=DEFAULT_CONVENTION,
+                    basis="ACT/365", holidays=None, eom=False):
+    """start 부터 tenor_months 개월, period_months 주기의 지급 스케줄"""
+    start = to_datetime(start)
+    tenor_months, period_months = int(tenor_months), int(period_months)
+    if tenor_months < 1 or period_months < 1:
+        raise ValueError(f"테너({tenor_months}M)와 지급 주기({period_months}M)는 1개월 이상이어야 합니다.")
+
+    # 28일 이하 일자는 roll 일수에 영향이 없으므로 1일로 정규화하여 같은 달의 기준일끼리 패턴 공유
+    eom = bool(eom) and _is_month_end(start)
+    day = start.day if (start.day > 28 or eom) else 1
+    offsets = _roll_pattern(start.year, start.month, day, tenor_months, period_months, stub, eom)
+
+    start_ord = start.toordinal()
+    pay = adjust_ordinals(start_ord + offsets[1:], convention, holidays)
+    accrual_start = np.concatenate([[start_ord], pay[:-1]])
+    return CouponSchedule(start_ord, accrual_start, pay, basis)
@@ -0,0 +1,255 @@
+"""
+로컬 커브 조회 서비스 (asyncio HTTP/JSON, 표준 라이브러리만 사용)
+
+하위 pricer 가 스크립트를 import 하거나 다시 실행하지 않고 HTTP 로 커브를 받아 쓰도록 합니다.
+
+    POST /curve         {"inputs": CurveInputs dict}                      -> {"key", "curve": BootstrapResult dict}
+    POST /curve/query   {"key" | "inputs", "dates": [...], "measures": ["df", "zero", "forward"]}
+    POST /swaps/price   {"key" | "inputs", "swaps": [{"tenor", "rate", "notional", "pay_fixed"}]}
+    GET  /health, GET /stats
+
+    - 커브 키: cache.curve_key (입력 + ENGINE_VERSION 해시)
+    - 같은 키의 동시 요청은 진행 중인 계산 하나를 함께 기다림 (request coalescing)
+    - 계산된 커브는 메모리 LRU 에 보관, cache_dir 이 있으면 CurveCache(디스크)도 사용
+    - 부트스트랩 / 스왑 가격 / 큰 날짜 배열 조회는 ProcessPoolExecutor 에서 실행 (이벤트 루프는 I/O 만)
+
+사용 예:
+    python -m krw_curve serve --port 8765
+    curl -X POST localhost:8765/curve -d @curve_inputs.json
+"""
+
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from .bootstrap import ENGINE_VERSION, BootstrapResult
+from .cache import curve_key
+from .inputs import CurveInputs
+
+DEFAULT_PORT = 8765
+MEMORY_CURVES = 256
+INLINE_QUERY_LIMIT = 2000  # 이보다 많은 날짜 조회는 프로세스 풀에서 계산
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- 프로세스 풀 작업 (pickle 가능한 dict 만 주고받음) ---
+
+def build_curve_job(inputs_dict):
+    from .bootstrap import bootstrap_curve
+    return bootstrap_curve(CurveInputs.from_dict(inputs_dict)).to_dict()
+
+
+def query_curve_job(result_dict, dates, measures):
+    return query_curve(BootstrapResult.from_dict(result_dict), dates, measures)
+
+
+def price_swaps_job(result_dict, swaps):
+    from .pricing import price_swaps
+    return price_swaps(BootstrapResult.from_dict(result_dict), swaps)
+
+
+def query_curve(result, dates, measures):
+    curve = result.curve
+    funcs = {'df': curve.df, 'zero': curve.zero_rate, 'forward': curve.instantaneous_forward}
+    unknown = [m for m in measures if m not in funcs]
+    if unknown:
+        raise ValueError(f"지원하지 않는 measure 입니다: {unknown} (가능: {sorted(funcs)})")
+    return {m: funcs[m](dates).tolist() for m in measures}
+
+
+class CurveService:
+    def __init__(self, workers=None, cache=None, memory_curves=MEMORY_CURVES):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+        self.memory_curves = memory_curves
+        self.executor = None
+        self._curves = OrderedDict()   # key -> (BootstrapResult dict, BootstrapResult)
+        self._inflight = {}            # key -> asyncio.Future
+        self.counts = {'requests': 0, 'builds': 0, 'coalesced': 0, 'memory_hits': 0, 'disk_hits': 0, 'errors': 0}
+
+    # --- 커브 ---
+
+    def _remember(self, key, result_dict):
+        entry = (result_dict, BootstrapResult.from_dict(result_dict))
+        self._curves[key] = entry
+        self._curves.move_to_end(key)
+        while len(self._curves) > self.memory_curves:
+            self._curves.popitem(last=False)
+        return entry
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def _build(self, key, inputs):
+        if self.cache is not None:
+            hit = await asyncio.to_thread(self.cache.get, key)
+            if hit is not None:
+                self.counts['disk_hits'] += 1
+                return hit
+        self.counts['builds'] += 1
+        result_dict = await self._run(build_curve_job, inputs.to_dict())
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put, key, result_dict)
+        return result_dict
+
+    async def get_curve(self, inputs):
+        """(key, BootstrapResult dict, BootstrapResult) - 메모리 -> 진행 중 계산 -> 디스크 -> 새 계산 순"""
+        key = curve_key(inputs.today, inputs.basis, inputs.freq, inputs.tenors, inputs.types, inputs.rates,
+                        inputs.jump_dates, ENGINE_VERSION)
+        if key in self._curves:
+            self.counts['memory_hits'] += 1
+            self._curves.move_to_end(key)
+            return (key,) + self._curves[key]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.counts['coalesced'] += 1
+        else:
+            future = asyncio.ensure_future(self._build(key, inputs))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 요청 하나가 끊겨도 다른 대기자의 계산은 취소되지 않도록 shield
+        result_dict = await asyncio.shield(future)
+        if key not in self._curves:
+            self._remember(key, result_dict)
+        return (key,) + self._curves[key]
+
+    async def _resolve(self, body):
+        if 'key' in body:
+            entry = self._curves.get(body['key'])
+            if entry is None:
+                raise HttpError(404, f"커브 키가 없습니다: {body['key']} (inputs 로 다시 요청해 주세요)")
+            return (body['key'],) + entry
+        if 'inputs' in body:
+            return await self.get_curve(CurveInputs.from_dict(body['inputs']))
+        raise HttpError(400, "'key' 또는 'inputs' 가 필요합니다.")
+
+    # --- 엔드포인트 ---
+
+    async def handle(self, method, path, body):
+        if path == "/health":
+            return {'status': 'ok', 'engine': ENGINE_VERSION}
+        if path == "/stats":
+            return {**self.counts, 'curves': len(self._curves), 'inflight': len(self._inflight),
+                    'workers': self.workers}
+        if method != "POST":
+            raise HttpError(405, f"{path} 는 POST 만 지원합니다.")
+
+        if path == "/curve":
+            inputs = CurveInputs.from_dict(body.get('inputs', body))
+            key, result_dict, _ = await self.get_curve(inputs)
+            return {'key': key, 'curve': result_dict}
+
+        if path == "/curve/query":
+            key, result_dict, result = await self._resolve(body)
+            dates = body.get('dates', [])
+            measures = body.get('measures', ['df'])
+            if len(dates) > INLINE_QUERY_LIMIT:
+                values = await self._run(query_curve_job, result_dict, dates, measures)
+            else:
+                values = query_curve(result, dates, measures)
+            return {'key': key, 'dates': dates, **values}
+
+        if path == "/swaps/price":
+            key, result_dict, _ = await self._resolve(body)
+            return {'key': key, 'swaps': await self._run(price_swaps_job, result_dict, body.get('swaps', []))}
+
+        raise HttpError(404, f"없는 경로입니다: {path}")
+
+    # --- HTTP ---
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode('latin-1').split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "잘못된 요청 줄입니다.")
+        headers = {}
+        while True:
+            h = await reader.readline()
+            if h in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = h.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0) or 0)
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "요청 본문이 너무 큽니다.")
+        raw = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0], headers, raw
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + data)
+        await writer.drain()
+
+    async def _serve_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, raw = request
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+                    self.counts['requests'] += 1
+                    body = json.loads(raw) if raw else {}
+                    status, payload = 200, await self.handle(method, path, body)
+                except HttpError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except (ValueError, KeyError, TypeError) as e:
+                    status, payload = 400, {'error': f"{type(e).__name__}: {e}"}
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as e:
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+                if status != 200:
+                    self.counts['errors'] += 1
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, ready=None):
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        server = await asyncio.start_server(self._serve_connection, host, port)
+        try:
+            if ready is not None:
+                ready(server)
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run(host="127.0.0.1", port=DEFAULT_PORT, workers=None, cache=None):
+    service = CurveService(workers, cache)
+
+    def ready(server):
+        addr = server.sockets[0].getsockname()
+        print(f"커브 서비스 시작: http://{addr[0]}:{addr[1]} (worker {service.workers}개)")
+
+    try:
+        asyncio.run(service.serve(host, port, ready))
+    except KeyboardInterrupt:
+        print("커브 서비스 종료")
@@ -0,0 +1,115 @@
+"""
+프로세스 간 공유 NumPy 배열 (multiprocessing.shared_memory)
+
+시나리오 / 배치 작업을 여러 프로세스로 나눌 때 호가 행렬, Jump Date ordinal, 쿠폰 스케줄,
+accrual 같은 읽기 전용 입력을 작업마다 pickle 해서 보내면 worker 수만큼 직렬화 비용과 메모리가 늘어납니다.
+SharedArrays 는 배열을 shared_memory 블록에 한 번 복사하고, worker 에는 블록 이름과 shape/dtype(spec)만 보냅니다.
+worker 는 attach(spec) 로 복사 없이 같은 메모리를 가리키는 NumPy view 를 얻습니다.
+
+    - 입력 배열 view 는 읽기 전용 (writeable=False), writable 로 지정한 배열(결과 행렬 등)만 worker 가 씀
+    - attach 한 블록은 프로세스별로 캐시 (같은 spec 으로 여러 작업을 받아도 한 번만 연결)
+      블록을 만든 프로세스는 attach 하지 말고 shared[이름] view 를 사용 (캐시에 남아 블록이 계속 매핑됨)
+    - 블록 해제(unlink)는 만든 프로세스(SharedArrays)만 수행, with 블록 종료 시 자동
+
+사용 예:
+    with SharedArrays({'quotes': quote_matrix, 'accruals': flat_accruals}, writable={'out': np.zeros((n, k))}) as shared:
+        pool.map(job, [(shared.spec, lo, hi) for lo, hi in chunks])
+        result = shared['out'].copy()
+
+    def job(args):
+        spec, lo, hi = args
+        arrays = attach(spec)
+        arrays['out'][lo:hi] = ...
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_ATTACHED = {}  # 블록 이름 -> SharedMemory (worker 프로세스에서 view 가 살아 있는 동안 유지)
+
+
+def _open_block(name):
+    try:
+        # Python 3.13+: 연결만 하는 프로세스는 resource tracker 에 등록하지 않음 (소유자만 unlink)
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _view(block, shape, dtype, writable):
+    arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    arr.flags.writeable = writable
+    return arr
+
+
+class SharedArrays:
+    def __init__(self, arrays, writable=None):
+        """arrays: {이름: 배열} (worker 에서 읽기 전용), writable: {이름: 초기값 배열} (worker 가 쓰는 결과 배열)"""
+        self._blocks = {}
+        self._arrays = {}
+        self.spec = {}
+        try:
+            for flag, group in ((False, arrays), (True, writable or {})):
+                for name, value in group.items():
+                    value = np.ascontiguousarray(value)
+                    self._create(name, value.shape, value.dtype, flag)[...] = value
+        except BaseException:
+            self.close()
+            raise
+
+    def _create(self, name, shape, dtype, writable):
+        nbytes = max(1, int(np.prod(shape)) * dtype.itemsize)
+        block = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._blocks[name] = block
+        self.spec[name] = (block.name, shape, dtype.str, writable)
+        self._arrays[name] = arr = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        return arr
+
+    def __getitem__(self, name):
+        return self._arrays[name]
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in self._arrays.values())
+
+    def close(self):
+        self._arrays = {}
+        for block in self._blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                pass  # 밖에서 잡고 있는 view 가 있으면 매핑은 그 view 가 사라질 때 해제
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def attach(spec):
+    """spec -> {이름: NumPy view} (복사 없음, 프로세스별로 블록 연결을 캐시)"""
+    arrays = {}
+    for name, (block_name, shape, dtype, writable) in spec.items():
+        block = _ATTACHED.get(block_name)
+        if block is None:
+            block = _ATTACHED[block_name] = _open_block(block_name)
+        arrays[name] = _view(block, shape, dtype, writable)
+    return arrays
+
+
+def detach_all():
+    """worker 종료 전 연결 해제 (unlink 는 하지 않음)"""
+    for block in _ATTACHED.values():
+        try:
+            block.close()
+        except BufferError:
+            pass  # 아직 살아 있는 view 가 있음 - 프로세스 종료 시 해제
+    _ATTACHED.clear()
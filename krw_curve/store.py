@@ -0,0 +1,303 @@
+"""
+과거 커브 저장소 (고정 stride memmap 배열 + 날짜 인덱스)
+
+run_batch 가 매일 만든 커브를 몇 년치 쌓아 두고 시계열 조회를 합니다.
+
+    <directory>/
+        meta.json        stride(행당 최대 pillar 수), basis 목록
+        dates.i8         기준일 ordinal (int64, 오름차순, append-only)
+        counts.i2        행별 실제 pillar 수
+        basis.u1         행별 basis 코드 (meta.json 'bases' 의 index)
+        pillar_days.i4   Today 로부터 pillar 일수 (int32 x stride, 남는 칸은 마지막 값 반복)
+        forwards.f8      pillar 구간 forward (float64 x stride, 남는 칸은 마지막 값 반복)
+
+    - 행 = 기준일 하나. 모든 파일이 고정 stride 라 i 번째 커브는 오프셋 계산만으로 np.memmap 에서 읽음
+    - 날짜 인덱스: 첫 기준일부터 하루 단위 배열 (정확한 날짜 -> 행, as-of -> 그 날 이하 마지막 행), 조회 O(1)
+    - 시계열 조회는 기간에 해당하는 행만 CHUNK_ROWS 단위로 memmap 에서 잘라 (행 x stride) 로 한 번에 계산
+      (남는 칸을 마지막 값으로 채웠으므로 구간 폭이 0 -> pillar 수가 다른 행도 같은 식으로 계산)
+    - 쓰기: 데이터 파일을 먼저 덧붙이고 dates 를 마지막에 기록 -> 중간에 끊겨도 dates 길이까지만 유효
+
+사용 예:
+    store = CurveStore("Curve_History")
+    store.append(result)                                   # BootstrapResult 또는 ForwardCurve
+    dates, z10 = store.query("10Y", "zero", start="2026-01-01", end="2026-12-31")
+    dates, fwd = store.event_forwards(bok_meeting_dates)   # 다음 금통위 ~ 그 다음 금통위 구간 forward
+    curve = store.curve("2026-03-15")                      # 그 날 이하 마지막 커브 (as-of)
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .curve import ForwardCurve
+from .dates import add_tenor_ordinals, to_datetime
+from .daycount import EPOCH_ORDINAL, normalize_basis, year_fraction
+from .fileio import atomic_write_text
+
+DEFAULT_STORE_DIR = "Curve_History"
+DEFAULT_STRIDE = 64
+CHUNK_ROWS = 4096
+
+# 파일명 -> (dtype, 행당 값 개수가 stride 인지)
+COLUMNS = {
+    'counts': ('i2', False),
+    'basis': ('u1', False),
+    'pillar_days': ('i4', True),
+    'forwards': ('f8', True),
+}
+
+
+def _ordinal(d):
+    return to_datetime(d).toordinal()
+
+
+def _to_datetime64(ords):
+    return (np.asarray(ords, dtype=np.int64) - EPOCH_ORDINAL).astype('datetime64[D]')
+
+
+class CurveStore:
+    def __init__(self, directory=DEFAULT_STORE_DIR, stride=DEFAULT_STRIDE):
+        self.directory = directory
+        meta_path = os.path.join(directory, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                self.meta = json.load(f)
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self.meta = {'format': 1, 'stride': int(stride), 'bases': []}
+            self._write_meta()
+        self.stride = int(self.meta['stride'])
+        self._refresh()
+
+    # --- 파일 ---
+
+    def _path(self, name, dtype):
+        return os.path.join(self.directory, f"{name}.{dtype}")
+
+    def _write_meta(self):
+        atomic_write_text(os.path.join(self.directory, "meta.json"), json.dumps(self.meta, ensure_ascii=False))
+
+    def _map(self, name, dtype, wide):
+        shape = (self.n, self.stride) if wide else (self.n,)
+        if self.n == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self._path(name, dtype), dtype=dtype, mode='r', shape=shape)
+
+    def _refresh(self):
+        """dates 파일 길이 기준으로 memmap 과 날짜 인덱스를 다시 구성"""
+        dates_path = self._path('dates', 'i8')
+        size = os.path.getsize(dates_path) if os.path.exists(dates_path) else 0
+        self.n = size // 8
+        self._dates = self._map('dates', 'i8', False)
+        self._cols = {name: self._map(name, dtype, wide) for name, (dtype, wide) in COLUMNS.items()}
+        if self.n:
+            self._first = int(self._dates[0])
+            span = np.arange(self._first, int(self._dates[-1]) + 1, dtype=np.int64)
+            # 하루 단위 as-of 인덱스: span[i] 이하 마지막 행
+            self._asof = (np.searchsorted(self._dates, span, side='right') - 1).astype(np.int32)
+        else:
+            self._first, self._asof = 0, np.zeros(0, dtype=np.int32)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def last_date(self):
+        """마지막 기준일 (비어 있으면 None) - 이보다 뒤 날짜만 append 가능"""
+        return to_datetime(_to_datetime64(self._dates[-1]).item()) if self.n else None
+
+    def __contains__(self, d):
+        try:
+            self.row(d, asof=False)
+        except KeyError:
+            return False
+        return True
+
+    # --- 쓰기 ---
+
+    def _basis_code(self, basis):
+        basis = normalize_basis(basis)
+        if basis not in self.meta['bases']:
+            self.meta['bases'].append(basis)
+            self._write_meta()
+        return self.meta['bases'].index(basis)
+
+    def append(self, curve):
+        """BootstrapResult 또는 ForwardCurve 를 마지막 기준일 다음 행으로 추가"""
+        curve = getattr(curve, 'curve', curve)
+        return self.append_curve(curve.today, curve.pillar_dates, curve.forwards, curve.basis)
+
+    def append_curve(self, today, pillar_dates, forwards, basis="ACT/365"):
+        today_ord = _ordinal(today)
+        if self.n and today_ord <= int(self._dates[-1]):
+            last = _to_datetime64(self._dates[-1])
+            raise ValueError(f"append-only 저장소입니다: {to_datetime(today):%Y-%m-%d} <= 마지막 기준일 {last}")
+        days = np.array([_ordinal(d) - today_ord for d in pillar_dates], dtype=np.int64)
+        forwards = np.asarray(forwards, dtype=float)
+        count = len(forwards)
+        if count == 0 or count != len(days):
+            raise ValueError(f"pillar 수({len(days)})와 forward 수({count})가 맞지 않습니다.")
+        if count > self.stride:
+            raise ValueError(f"pillar 수({count})가 저장소 stride({self.stride})보다 많습니다.")
+
+        pad = self.stride - count
+        row = {
+            'counts': np.array([count], dtype='i2'),
+            'basis': np.array([self._basis_code(basis)], dtype='u1'),
+            'pillar_days': np.concatenate([days, np.repeat(days[-1], pad)]).astype('i4'),
+            'forwards': np.concatenate([forwards, np.repeat(forwards[-1], pad)]).astype('f8'),
+        }
+        # memmap 을 닫은 뒤 기록 (이전에 끊긴 쓰기의 꼬리는 n 행 길이로 잘라냄)
+        self._dates, self._cols = None, {}
+        for name, (dtype, wide) in COLUMNS.items():
+            with open(self._path(name, dtype), 'ab') as f:
+                f.truncate(self.n * np.dtype(dtype).itemsize * (self.stride if wide else 1))
+                f.write(row[name].tobytes())
+        with open(self._path('dates', 'i8'), 'ab') as f:
+            f.truncate(self.n * 8)
+            f.write(np.array([today_ord], dtype='i8').tobytes())
+        self._refresh()
+        return self.n - 1
+
+    # --- 날짜 조회 ---
+
+    def row(self, d, asof=True):
+        """기준일 -> 행 번호. asof=True 면 그 날 이하 마지막 기준일 행 (없으면 KeyError)"""
+        i = _ordinal(d) - self._first
+        if self.n == 0 or i < 0:
+            raise KeyError(f"저장된 커브가 없습니다: {d}")
+        if i >= len(self._asof):
+            if asof:
+                return self.n - 1
+            raise KeyError(f"저장된 커브가 없습니다: {d}")
+        r = int(self._asof[i])
+        if not asof and int(self._dates[r]) != _ordinal(d):
+            raise KeyError(f"저장된 커브가 없습니다: {d}")
+        return r
+
+    def _row_range(self, start=None, end=None):
+        lo = 0 if start is None else self._first_row_on_or_after(start)
+        hi = self.n if end is None else self._last_row_on_or_before(end) + 1
+        return lo, max(lo, hi)
+
+    def _first_row_on_or_after(self, d):
+        i = _ordinal(d) - self._first
+        if i <= 0:
+            return 0
+        if i > len(self._asof):
+            return self.n
+        return int(self._asof[i - 1]) + 1
+
+    def _last_row_on_or_before(self, d):
+        try:
+            return self.row(d, asof=True)
+        except KeyError:
+            return -1
+
+    def dates(self, start=None, end=None):
+        lo, hi = self._row_range(start, end)
+        return _to_datetime64(self._dates[lo:hi])
+
+    def curve(self, d, asof=True):
+        r = self.row(d, asof)
+        count = int(self._cols['counts'][r])
+        today_ord = int(self._dates[r])
+        pillar_ords = today_ord + self._cols['pillar_days'][r, :count].astype(np.int64)
+        return ForwardCurve(_to_datetime64(today_ord).item(),
+                            [p.item() for p in _to_datetime64(pillar_ords)],
+                            np.array(self._cols['forwards'][r, :count]),
+                            self.meta['bases'][int(self._cols['basis'][r])])
+
+    # --- 시계열 조회 (행 x stride 블록) ---
+
+    def _blocks(self, start, end):
+        lo, hi = self._row_range(start, end)
+        for a in range(lo, hi, CHUNK_ROWS):
+            yield _Block(self, a, min(a + CHUNK_ROWS, hi))
+
+    def _collect(self, start, end, func):
+        dates = self.dates(start, end)
+        parts = [func(block) for block in self._blocks(start, end)]
+        return dates, (np.concatenate(parts) if parts else np.zeros(0))
+
+    def query(self, tenor, measure="zero", start=None, end=None):
+        """기준일마다 Today + tenor 시점의 measure ('df', 'zero', 'forward') -> (기준일 배열, 값 배열)"""
+        funcs = {'df': _Block.df, 'zero': _Block.zero, 'forward': _Block.instantaneous_forward}
+        if measure not in funcs:
+            raise ValueError(f"지원하지 않는 measure 입니다: {measure} (가능: {sorted(funcs)})")
+        return self._collect(start, end,
+                             lambda b: funcs[measure](b, add_tenor_ordinals(b.today, tenor)))
+
+    def forward_rates(self, start_tenor, end_tenor, start=None, end=None):
+        """기준일마다 [Today + start_tenor, Today + end_tenor] 구간 forward (연속복리, 예: 1Y, 2Y -> 1Y1Y)"""
+        return self._collect(start, end, lambda b: b.period_forward(add_tenor_ordinals(b.today, start_tenor),
+                                                                    add_tenor_ordinals(b.today, end_tenor)))
+
+    def event_forwards(self, event_dates, start=None, end=None):
+        """기준일마다 다음 이벤트(예: 금통위) ~ 그 다음 이벤트 구간 forward (이벤트가 2개 미만 남으면 nan)"""
+        events = np.unique([_ordinal(d) for d in event_dates]).astype(np.int64)
+
+        def func(block):
+            k = np.searchsorted(events, block.today, side='right')
+            ok = k + 1 < len(events)
+            s = events[np.minimum(k, len(events) - 1)]
+            e = events[np.minimum(k + 1, len(events) - 1)]
+            return np.where(ok, block.period_forward(s, np.where(ok, e, s + 1)), np.nan)
+
+        return self._collect(start, end, func)
+
+
+class _Block:
+    """연속된 행 [lo, hi) 의 커브를 (행 x stride) 배열로 평가 (PiecewiseFlatForward 와 같은 규칙)"""
+
+    def __init__(self, store, lo, hi):
+        self.today = np.asarray(store._dates[lo:hi], dtype=np.int64)
+        self.forwards = np.asarray(store._cols['forwards'][lo:hi])
+        days = np.asarray(store._cols['pillar_days'][lo:hi], dtype=np.int64)
+        codes = np.asarray(store._cols['basis'][lo:hi])
+        self.bases = [(store.meta['bases'][c], codes == c) for c in np.unique(codes)]
+
+        self.pillar_times = self._times(self.today[:, None] + days)
+        zero = np.zeros((len(self.today), 1))
+        widths = np.diff(np.hstack([zero, self.pillar_times]), axis=1)
+        self.log_df_table = np.hstack([zero, -np.cumsum(self.forwards * widths, axis=1)])
+        self.starts = np.hstack([zero, self.pillar_times])[:, :-1]
+
+    def _times(self, ords):
+        """행별 Today ~ ords 의 year fraction (행마다 저장된 Basis 사용)"""
+        ords = np.asarray(ords, dtype=np.int64)
+        today = self.today.reshape((-1,) + (1,) * (ords.ndim - 1))
+        if len(self.bases) == 1:
+            return year_fraction(today, ords, self.bases[0][0])
+        out = np.empty(ords.shape)
+        for basis, mask in self.bases:
+            out[mask] = year_fraction(today[mask], ords[mask], basis)
+        return out
+
+    def _segment(self, t):
+        # target <= pillar 이면 해당 구간 forward 사용 (searchsorted side='left' 와 같음)
+        seg = (self.pillar_times < t[:, None]).sum(axis=1)
+        return np.minimum(seg, self.forwards.shape[1] - 1)[:, None]
+
+    def log_df_t(self, t):
+        seg = self._segment(t)
+        pick = lambda a: np.take_along_axis(a, seg, axis=1)[:, 0]
+        out = pick(self.log_df_table) - pick(self.forwards) * (t - pick(self.starts))
+        return np.where(t <= 0, 0.0, out)
+
+    def df(self, ords):
+        return np.exp(self.log_df_t(self._times(ords)))
+
+    def zero(self, ords):
+        t = self._times(ords)
+        safe_t = np.where(t > 0, t, 1.0)
+        return np.where(t > 0, -self.log_df_t(t) / safe_t, self.forwards[:, 0])
+
+    def instantaneous_forward(self, ords):
+        return np.take_along_axis(self.forwards, self._segment(self._times(ords)), axis=1)[:, 0]
+
+    def period_forward(self, start_ords, end_ords):
+        t1, t2 = self._times(start_ords), self._times(end_ords)
+        width = np.where(t2 > t1, t2 - t1, np.nan)
+        return (self.log_df_t(t1) - self.log_df_t(t2)) / width
@@ -0,0 +1,185 @@
+"""
+스트리밍 커브 갱신 (로컬 feed 파일 tail -> 증분 부트스트랩 -> 원자적 게시)
+
+장중 호가를 JSON Lines 파일로 받는 로컬 feed 를 tail 하면서 커브를 계속 갱신합니다.
+    - feed 한 줄: {"tenor": "1Y", "rate": 0.0325} 또는 {"quotes": [{"tenor": ..., "rate": ...}, ...]}
+      (선택) "ts": 호가 발생 시각 (time.time() 기준 epoch 초)
+    - 한 번의 poll 에서 읽은 줄을 모두 반영한 뒤 한 번만 갱신 (burst 병합, 테너별 마지막 값 사용)
+    - IncrementalBootstrap 으로 금리가 바뀐 첫 인스트루먼트부터만 다시 풀이
+    - 게시: 임시 파일 작성 후 os.replace (원자적), on_publish 콜백으로 같은 프로세스에도 전달
+    - 지연: feed 읽기 ~ 게시 완료 (latency_ms), ts 가 있으면 호가 발생 ~ 게시 완료 (quote_latency_ms)
+      p50 / p90 / p99 / max 를 latency_summary() 로 제공하고 종료 시 telemetry JSON Lines 에 기록
+
+사용 예:
+    python -m krw_curve stream --inputs inputs.json --feed quotes.jsonl --output live_curve.json
+"""
+
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from .bootstrap import IncrementalBootstrap
+from .fileio import atomic_write_text
+from .telemetry import write_jsonl
+
+LATENCY_WINDOW = 10000
+
+
+def percentiles(values):
+    if not values:
+        return {'count': 0}
+    arr = np.fromiter(values, dtype=float)
+    p50, p90, p99 = np.percentile(arr, [50, 90, 99])
+    return {'count': len(arr), 'p50': float(p50), 'p90': float(p90), 'p99': float(p99), 'max': float(arr.max())}
+
+
+class FileTail:
+    """줄 단위 파일 tail (끝나지 않은 마지막 줄은 다음 poll 까지 보관, 파일이 줄어들면 처음부터 다시 읽음)"""
+
+    def __init__(self, path, from_start=False):
+        self.path = path
+        self.from_start = from_start
+        self._f = None
+        self._buf = b""
+
+    def _open(self):
+        if not os.path.exists(self.path):
+            return False
+        self._f = open(self.path, 'rb')
+        if not self.from_start:
+            self._f.seek(0, os.SEEK_END)
+        # 처음 연 이후(rotation / truncate)에는 항상 처음부터
+        self.from_start = True
+        return True
+
+    def read_lines(self):
+        if self._f is None and not self._open():
+            return []
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            return []
+        if size < self._f.tell():
+            self.close()
+            if not self._open():
+                return []
+        chunk = self._f.read()
+        if not chunk:
+            return []
+        lines = (self._buf + chunk).split(b"\n")
+        self._buf = lines.pop()
+        return [line.decode('utf-8') for line in lines if line.strip()]
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+        self._f = None
+        self._buf = b""
+
+
+class CurveStream:
+    def __init__(self, inputs, output_path=None, telemetry_path=None, on_publish=None, tol=1e-12):
+        self.engine = IncrementalBootstrap(inputs, tol=tol)
+        self.output_path = output_path
+        self.telemetry_path = telemetry_path
+        self.on_publish = on_publish
+        self.result = None
+        self.seq = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.quote_latencies = deque(maxlen=LATENCY_WINDOW)
+        self.counts = {'lines': 0, 'quotes': 0, 'unchanged': 0, 'unknown_tenor': 0, 'bad_line': 0, 'refreshes': 0}
+
+    def apply(self, messages):
+        """메시지 목록을 엔진에 반영하고 실제로 바뀐 테너 수 반환"""
+        changed = 0
+        for msg in messages:
+            for q in msg.get('quotes', [msg]):
+                self.counts['quotes'] += 1
+                try:
+                    if self.engine.set_rate(q['tenor'], q['rate']):
+                        changed += 1
+                    else:
+                        self.counts['unchanged'] += 1
+                except (KeyError, TypeError, ValueError):
+                    self.counts['unknown_tenor'] += 1
+        return changed
+
+    def process_lines(self, lines, received_at=None):
+        """feed 에서 읽은 줄 묶음을 한 번에 반영, 바뀐 값이 있으면 한 번만 갱신 (갱신했으면 True)"""
+        received_at = time.perf_counter() if received_at is None else received_at
+        messages = []
+        for line in lines:
+            self.counts['lines'] += 1
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                self.counts['bad_line'] += 1
+                continue
+            if isinstance(msg, dict):
+                messages.append(msg)
+            else:
+                self.counts['bad_line'] += 1
+        if not self.apply(messages) and self.result is not None:
+            return False
+        stamps = [m['ts'] for m in messages if isinstance(m.get('ts'), (int, float))]
+        self.refresh(received_at, min(stamps) if stamps else None)
+        return True
+
+    def refresh(self, received_at=None, quote_ts=None):
+        received_at = time.perf_counter() if received_at is None else received_at
+        result = self.engine.solve()
+        self.seq += 1
+        self.counts['refreshes'] += 1
+        self.publish(result)
+        self.latencies.append((time.perf_counter() - received_at) * 1000.0)
+        if quote_ts is not None:
+            self.quote_latencies.append((time.time() - quote_ts) * 1000.0)
+        return result
+
+    def publish(self, result):
+        self.result = result
+        if self.output_path:
+            payload = result.to_dict()
+            payload['stream'] = {'seq': self.seq, 'published_at': datetime.now().isoformat(timespec='microseconds')}
+            atomic_write_text(self.output_path, json.dumps(payload, ensure_ascii=False))
+        if self.on_publish is not None:
+            self.on_publish(result, self.seq)
+
+    def latency_summary(self):
+        return {
+            'latency_ms': percentiles(self.latencies),
+            'quote_latency_ms': percentiles(self.quote_latencies),
+            **self.counts,
+        }
+
+    def run(self, feed_path, poll_interval=0.001, from_start=False, max_refreshes=None, idle_timeout=None):
+        """feed 파일을 tail 하며 갱신 (Ctrl+C, max_refreshes, idle_timeout 초 동안 입력 없음 중 하나로 종료)"""
+        tail = FileTail(feed_path, from_start)
+        if self.result is None:
+            self.refresh()
+        last_input = time.perf_counter()
+        try:
+            while max_refreshes is None or self.counts['refreshes'] < max_refreshes:
+                lines = tail.read_lines()
+                now = time.perf_counter()
+                if lines:
+                    last_input = now
+                    self.process_lines(lines, now)
+                    continue
+                if idle_timeout is not None and now - last_input > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+        except KeyboardInterrupt:
+            print("스트리밍 중단 (Ctrl+C)")
+        finally:
+            tail.close()
+            summary = self.latency_summary()
+            if self.telemetry_path:
+                write_jsonl(self.telemetry_path, {'run_type': 'krw_curve_stream', 'feed': feed_path,
+                                                  'finished_at': datetime.now().isoformat(timespec='seconds'),
+                                                  **summary})
+        return summary
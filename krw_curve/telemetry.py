@@ -0,0 +1,130 @@
+"""
+Bootstrap Telemetry
+
+HybridReporter / BatchBootstrapper 실행 시 구조화된 계측 정보를 JSON Lines로 기록합니다.
+
+    - 단계(phase)별 wall time
+    - 인스트루먼트별 root-finder 반복 횟수 / 함수 평가 횟수 / 최종 잔차 / 수렴 여부
+    - tracemalloc 기준 메모리 피크
+    - (옵션) cProfile 덤프
+
+사용 예:
+    telemetry = RunTelemetry("hybrid", output_path="telemetry.jsonl", date="2026-01-15")
+    with telemetry.phase("solve"):
+        ...
+    telemetry.record_solve(0, "3M", iterations=4, function_calls=5, residual=1e-15, converged=True, forward=0.027)
+    telemetry.finish()
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def write_jsonl(path, record):
+    """레코드 한 건을 JSON 한 줄로 추가 기록"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+class RunTelemetry:
+    """한 번의 부트스트랩 실행(또는 배치의 한 기준일)에 대한 계측 레코드"""
+
+    def __init__(self, run_type, output_path=None, track_memory=True, **context):
+        self.run_type = run_type
+        self.output_path = output_path
+        self.track_memory = track_memory
+        self.context = context
+        self.phases = {}
+        self.instruments = []
+        self.status = "ok"
+        self.error = None
+        self._owns_tracemalloc = False
+        self._start = time.perf_counter()
+        self._started_at = datetime.now().isoformat(timespec='seconds')
+
+        if self.track_memory:
+            # 배치처럼 바깥에서 이미 추적 중이면 피크만 초기화하여 기준일별 피크를 측정
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록의 wall time을 name 단계로 누적 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start)
+
+    def record_solve(self, index, label, iterations, function_calls, residual, converged, forward):
+        self.instruments.append({
+            'index': int(index),
+            'instrument': str(label),
+            'iterations': None if iterations is None else int(iterations),
+            'function_calls': None if function_calls is None else int(function_calls),
+            'residual': float(residual),
+            'converged': bool(converged),
+            'forward': float(forward),
+        })
+
+    def fail(self, error):
+        self.status = "error"
+        self.error = str(error)
+
+    def finish(self):
+        """레코드를 완성하고 output_path가 있으면 JSON 한 줄로 기록"""
+        peak = None
+        if self.track_memory and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+
+        record = {
+            'run_type': self.run_type,
+            'started_at': self._started_at,
+            **self.context,
+            'status': self.status,
+            'error': self.error,
+            'wall_s': time.perf_counter() - self._start,
+            'phases_s': self.phases,
+            'tracemalloc_peak_bytes': peak,
+            'n_instruments': len(self.instruments),
+            'total_iterations': sum(r['iterations'] or 0 for r in self.instruments),
+            'total_function_calls': sum(r['function_calls'] or 0 for r in self.instruments),
+            'max_abs_residual': max((abs(r['residual']) for r in self.instruments), default=None),
+            'unconverged': [r['instrument'] for r in self.instruments if not r['converged']],
+            'instruments': self.instruments,
+        }
+        if self.output_path:
+            write_jsonl(self.output_path, record)
+        return record
+
+
+@contextmanager
+def optional_profile(profile_path):
+    """profile_path가 주어졌을 때만 cProfile로 감싸고 종료 시 .prof 파일로 덤프"""
+    if not profile_path:
+        yield None
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        directory = os.path.dirname(profile_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(profile_path)
+        print(f"cProfile 덤프 저장: {profile_path} (확인: python -m pstats {profile_path})")